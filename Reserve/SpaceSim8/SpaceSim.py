@@ -4,35 +4,52 @@ import pygame
 import numpy as np
 import sounddevice as sd
 import random
+import math  # Scalar trig and roots on hot paths
 import os
 from cytolk import tolk
 import configparser
 import pickle  # For save/load
 import time  # For idle detection
-import threading  # For threaded pitch detection
+import threading  # For threaded pitch detection and background save/load
+import queue  # For the save/load request queue
 import wave  # For writing WAV files
+import itertools  # For spatial grid neighbor offsets
+import functools  # For the rendered-text cache
+import gc  # To keep startup objects out of garbage collection passes
+from collections import defaultdict  # For spatial grid buckets
 
 # Constants for the simulation
 N_DIMENSIONS = 5  # 3 spatial + 2 higher dimensions
 SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600  # Screen dimensions
+SCALE_X, SCALE_Y = SCREEN_WIDTH / 200.0, SCREEN_HEIGHT / 200.0  # Pixels per world unit across the [-100, 100] view
 FPS = 60  # Frames per second
 DT = 1.0 / FPS  # Time delta per frame
 MAX_VELOCITY_BASE = 10.0  # Base maximum velocity, upgradable
 RESONANCE_WIDTH_BASE = 10.0  # Base resonance width in Hz, upgradable
 FREQUENCY_RANGE = (200.0, 800.0)  # Frequency range for drives and targets
+FMIN, FMAX = FREQUENCY_RANGE  # Unpacked bounds for clamping
 SAMPLE_RATE = 44100  # Audio sample rate
 PHI = (1 + np.sqrt(5)) / 2  # Golden ratio constant
+TWO_PI = 2 * np.pi  # Radians per cycle, for the audio hot path
 N_STARS = 200  # Number of stars in the universe
 N_PLANETS_PER_STAR = 3  # Planets per star
 N_NEBULAE = 10  # Number of nebulae
 ORBIT_RADIUS = 5.0  # Radius for planet orbits around stars
 PLANET_RADIUS = 10.0  # Visual radius for planets
+SPIRAL_THETA_MAX = 6 * np.pi  # Three turns of the ship's golden spiral
+SPIRAL_A = 20 / (PHI ** (2 * SPIRAL_THETA_MAX / np.pi))  # Spiral scale so the outer turn reaches radius 20
+SPIRAL_THETA = np.linspace(0, SPIRAL_THETA_MAX, 100)  # Spiral sample angles
+SPIRAL_R = SPIRAL_A * PHI ** (2 * SPIRAL_THETA / np.pi)  # Spiral radius at each sample
+ENGINE_THETA = SPIRAL_THETA_MAX - np.arange(3) * (np.pi / PHI)  # Engine points along the outer turn
+ENGINE_R = SPIRAL_A * PHI ** (2 * ENGINE_THETA / np.pi)  # Spiral radius at each engine
 INTERACTION_DISTANCE = 15.0  # Distance for dimensional interactions
 N_FIBONACCI = 8  # Fibonacci sequence length for generation
 FIB_SEQ = [0, 1]  # Initialize Fibonacci sequence
 for _ in range(N_FIBONACCI - 2):
     FIB_SEQ.append(FIB_SEQ[-1] + FIB_SEQ[-2])  # Generate Fibonacci sequence
 SCALE_FACTOR = 100.0 / FIB_SEQ[-1]  # Scaling for positioning
+FIB_ARRAY = np.array(FIB_SEQ, dtype=float)  # Fibonacci sequence for vectorized indexing
+PHI_POWERS = PHI ** np.arange(N_DIMENSIONS)  # PHI**d influence weight per dimension
 SPEECH_COOLDOWN = 0.5  # Cooldown between speech messages in seconds
 VIEW_LANDMARK_THRESHOLD = 10.0  # Degrees threshold for audible landmarks
 ROTATION_SOUND_DURATION = 0.2  # Duration of rotation whoosh sound
@@ -85,6 +102,43 @@ WATER_BLESSING_FREQ = 432.0  # Frequency for gift.wav
 WATER_BLESSING_DURATION = 60.0  # Duration of gift.wav in seconds
 SING_SILENCE_THRESHOLD = 4.0  # Seconds of silence in sing mode to trigger heartbeat
 HEARTBEAT_VOLUME = 0.1  # Low volume for heartbeat pulse
+# HUD line templates (bound str.format) and fixed lines, built once for update_hud_items
+HUD_SELECTED_DIM = "Selected Dim: {}".format
+HUD_DRIVE_FREQ = "Drive Freq: {:.2f} Hz".format
+HUD_TARGET_FREQ = "Target Freq: {:.2f} Hz".format
+HUD_RESONANCE = "Resonance: {:.2f}".format
+HUD_SPEED = "Speed: {:.2f} u/s".format
+HUD_VOLUME = "Vol: {}%".format
+HUD_INTEGRITY = "Integrity: {:.2f}".format
+HUD_CRYSTALS = "Crystals: {}".format
+HUD_POWER = "Power: {:.2f}".format
+HUD_VERBOSITY = "Verbosity: {}".format
+HUD_ROTATION = "Rotation: {:.2f}".format
+HUD_CURSOR_POS = "Cursor Pos: {}".format
+HUD_CRYSTALS_LEFT = "Crystals Left: {}".format
+HUD_STATUS_LINES = ("Status: In Flight", "Status: Landed")  # Indexed by landed_mode
+HUD_TUNING_MODE_LINES = ("Tuning Mode: Manual (higher dims only)", "Tuning Mode: Resonance (all dims)")  # Indexed by tuning_mode
+HUD_SING_MODE_LINES = ("Sing Mode: Off", "Sing Mode: On")  # Indexed by sing_mode
+HUD_SPEED_MODE_LINES = [f"Speed Mode: {name}" for name in SPEED_MODE_NAMES]  # Indexed by speed_mode
+
+# High-verbosity periodic status readout, formatted by speak_lazy
+VERBOSE_HUD_STATUS = ("Selected Dim: {}. Drive Freq: {:.2f} Hz. Target Freq: {:.2f} Hz. Resonance: {:.2f}. Speed: {:.2f} u/s. "
+                      "Volume: {} percent. Integrity: {:.2f}. Crystals: {}. Status: {}.")
+# Per-dimension resonance change alert, formatted by speak_lazy with a cooldown per dimension
+RESONANCE_ALERT = "Alert: Resonance in dim {} now {:.2f}."
+
+# Spoken compass direction keyed by (sign(dy), sign(dx)) on the planet grid
+COMPASS_DIRECTIONS = {
+    (1, 1): "north east", (1, 0): "north", (1, -1): "north west",
+    (0, 1): "east", (0, 0): "", (0, -1): "west",
+    (-1, 1): "south east", (-1, 0): "south", (-1, -1): "south west",
+}
+VOLUME_STEP = 0.01  # Volume change per =/- press
+SAVE_FILE = 'savegame5.pkl'  # SAVE_MAGIC, pickle header, pickle payload, then raw out-of-band array buffers
+SAVE_MAGIC = b'SPACESIM5\n'  # Marks the out-of-band format; anything else is read as a plain pickled dict
+LEGACY_SAVE_FILE = 'savegame.pkl'  # Plain pickled dict with body lists (older SpaceSim.py saves, modular ship.py)
+# Volume globals adjusted by =/-, in modifier priority order (Alt, Shift, Ctrl, none) with spoken labels
+VOLUME_CONTROLS = [('drive_volume', 'Drive'), ('beep_volume', 'Beep'), ('effect_volume', 'Effect'), ('master_volume', 'Master')]
 SCHUMANN_FREQ = 7.83  # Schumann resonance frequency
 SCHUMANN_VOLUME = 0.01  # -40 dB equivalent
 
@@ -173,16 +227,42 @@ screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Golden Spiral Spaceship Simulator")
 clock = pygame.time.Clock()
 font = pygame.font.SysFont(None, HUD_TEXT_SIZE_BASE)
+# Window events after which the screen must be redrawn even if no game state changed (uncovered, restored)
+REDRAW_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED)
+# Only keyboard, quit and redraw events are handled, so keep everything else (mouse motion, joystick) off the queue
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, *REDRAW_EVENTS])
+
+# RGBA color for each whole-degree hue at a fixed saturation/value/alpha, so body drawing skips per-body HSV conversion
+def hsva_lut(saturation, value, alpha):
+    lut = []
+    for hue in range(360):
+        color = pygame.Color(0)
+        color.hsva = (hue, saturation, value, alpha)
+        lut.append(tuple(color))
+    return lut
+
+HUE_LUT = hsva_lut(100, 100, 100)  # Stars and planets
+NEBULA_HUE_LUT = hsva_lut(50, 100, 50)  # Nebulae: paler and translucent
+HIGH_CONTRAST_BODY_COLOR = (0, 0, 0, 255)  # hsva (0, 0, 0, 100)
+HIGH_CONTRAST_NEBULA_COLOR = (0, 0, 0, 127)  # hsva (0, 0, 0, 50)
 
 # SoundEffect class for audio effects with pan, pitch, loop, and volume
 class SoundEffect:
     def __init__(self, waveform, pan=0.0, pitch=1.0, loop=False, volume=1.0):
         # Initialize sound effect with waveform, panning, pitch adjustment, looping, and volume
-        self.waveform = waveform * pitch  # Apply pitch to waveform
+        self.waveform = waveform  # Shared source buffer, never copied or scaled per sound
+        self.pitch = pitch  # Playback rate multiplier, applied by the mixer when stepping through the waveform
         self.position = 0  # Current playback position
-        self.pan = pan  # Stereo panning (-1 left to 1 right)
         self.loop = loop  # Whether to loop the sound
+        self.set_pan_volume(pan, volume)
+
+    # Set panning and volume together, refreshing the equal-power channel gains the mixer reads
+    def set_pan_volume(self, pan, volume):
+        self.pan = pan  # Stereo panning (-1 left to 1 right)
         self.volume = volume  # Volume multiplier
+        self.left_gain = math.sqrt((1 - pan) / 2) * volume
+        self.right_gain = math.sqrt((1 + pan) / 2) * volume
 
 # Ship class managing state and logic
 class Ship:
@@ -192,9 +272,9 @@ class Ship:
         self.velocity = np.zeros(N_DIMENSIONS)  # Ship velocity in all dimensions
         self.heading = 0.0  # Ship heading (unused for now)
         # Drive and target frequencies
-        self.r_drive = [random.uniform(*FREQUENCY_RANGE) for _ in range(N_DIMENSIONS)]  # Drive frequencies
-        self.base_f_target = [random.uniform(*FREQUENCY_RANGE) for _ in range(N_DIMENSIONS)]  # Base target frequencies
-        self.f_target = self.base_f_target[:]  # Current target frequencies
+        self.r_drive = np.random.uniform(*FREQUENCY_RANGE, N_DIMENSIONS)  # Drive frequencies
+        self.base_f_target = np.random.uniform(*FREQUENCY_RANGE, N_DIMENSIONS)  # Base target frequencies
+        self.f_target = self.base_f_target.copy()  # Current target frequencies
         # Tuning and mode flags
         self.selected_dim = 0  # Currently selected dimension for tuning
         self.tuning_mode = False  # False: manual mode (only higher dims tunable), True: resonance tuning mode (all dims)
@@ -220,6 +300,11 @@ class Ship:
         # Power and dissonance management
         self.resonance_power = np.zeros(N_DIMENSIONS)  # Power buildup per dimension
         self.dissonance_timer = 0.0  # Timer for dissonance buildup
+        # Per-frame summary stats, refreshed once per frame by refresh_frame_stats()
+        self.avg_resonance = 0.0  # Mean of resonance_levels
+        self.current_speed = 0.0  # Norm of velocity
+        self.avg_power = 0.0  # Mean of resonance_power
+        self.power_chord_active = False  # Any dimension near full power while flying (read by the audio callback)
         # User interface settings
         self.verbose_mode = config.getint('Settings', 'verbose_mode', fallback=1)  # Verbosity level (0 low, 1 medium, 2 high)
         self.hud_text_size = config.getint('Settings', 'hud_text_size', fallback=HUD_TEXT_SIZE_BASE)  # Current HUD text size
@@ -240,12 +325,14 @@ class Ship:
         self.verbose_toggled = False  # Flag to debounce verbosity toggle
         self.contrast_toggled = False  # Flag to debounce contrast toggle
         self.text_size_adjusted = False  # Flag to debounce text size adjustment
+        self.font_cache = {}  # HUD fonts keyed by text size, so resizing never rescans system fonts twice
         self.instructions_opened = False  # Flag to debounce instructions open
         self.tuning_mode_toggled = False  # Flag to debounce tuning mode toggle
         # HUD dialog
         self.hud_mode = False  # HUD mode flag
         self.hud_index = 0  # Current HUD item index
         self.hud_items = []  # List of HUD items
+        self.status_cache = (None, "")  # (state key, text) of the last full status readout
         # Planet exploration
         self.cursor_pos = np.array([0, 0])  # Cursor position on planet grid
         self.crystal_positions = []  # Crystal positions on planet
@@ -267,8 +354,9 @@ class Ship:
         # Starmap
         self.starmap_mode = False  # Starmap mode flag
         self.starmap_index = 0  # Current starmap item index
-        self.starmap_items = []  # List of starmap items (now dicts: {'label': str, 'pos': array, 'type': str})
+        self.starmap_items = []  # List of starmap items (now dicts: {'label': str, 'pos': array, 'type': str, 'rift': dict, 'body_idx': int})
         self.locked_target = None  # Locked target position
+        self.locked_body_idx = None  # Row of the locked body in celestial_bodies/body_positions (None for rifts)
         self.lock_sound = None  # Lock sound effect
         self.locked_is_rift = False  # Flag if locked target is rift
         # Rift selection
@@ -283,6 +371,7 @@ class Ship:
         self.pitch = 0.0  # Ship pitch orientation (optional)
         self.speed_mode = 2  # Speed mode: 0 - Approach, 1 - Cruise, 2 - Quantum
         self.speed_mode_toggled = False  # Flag to debounce speed mode toggle
+        self.desired_vel = np.zeros(3)  # Reused manual-navigation velocity request (x, y, z)
         # Rift charge and guidance
         self.rift_charge_timer = 0.0  # Timer for rift charge sequence
         self.last_guidance_time = 0.0  # Last time guidance speech was given
@@ -296,20 +385,32 @@ class Ship:
         # New: Sing mode
         self.sing_mode = False
         self.sing_toggled = False
-        self.sing_active = False  # Flag for thread
+        self.sing_active = threading.Event()  # Set while the pitch worker should listen
         self.detected_pitch = None
-        self.pitch_thread = None
+        # Long-lived pitch worker: sleeps on sing_active instead of being respawned per toggle
+        self.pitch_thread = threading.Thread(target=self.continuous_pitch_detection, daemon=True)
+        self.pitch_thread.start()
         self.last_detected_rhythm = 60.0  # Default heartbeat BPM
+        self.heartbeat_sound = None  # Looping heartbeat pulse, if one has been started
         self.last_sing_time = 0.0  # Last time pitch was detected
         # New: Idle mode
         self.last_input_time = time.time()
         self.idle_mode = False
+        self.idle_chord_sound = None  # Evolving chord started by idle mode
         # New: Biome sound
         self.biome_sound = None
         # New: Water blessing
         self.spacebar_hold_timer = 0.0
         self.spacebar_pressed = False
 
+    # Get HUD font for a text size, building it only on first use
+    def get_font(self, size):
+        cached = self.font_cache.get(size)
+        if cached is None:
+            cached = pygame.font.SysFont(None, size)
+            self.font_cache[size] = cached
+        return cached
+
     # Upgrade function for resonance width
     def upgrade_width(self):
         # Increase resonance width by a golden ratio increment
@@ -328,8 +429,7 @@ class Ship:
     # Auto-tune helper upgrade
     def auto_tune(self):
         # Subtly adjust drive frequencies towards targets
-        for i in range(N_DIMENSIONS):
-            self.r_drive[i] += (self.f_target[i] - self.r_drive[i]) * 0.1
+        self.r_drive += (self.f_target - self.r_drive) * 0.1
 
     # Upgrade for crystal count bonus
     def upgrade_crystal_count(self):
@@ -365,19 +465,21 @@ class Ship:
         self.approaching_lock_announced = False  # Reset flag
         # New: Play biome sound
         if self.biome_sound:
-            if self.biome_sound in active_sound_effects:
-                active_sound_effects.remove(self.biome_sound)
+            stop_sound_effect(self.biome_sound)
         if self.planet_biome == 'harmonic':
             self.biome_sound = SoundEffect(chord_waveform, loop=True, volume=effect_volume * 0.5)
         else:
             self.biome_sound = SoundEffect(dissonant_waveform, loop=True, volume=effect_volume * 0.5)
-        active_sound_effects.append(self.biome_sound)
+        play_sound_effect(self.biome_sound)
 
     # New: Continuous pitch detection in thread
     def continuous_pitch_detection(self):
-        while self.sing_active:
+        while True:
+            self.sing_active.wait()  # Idle until sing mode is switched on
             pitch = self.detect_pitch()
-            if pitch and FREQUENCY_RANGE[0] <= pitch <= FREQUENCY_RANGE[1]:
+            if not self.sing_active.is_set():
+                continue  # Sing mode was switched off mid-recording; discard the take
+            if pitch and FMIN <= pitch <= FMAX:
                 self.r_drive[self.selected_dim] = pitch
                 speak_with_cooldown(f"Tuned to hummed pitch {pitch:.2f} Hz.")
                 self.last_sing_time = time.time()
@@ -483,6 +585,8 @@ class Ship:
         shift_pressed = keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]
         ctrl_pressed = keys[pygame.K_LCTRL] or keys[pygame.K_RCTRL]
         alt_pressed = keys[pygame.K_LALT] or keys[pygame.K_RALT]
+        # Cursor motion is summed over the frame's events and applied once afterwards
+        cursor_dx = cursor_dy = 0
         # Process key down events
         for event in events:
             if event.type == pygame.KEYDOWN:
@@ -524,7 +628,7 @@ class Ship:
                     speak_with_cooldown(quick)
                 # Initiate landing
                 elif event.key == pygame.K_l and not self.landed_mode:
-                    avg_res = np.mean(self.resonance_levels)
+                    avg_res = self.avg_resonance
                     if self.near_object and avg_res > LANDING_THRESHOLD and self.nearest_body and self.nearest_body['type'] == 'planet':
                         self.landing_timer = LANDING_TIME
                         speak_with_cooldown("Initiating landing sequence.")
@@ -541,14 +645,12 @@ class Ship:
                     self.landed_mode = False
                     self.landed_planet = None
                     if self.biome_sound:
-                        if self.biome_sound in active_sound_effects:
-                            active_sound_effects.remove(self.biome_sound)
+                        stop_sound_effect(self.biome_sound)
                         self.biome_sound = None
                     speak_with_cooldown("Taking off from planet.")
                 # Read full status
                 elif event.key == pygame.K_r:
-                    status = f"Position: {self.position.round(2)}. Velocity: {self.velocity.round(2)}. Resonance levels: {self.resonance_levels.round(2)}. View rotation: {self.view_rotation:.2f} radians. {'Landed on planet.' if self.landed_mode else 'In space.'} Integrity: {self.resonance_integrity:.2f}. Crystals: {self.crystals_collected}. Power levels: {self.resonance_power.round(2)}."
-                    speak_with_cooldown(status)
+                    speak_with_cooldown(self.get_status_text())
                 # Toggle HUD or upgrade menu
                 elif event.key == pygame.K_u:
                     if self.landed_mode and len(self.locked_crystals) == self.crystal_count:
@@ -569,24 +671,24 @@ class Ship:
                 elif event.key == pygame.K_EQUALS and self.text_size_adjusted:
                     self.hud_text_size += 2
                     self.hud_text_size = max(12, min(48, self.hud_text_size))
-                    font = pygame.font.SysFont(None, self.hud_text_size)
+                    font = self.get_font(self.hud_text_size)
                     speak_with_cooldown(f"Text size increased to {self.hud_text_size}.")
                 # Decrease text size
                 elif event.key == pygame.K_MINUS and self.text_size_adjusted:
                     self.hud_text_size -= 2
                     self.hud_text_size = max(12, min(48, self.hud_text_size))
-                    font = pygame.font.SysFont(None, self.hud_text_size)
+                    font = self.get_font(self.hud_text_size)
                     speak_with_cooldown(f"Text size decreased to {self.hud_text_size}.")
                 # Open instructions (README.md)
                 elif event.key == pygame.K_F1 and not self.instructions_opened:
-                    os.startfile('README.md')
+                    threading.Thread(target=os.startfile, args=('README.md',), daemon=True).start()  # Shell hand-off can block
                     speak_with_cooldown("Documentation opened.")
                     self.instructions_opened = True
                 # Rift interaction: Charge/entry or toggle selection
                 elif event.key == pygame.K_e and not self.landed_mode:
                     if self.locked_is_rift and self.locked_target is not None:
                         dist = np.linalg.norm(self.position - self.locked_target)
-                        avg_res = np.mean(self.resonance_levels)
+                        avg_res = self.avg_resonance
                         if dist < RIFT_ALIGNMENT_TOLERANCE and avg_res > RIFT_ENTRY_RES_THRESHOLD:
                             # New: Skip charge if perfect
                             if self.locked_rift:
@@ -613,12 +715,11 @@ class Ship:
                 # New: Toggle sing mode
                 elif event.key == pygame.K_h and not self.sing_toggled:
                     self.sing_mode = not self.sing_mode
-                    self.sing_active = self.sing_mode
-                    speak_with_cooldown(f"Sing mode {'activated' if self.sing_mode else 'deactivated'}.")
                     if self.sing_mode:
-                        if self.pitch_thread is None or not self.pitch_thread.is_alive():
-                            self.pitch_thread = threading.Thread(target=self.continuous_pitch_detection, daemon=True)
-                            self.pitch_thread.start()
+                        self.sing_active.set()
+                    else:
+                        self.sing_active.clear()
+                    speak_with_cooldown(f"Sing mode {'activated' if self.sing_mode else 'deactivated'}.")
                     self.sing_toggled = True
                 # New: Save/load
                 elif event.key == pygame.K_s and ctrl_pressed:
@@ -637,52 +738,20 @@ class Ship:
                         self.approaching_lock_announced = False  # Reset on scan
                     if event.key == pygame.K_x:
                         self.collect_crystal()
-                    moved = False
                     if event.key == pygame.K_w:
-                        self.cursor_pos[1] += 1
-                        moved = True
+                        cursor_dy += 1
                     if event.key == pygame.K_s:
-                        self.cursor_pos[1] -= 1
-                        moved = True
+                        cursor_dy -= 1
                     if event.key == pygame.K_a:
-                        self.cursor_pos[0] -= 1
-                        moved = True
+                        cursor_dx -= 1
                     if event.key == pygame.K_d:
-                        self.cursor_pos[0] += 1
-                        moved = True
-                    if moved:
-                        self.cursor_pos = np.clip(self.cursor_pos, -GRID_SIZE, GRID_SIZE)
-                        if simulation_time - self.last_cursor_speak_time > CURSOR_SPEECH_COOLDOWN:
-                            speak_with_cooldown(f"Cursor at {self.cursor_pos.round(2)}.")
-                            self.last_cursor_speak_time = simulation_time
+                        cursor_dx += 1
 
                 # Volume controls
                 if event.key == pygame.K_EQUALS:
-                    if alt_pressed:
-                        drive_volume = min(1.0, drive_volume + 0.01)
-                        speak_with_cooldown(f"Drive volume at {int(drive_volume * 100)} percent.")
-                    elif shift_pressed:
-                        beep_volume = min(1.0, beep_volume + 0.01)
-                        speak_with_cooldown(f"Beep volume at {int(beep_volume * 100)} percent.")
-                    elif ctrl_pressed:
-                        effect_volume = min(1.0, effect_volume + 0.01)
-                        speak_with_cooldown(f"Effect volume at {int(effect_volume * 100)} percent.")
-                    else:
-                        master_volume = min(1.0, master_volume + 0.01)
-                        speak_with_cooldown(f"Master volume at {int(master_volume * 100)} percent.")
+                    self.adjust_volume(VOLUME_STEP, (alt_pressed, shift_pressed, ctrl_pressed))
                 if event.key == pygame.K_MINUS:
-                    if alt_pressed:
-                        drive_volume = max(0.0, drive_volume - 0.01)
-                        speak_with_cooldown(f"Drive volume at {int(drive_volume * 100)} percent.")
-                    elif shift_pressed:
-                        beep_volume = max(0.0, beep_volume - 0.01)
-                        speak_with_cooldown(f"Beep volume at {int(beep_volume * 100)} percent.")
-                    elif ctrl_pressed:
-                        effect_volume = max(0.0, effect_volume - 0.01)
-                        speak_with_cooldown(f"Effect volume at {int(effect_volume * 100)} percent.")
-                    else:
-                        master_volume = max(0.0, master_volume - 0.01)
-                        speak_with_cooldown(f"Master volume at {int(master_volume * 100)} percent.")
+                    self.adjust_volume(-VOLUME_STEP, (alt_pressed, shift_pressed, ctrl_pressed))
 
                 # New: Water blessing mode - start timer on spacebar press
                 if event.key == pygame.K_SPACE:
@@ -703,10 +772,19 @@ class Ship:
                     self.spacebar_pressed = False
                     self.spacebar_hold_timer = 0.0
 
+        # Apply the frame's accumulated cursor motion with a single clip and at most one announcement
+        if cursor_dx or cursor_dy:
+            self.cursor_pos[0] += cursor_dx
+            self.cursor_pos[1] += cursor_dy
+            np.clip(self.cursor_pos, -GRID_SIZE, GRID_SIZE, out=self.cursor_pos)
+            if simulation_time - self.last_cursor_speak_time > CURSOR_SPEECH_COOLDOWN:
+                speak_with_cooldown(f"Cursor at {self.cursor_pos.round(2)}.")
+                self.last_cursor_speak_time = simulation_time
+
         # New: Update water blessing timer if held
         if self.spacebar_pressed:
             self.spacebar_hold_timer += DT
-            if self.spacebar_hold_timer >= WATER_BLESSING_HOLD_TIME and all(r > WATER_BLESSING_RES_THRESHOLD for r in self.resonance_levels):
+            if self.spacebar_hold_timer >= WATER_BLESSING_HOLD_TIME and self.resonance_levels.min() > WATER_BLESSING_RES_THRESHOLD:
                 self.generate_gift_wav()
                 self.spacebar_pressed = False  # Prevent repeat
                 self.spacebar_hold_timer = 0.0
@@ -725,10 +803,10 @@ class Ship:
                     rate = max(1.0, min(TUNING_RATE_PLANET, rate))
                     if delta < APPROACHING_LOCK_THRESHOLD:
                         if not self.approaching_lock_announced:
-                            active_sound_effects.append(SoundEffect(approaching_beep_waveform, pan=0.0, volume=beep_volume))
+                            play_sound_effect(SoundEffect(approaching_beep_waveform, pan=0.0, volume=beep_volume))
                             self.approaching_lock_announced = True
                         if simulation_time - self.last_approaching_beep_time > 1.0:  # Play mid beeps every second while approaching
-                            active_sound_effects.append(SoundEffect(approaching_beep_waveform, pan=0.0, volume=beep_volume))
+                            play_sound_effect(SoundEffect(approaching_beep_waveform, pan=0.0, volume=beep_volume))
                             self.last_approaching_beep_time = simulation_time
                     elif delta > 15.0:
                         self.approaching_lock_announced = False
@@ -740,10 +818,10 @@ class Ship:
         if allow_tuning:
             if keys[pygame.K_UP]:
                 self.r_drive[self.selected_dim] += rate * DT
-                self.r_drive[self.selected_dim] = min(self.r_drive[self.selected_dim], FREQUENCY_RANGE[1])
+                self.r_drive[self.selected_dim] = min(self.r_drive[self.selected_dim], FMAX)
             if keys[pygame.K_DOWN]:
                 self.r_drive[self.selected_dim] -= rate * DT
-                self.r_drive[self.selected_dim] = max(self.r_drive[self.selected_dim], FREQUENCY_RANGE[0])
+                self.r_drive[self.selected_dim] = max(self.r_drive[self.selected_dim], FMIN)
         else:
             if keys[pygame.K_UP] or keys[pygame.K_DOWN]:
                 speak_with_cooldown("Spatial dimension tuning locked in manual mode. Toggle with J for full access.")
@@ -765,13 +843,14 @@ class Ship:
         # Play rotation sound repeatedly while rotating
         if (self.rotating_left or self.rotating_right) and simulation_time - self.last_rotation_sound_time > ROTATION_SOUND_DURATION:
             pan = -1.0 if self.rotating_left else 1.0
-            active_sound_effects.append(SoundEffect(rotation_waveform, pan=pan, volume=effect_volume))
+            play_sound_effect(SoundEffect(rotation_waveform, pan=pan, volume=effect_volume))
             self.last_rotation_sound_time = simulation_time
 
         # Manual navigation in manual mode
         if not self.tuning_mode:
             # Direct manual navigation using r_drive offsets for spatial dims
-            desired_vel = np.zeros(3)  # Only spatial dims: x(0), y(1), z(2)
+            desired_vel = self.desired_vel  # Only spatial dims: x(0), y(1), z(2)
+            desired_vel.fill(0.0)
             thrust = self.max_velocity * SPEED_FACTORS[self.speed_mode]  # Adjust thrust based on speed mode
             if keys[pygame.K_w]:
                 desired_vel[1] += thrust  # Forward +y
@@ -786,17 +865,25 @@ class Ship:
             if keys[pygame.K_PAGEUP]:
                 desired_vel[2] -= thrust  # Descent -z
 
-            # Apply offsets to r_drive for each spatial dim
-            for i in range(3):  # Dims 0,1,2
-                if desired_vel[i] != 0:
-                    target_res = min(0.999, abs(desired_vel[i]) / self.max_velocity)  # Approach 1 but avoid exact 1 (vel=0 issue)
-                    if target_res > 0:
-                        d_over_w = np.sqrt(1 / target_res - 1)
-                        delta = self.resonance_width * d_over_w
-                        delta_f = np.sign(desired_vel[i]) * delta
-                        self.r_drive[i] = self.f_target[i] + delta_f
-                else:
-                    self.r_drive[i] = self.f_target[i]  # Reset to stop
+            if desired_vel.any():
+                # Apply offsets to r_drive for all spatial dims in one pass (dims 0,1,2)
+                target_res = np.minimum(0.999, np.abs(desired_vel) / self.max_velocity)  # Approach 1 but avoid exact 1 (vel=0 issue)
+                target_res[desired_vel == 0] = 1.0  # Idle lanes get zero offset (sign is 0 too), i.e. reset to stop
+                d_over_w = np.sqrt(1 / target_res - 1)
+                delta_f = np.sign(desired_vel) * (self.resonance_width * d_over_w)
+                self.r_drive[:3] = self.f_target[:3] + delta_f
+            else:
+                # No movement keys held: drives sit on target, skipping the per-dim offsets
+                self.r_drive[:3] = self.f_target[:3]  # Reset to stop
+
+    # Step the volume picked by the held modifiers (see VOLUME_CONTROLS) and announce it
+    def adjust_volume(self, step, modifiers):
+        for (name, label), pressed in zip(VOLUME_CONTROLS, modifiers + (True,)):
+            if pressed:
+                break
+        level = max(0.0, min(1.0, globals()[name] + step))
+        globals()[name] = level
+        speak_with_cooldown(f"{label} volume at {int(level * 100)} percent.")
 
     # New: Generate gift.wav
     def generate_gift_wav(self):
@@ -809,30 +896,48 @@ class Ship:
             wav_file.setframerate(SAMPLE_RATE)
             wav_file.writeframes(signal.tobytes())
 
+    # Full status readout for R, re-formatted only when the underlying state has changed
+    def get_status_text(self):
+        key = (self.position.tobytes(), self.velocity.tobytes(), self.resonance_levels.tobytes(), self.resonance_power.tobytes(),
+               self.view_rotation, self.landed_mode, self.resonance_integrity, self.crystals_collected)
+        if key != self.status_cache[0]:
+            status = f"Position: {self.position.round(2)}. Velocity: {self.velocity.round(2)}. Resonance levels: {self.resonance_levels.round(2)}. View rotation: {self.view_rotation:.2f} radians. {'Landed on planet.' if self.landed_mode else 'In space.'} Integrity: {self.resonance_integrity:.2f}. Crystals: {self.crystals_collected}. Power levels: {self.resonance_power.round(2)}."
+            self.status_cache = (key, status)
+        return self.status_cache[1]
+
+    # Compute summary stats shared by input handling, HUD and audio cues once per frame
+    def refresh_frame_stats(self):
+        # Stored as Python floats so formatting skips the ndarray scalar path
+        self.avg_resonance = float(self.resonance_levels.mean())
+        self.current_speed = float(np.linalg.norm(self.velocity))
+        self.avg_power = float(self.resonance_power.mean())
+        self.power_chord_active = not self.landed_mode and bool((self.resonance_power > POWER_BUILD_TIME - 1).any())
+
     # Update HUD items list
     def update_hud_items(self, upgrade=False):
         # Populate HUD items based on upgrade mode or standard status
         if upgrade:
             self.hud_items = [f"{u['name']}: {u['desc']} Cost: {u['cost']}" for u in self.upgrades]
         else:
+            dim = self.selected_dim
             self.hud_items = [
-                f"Selected Dim: {self.selected_dim + 1}",
-                f"Drive Freq: {self.r_drive[self.selected_dim]:.2f} Hz",
-                f"Target Freq: {self.f_target[self.selected_dim]:.2f} Hz",
-                f"Resonance: {self.resonance_levels[self.selected_dim]:.2f}",
-                f"Speed: {np.linalg.norm(self.velocity):.2f} u/s",
-                f"Vol: {int(master_volume * 100)}%",
-                f"Integrity: {self.resonance_integrity:.2f}",
-                f"Crystals: {self.crystals_collected}",
-                f"Status: {'Landed' if self.landed_mode else 'In Flight'}",
-                f"Power: {np.mean(self.resonance_power):.2f}",
-                f"Verbosity: {self.verbose_mode}",
-                f"Rotation: {self.view_rotation:.2f}",
-                f"Tuning Mode: {'Resonance (all dims)' if self.tuning_mode else 'Manual (higher dims only)'}",
-                f"Speed Mode: {SPEED_MODE_NAMES[self.speed_mode]}" if not self.tuning_mode else ""
+                HUD_SELECTED_DIM(dim + 1),
+                HUD_DRIVE_FREQ(self.r_drive[dim]),
+                HUD_TARGET_FREQ(self.f_target[dim]),
+                HUD_RESONANCE(self.resonance_levels[dim]),
+                HUD_SPEED(self.current_speed),
+                HUD_VOLUME(int(master_volume * 100)),
+                HUD_INTEGRITY(self.resonance_integrity),
+                HUD_CRYSTALS(self.crystals_collected),
+                HUD_STATUS_LINES[self.landed_mode],
+                HUD_POWER(self.avg_power),
+                HUD_VERBOSITY(self.verbose_mode),
+                HUD_ROTATION(self.view_rotation),
+                HUD_TUNING_MODE_LINES[self.tuning_mode],
+                "" if self.tuning_mode else HUD_SPEED_MODE_LINES[self.speed_mode]
             ]
             if self.landed_mode:
-                self.hud_items += [f"Cursor Pos: {self.cursor_pos.round(2)}", f"Crystals Left: {self.crystal_count - len(self.locked_crystals)}", f"Sing Mode: {'On' if self.sing_mode else 'Off'}"]
+                self.hud_items += [HUD_CURSOR_POS(self.cursor_pos.round(2)), HUD_CRYSTALS_LEFT(self.crystal_count - len(self.locked_crystals)), HUD_SING_MODE_LINES[self.sing_mode]]
 
     # Speak current HUD item
     def speak_hud_item(self):
@@ -847,47 +952,45 @@ class Ship:
         # Populate starmap with nearby bodies and rifts, sorted by distance
         self.starmap_items = []
         if self.locked_target is not None and not self.locked_is_rift:
-            self.starmap_items.append({'label': "Unlock target", 'pos': None, 'type': None, 'rift': None})
-        # Collect items with distances
+            self.starmap_items.append({'label': "Unlock target", 'pos': None, 'type': None, 'rift': None, 'body_idx': None})
+        # Collect items with distances (one batched scan per body category)
+        # body_idx is the row in celestial_bodies: stars, then planets, then nebulae
         items = []
         # Add stars
-        for i, body in enumerate(stars):
-            dist = np.linalg.norm(self.position - body['pos'])
-            if dist < SCANNER_RANGE:
-                projected_pos = project_to_2d(body['pos'] - self.position, self.view_rotation)
-                angle = np.arctan2(projected_pos[1], projected_pos[0]) * 180 / np.pi
-                label = f"Star {i+1} at dist {dist:.1f}, angle {angle:.1f} degrees (unlandable)"
-                items.append((dist, label, body['pos'], 'star', None))
+        for i, dist, angle in zip(*self.scan_positions(star_positions, star_grid)):
+            label = f"Star {i+1} at dist {dist:.1f}, angle {angle:.1f} degrees (unlandable)"
+            items.append((dist, label, stars[i]['pos'], 'star', None, i))
         # Add planets
-        for i, body in enumerate(planets):
-            dist = np.linalg.norm(self.position - body['pos'])
-            if dist < SCANNER_RANGE:
-                projected_pos = project_to_2d(body['pos'] - self.position, self.view_rotation)
-                angle = np.arctan2(projected_pos[1], projected_pos[0]) * 180 / np.pi
-                label = f"Planet {i+1} at dist {dist:.1f}, angle {angle:.1f} degrees"
-                items.append((dist, label, body['pos'], 'planet', None))
+        for i, dist, angle in zip(*self.scan_positions(planet_positions, planet_grid)):
+            label = f"Planet {i+1} at dist {dist:.1f}, angle {angle:.1f} degrees"
+            items.append((dist, label, planets[i]['pos'], 'planet', None, len(stars) + i))
         # Add nebulae
-        for i, body in enumerate(nebulae):
-            dist = np.linalg.norm(self.position - body['pos'])
-            if dist < SCANNER_RANGE:
-                projected_pos = project_to_2d(body['pos'] - self.position, self.view_rotation)
-                angle = np.arctan2(projected_pos[1], projected_pos[0]) * 180 / np.pi
-                label = f"Nebula {i+1} at dist {dist:.1f}, angle {angle:.1f} degrees (unlandable)"
-                items.append((dist, label, body['pos'], 'nebula', None))
-        # Add rifts
-        for i, rift in enumerate(self.rifts):
-            dist = np.linalg.norm(self.position - rift['pos'])
-            if dist < SCANNER_RANGE:
-                projected_pos = project_to_2d(rift['pos'] - self.position, self.view_rotation)
-                angle = np.arctan2(projected_pos[1], projected_pos[0]) * 180 / np.pi
-                label = f"Rift {i+1} ({rift['type']}) at dist {dist:.1f}, angle {angle:.1f} degrees"
-                items.append((dist, label, rift['pos'], 'rift', rift))
+        for i, dist, angle in zip(*self.scan_positions(nebula_positions, nebula_grid)):
+            label = f"Nebula {i+1} at dist {dist:.1f}, angle {angle:.1f} degrees (unlandable)"
+            items.append((dist, label, nebulae[i]['pos'], 'nebula', None, len(stars) + len(planets) + i))
+        # Add rifts (they spawn and fade every frame, so stack them fresh on each scan)
+        for i, dist, angle in zip(*self.scan_positions(stack_positions(self.rifts))):
+            rift = self.rifts[i]
+            label = f"Rift {i+1} ({rift['type']}) at dist {dist:.1f}, angle {angle:.1f} degrees"
+            items.append((dist, label, rift['pos'], 'rift', rift, None))
         # Sort by distance
         items.sort(key=lambda x: x[0])
-        for dist, label, pos, body_type, rift in items:
-            self.starmap_items.append({'label': label, 'pos': pos, 'type': body_type, 'rift': rift})
+        for dist, label, pos, body_type, rift, body_idx in items:
+            self.starmap_items.append({'label': label, 'pos': pos, 'type': body_type, 'rift': rift, 'body_idx': body_idx})
         if not self.starmap_items:
-            self.starmap_items.append({'label': "No objects in scanner range.", 'pos': None, 'type': None, 'rift': None})
+            self.starmap_items.append({'label': "No objects in scanner range.", 'pos': None, 'type': None, 'rift': None, 'body_idx': None})
+
+    # Batched scanner query over an (N, N_DIMENSIONS) position array
+    def scan_positions(self, positions, grid=None):
+        # Return indices, distances and view angles (degrees) of positions within scanner range
+        # With a spatial grid, only bodies in the 27 cells around the ship are tested
+        candidates = grid_candidates(grid, self.position) if grid is not None else np.arange(len(positions))
+        rel = positions[candidates] - self.position
+        dists = np.linalg.norm(rel, axis=1)
+        in_range = dists < SCANNER_RANGE
+        projected = project_many_to_2d(rel[in_range], self.view_rotation)
+        angles = np.degrees(np.arctan2(projected[:, 1], projected[:, 0]))
+        return candidates[in_range], dists[in_range], angles
 
     # Speak current starmap item
     def speak_starmap_item(self):
@@ -904,19 +1007,19 @@ class Ship:
             self.locked_is_rift = False
             self.approached_rift_announced = False
             if self.lock_sound:
-                if self.lock_sound in active_sound_effects:
-                    active_sound_effects.remove(self.lock_sound)
+                stop_sound_effect(self.lock_sound)
                 self.lock_sound = None
             speak_with_cooldown("Target unlocked.")
             return
         if selected['pos'] is None:
             return
         self.locked_target = selected['pos']
+        self.locked_body_idx = selected['body_idx']
         self.locked_is_rift = (selected['type'] == 'rift')
         self.locked_rift = selected['rift'] if self.locked_is_rift else None
         waveform = rift_beep_waveform if self.locked_is_rift else beep_waveform
         self.lock_sound = SoundEffect(waveform, loop=True, volume=beep_volume)
-        active_sound_effects.append(self.lock_sound)
+        play_sound_effect(self.lock_sound)
         self.approached_rift_announced = False
         speak_with_cooldown(f"Locked on to {selected['label'].split(' at')[0]}.")
 
@@ -926,18 +1029,16 @@ class Ship:
         self.rift_items = []
         if self.locked_rift is not None:
             self.rift_items.append({'label': "Unlock rift", 'pos': None, 'type': None, 'rift': None})
-        # Collect items with distances
-        items = []
-        for i, rift in enumerate(self.rifts):
-            dist = np.linalg.norm(self.position - rift['pos'])
-            projected_pos = project_to_2d(rift['pos'] - self.position, self.view_rotation)
-            angle = np.arctan2(projected_pos[1], projected_pos[0]) * 180 / np.pi
+        # Distances, projections and angles for all rifts in one batch, visited in distance order
+        rel = stack_positions(self.rifts) - self.position
+        dists = np.linalg.norm(rel, axis=1)
+        order = np.argsort(dists, kind='stable')
+        projected = project_many_to_2d(rel[order], self.view_rotation)
+        angles = np.degrees(np.arctan2(projected[:, 1], projected[:, 0]))
+        for i, dist, angle in zip(order.tolist(), dists[order].tolist(), angles.tolist()):
+            rift = self.rifts[i]
             label = f"Rift {i+1} ({rift['type']}) at dist {dist:.1f}, angle {angle:.1f} degrees"
-            items.append((dist, label, rift['pos'], rift['type'], rift))
-        # Sort by distance
-        items.sort(key=lambda x: x[0])
-        for dist, label, pos, rift_type, rift in items:
-            self.rift_items.append({'label': label, 'pos': pos, 'type': rift_type, 'rift': rift})
+            self.rift_items.append({'label': label, 'pos': rift['pos'], 'type': rift['type'], 'rift': rift})
         if not self.rift_items:
             self.rift_items.append({'label': "No rifts detected.", 'pos': None, 'type': None, 'rift': None})
 
@@ -957,8 +1058,7 @@ class Ship:
             self.locked_is_rift = False
             self.approached_rift_announced = False
             if self.lock_sound:
-                if self.lock_sound in active_sound_effects:
-                    active_sound_effects.remove(self.lock_sound)
+                stop_sound_effect(self.lock_sound)
                 self.lock_sound = None
             speak_with_cooldown("Rift unlocked.")
             return
@@ -966,9 +1066,10 @@ class Ship:
             return
         self.locked_rift = selected['rift']
         self.locked_target = self.locked_rift['pos']
+        self.locked_body_idx = None
         self.locked_is_rift = True
         self.lock_sound = SoundEffect(rift_beep_waveform, loop=True, volume=beep_volume)
-        active_sound_effects.append(self.lock_sound)
+        play_sound_effect(self.lock_sound)
         self.approached_rift_announced = False
         speak_with_cooldown(f"Locked on to {selected['label'].split(' at')[0]} for beeping and navigation.")
 
@@ -990,18 +1091,14 @@ class Ship:
         if np.mean(temp_res) > AUTO_SNAP_THRESHOLD:
             for i in range(N_DIMENSIONS):
                 self.r_drive[i] = self.crystal_freqs[nearest][i]
-            active_sound_effects.append(SoundEffect(lock_beep_waveform, pan=0.0, volume=beep_volume))
+            play_sound_effect(SoundEffect(lock_beep_waveform, pan=0.0, volume=beep_volume))
         freq = self.crystal_freqs[nearest][self.selected_dim]
         dx, dy = self.crystal_positions[nearest] - self.cursor_pos
-        direction = ""
-        if dy > 0: direction += "north "
-        elif dy < 0: direction += "south "
-        if dx > 0: direction += "east"
-        elif dx < 0: direction += "west"
+        direction = COMPASS_DIRECTIONS[(int(np.sign(dy)), int(np.sign(dx)))]
         speak_with_cooldown(f"Nearest crystal {dists[nearest]:.1f} units {direction}. Target freq in dim {self.selected_dim+1}: {freq:.2f} Hz.")
-        angle = np.arctan2(dy, dx)
-        pan = np.cos(angle)
-        active_sound_effects.append(SoundEffect(beep_waveform, pan=pan, volume=beep_volume))
+        angle = math.atan2(dy, dx)
+        pan = math.cos(angle)
+        play_sound_effect(SoundEffect(beep_waveform, pan=pan, volume=beep_volume))
 
     # Collect crystal on planet
     def collect_crystal(self):
@@ -1019,7 +1116,7 @@ class Ship:
             self.locked_crystals.add(nearest)
             self.crystals_collected += 1
             speak_with_cooldown("Crystal collected. Harmony increases.")
-            active_sound_effects.append(SoundEffect(lock_beep_waveform, pan=0.0, volume=beep_volume))
+            play_sound_effect(SoundEffect(lock_beep_waveform, pan=0.0, volume=beep_volume))
             if random.random() < 0.2:
                 speak_with_cooldown("Ancient echo: The spiral binds all dimensions in golden eternity.")
             if len(self.locked_crystals) == self.crystal_count:
@@ -1046,6 +1143,8 @@ class Ship:
                 planets.append({'pos': pos, 'freq': freq, 'type': 'planet'})
         nebulae = generate_celestial(N_NEBULAE, 'nebula')
         celestial_bodies = stars + planets + nebulae
+        rebuild_body_positions()
+        self.locked_body_idx = None  # Body rows no longer refer to the old universe
         # New: Clear rifts and sounds
         self.rifts.clear()
         active_sound_effects.clear()
@@ -1071,70 +1170,70 @@ class Ship:
         elif rift['type'] == 'perfect_fifth':
             self.crystal_bonus += 1
             speak_with_cooldown("Perfect fifth rift grants eternal crystal bounty.")
-        if rift['sound'] in active_sound_effects:
-            active_sound_effects.remove(rift['sound'])
+        stop_sound_effect(rift['sound'])
         self.rifts = [r for r in self.rifts if r is not rift]
         self.locked_rift = None
         self.locked_target = None
         self.locked_is_rift = False
         self.approached_rift_announced = False
         if self.lock_sound:
-            if self.lock_sound in active_sound_effects:
-                active_sound_effects.remove(self.lock_sound)
+            stop_sound_effect(self.lock_sound)
             self.lock_sound = None
 
-    # New: Save game
+    # New: Save game (snapshot taken here, written by the save/load worker)
     def save_game(self):
         state = {
-            'position': self.position,
-            'velocity': self.velocity,
-            'r_drive': self.r_drive,
-            'base_f_target': self.base_f_target,
+            'position': self.position.copy(),
+            'velocity': self.velocity.copy(),
+            'r_drive': self.r_drive.copy(),
+            'base_f_target': self.base_f_target.copy(),
             'resonance_integrity': self.resonance_integrity,
             'crystals_collected': self.crystals_collected,
             'resonance_width': self.resonance_width,
             'max_velocity': self.max_velocity,
             'crystal_bonus': self.crystal_bonus,
             'golden_harmony_active': self.golden_harmony_active,
-            'stars': stars,
-            'planets': planets,
-            'nebulae': nebulae,
-            'rifts': self.rifts  # Note: sounds can't be pickled, but we can recreate
+            # Bodies saved as arrays so each category pickles as a few raw buffers instead of N dicts
+            'star_positions': star_positions,
+            'planet_positions': planet_positions,
+            'nebula_positions': nebula_positions,
+            'star_freqs': body_freqs[:len(stars)],
+            'planet_freqs': body_freqs[len(stars):len(stars) + len(planets)],
+            'nebula_freqs': body_freqs[len(stars) + len(planets):],
+            'rifts': [{k: v for k, v in rift.items() if k != 'sound'} for rift in self.rifts]  # Sounds are recreated on load
         }
-        with open('savegame.pkl', 'wb') as f:
-            pickle.dump(state, f)
-        speak_with_cooldown("Game saved.")
+        save_load_requests.put(('save', state))
 
-    # New: Load game
+    # New: Load game (read by the save/load worker, applied by apply_loaded_game on the main thread)
     def load_game(self):
-        try:
-            with open('savegame.pkl', 'rb') as f:
-                state = pickle.load(f)
-            self.position = state['position']
-            self.velocity = state['velocity']
-            self.r_drive = state['r_drive']
-            self.base_f_target = state['base_f_target']
-            self.resonance_integrity = state['resonance_integrity']
-            self.crystals_collected = state['crystals_collected']
-            self.resonance_width = state['resonance_width']
-            self.max_velocity = state['max_velocity']
-            self.crystal_bonus = state['crystal_bonus']
-            self.golden_harmony_active = state['golden_harmony_active']
-            global stars, planets, nebulae, celestial_bodies
-            stars = state['stars']
-            planets = state['planets']
-            nebulae = state['nebulae']
-            celestial_bodies = stars + planets + nebulae
-            self.rifts = state['rifts']
-            # Recreate rift sounds
-            for rift in self.rifts:
-                hum_waveform = rift_hum_waveform.copy()
-                sound = SoundEffect(hum_waveform, loop=True, volume=0.0)
-                active_sound_effects.append(sound)
-                rift['sound'] = sound
-            speak_with_cooldown("Game loaded.")
-        except:
-            speak_with_cooldown("No save file found.")
+        save_load_requests.put(('load', None))
+
+    # Apply a state read from disk
+    def apply_loaded_game(self, state):
+        self.position = state['position']
+        self.velocity = state['velocity']
+        self.r_drive = state['r_drive']
+        self.base_f_target = state['base_f_target']
+        self.resonance_integrity = state['resonance_integrity']
+        self.crystals_collected = state['crystals_collected']
+        self.resonance_width = state['resonance_width']
+        self.max_velocity = state['max_velocity']
+        self.crystal_bonus = state['crystal_bonus']
+        self.golden_harmony_active = state['golden_harmony_active']
+        global stars, planets, nebulae, celestial_bodies
+        stars = bodies_from_arrays(state['star_positions'], state['star_freqs'], 'star')
+        planets = bodies_from_arrays(state['planet_positions'], state['planet_freqs'], 'planet')
+        nebulae = bodies_from_arrays(state['nebula_positions'], state['nebula_freqs'], 'nebula')
+        celestial_bodies = stars + planets + nebulae
+        rebuild_body_positions()
+        self.locked_body_idx = None
+        self.rifts = state['rifts']
+        # Recreate rift sounds
+        for rift in self.rifts:
+            sound = SoundEffect(rift_hum_waveform, loop=True, volume=0.0)
+            play_sound_effect(sound)
+            rift['sound'] = sound
+        speak_with_cooldown("Game loaded.")
 
     # Update ship state
     def update(self, dt, celestial_bodies, keys):
@@ -1151,37 +1250,28 @@ class Ship:
 
         if self.idle_mode:
             # Slowly auto-tune
-            for i in range(N_DIMENSIONS):
-                self.r_drive[i] += (self.f_target[i] - self.r_drive[i]) * 0.01
+            self.r_drive += (self.f_target - self.r_drive) * 0.01
             # Play evolving chord
-            if not any(np.array_equal(e.waveform, chord_waveform) for e in active_sound_effects):
-                active_sound_effects.append(SoundEffect(chord_waveform, loop=True, volume=effect_volume * 0.3))
+            if self.idle_chord_sound not in active_sound_effects:
+                self.idle_chord_sound = play_sound_effect(SoundEffect(chord_waveform, loop=True, volume=effect_volume * 0.3))
 
         # Handle landed mode: Zero velocity, shift targets based on biome
         if self.landed_mode:
             self.velocity = np.zeros(N_DIMENSIONS)
             shift = 10 * dt if self.planet_biome == 'dissonant' else 1 * dt
-            self.f_target = [f + random.uniform(-shift, shift) for f in self.f_target]
-            self.f_target = [max(FREQUENCY_RANGE[0], min(FREQUENCY_RANGE[1], f)) for f in self.f_target]
-            for i in range(N_DIMENSIONS):
-                delta_f = self.r_drive[i] - self.f_target[i]
-                self.resonance_levels[i] = 1 / (1 + (delta_f / self.resonance_width)**2)
+            self.f_target += np.random.uniform(-shift, shift, N_DIMENSIONS)
+            np.clip(self.f_target, FMIN, FMAX, out=self.f_target)
+            self.resonance_levels[:] = 1 / (1 + ((self.r_drive - self.f_target) / self.resonance_width)**2)
             return
 
         # Calculate environmental influence on targets from nearby bodies (exclude locked target to avoid feedback loop)
-        env_influence = np.zeros(N_DIMENSIONS)
-        for body in celestial_bodies:
-            if self.locked_target is not None and np.all(body['pos'] == self.locked_target):
-                continue  # Skip influence from the locked target itself
-            dists = np.abs(self.position - body['pos'])
-            close_dims = dists < INTERACTION_DISTANCE
-            if np.any(close_dims):
-                body_freq = body['freq']
-                for d in range(N_DIMENSIONS):
-                    if close_dims[d]:
-                        env_influence[d] += (INTERACTION_DISTANCE - dists[d]) / INTERACTION_DISTANCE * body_freq * PHI**d
-        self.f_target = [self.base_f_target[i] + env_influence[i] for i in range(N_DIMENSIONS)]
-        self.f_target = [max(FREQUENCY_RANGE[0], min(FREQUENCY_RANGE[1], f)) for f in self.f_target]
+        # Per-dim weight falls linearly from 1 at the body to 0 at INTERACTION_DISTANCE (all bodies at once)
+        weights = np.clip((INTERACTION_DISTANCE - np.abs(self.position - body_positions)) / INTERACTION_DISTANCE, 0.0, None)
+        if self.locked_target is not None and self.locked_body_idx is not None:
+            weights[self.locked_body_idx] = 0.0  # Skip influence from the locked target itself
+        env_influence = (body_freqs @ weights) * PHI_POWERS
+        np.add(self.base_f_target, env_influence, out=self.f_target)
+        np.clip(self.f_target, FMIN, FMAX, out=self.f_target)
 
         # Autopilot to locked target (refined with global slowdown)
         if self.locked_target is not None:
@@ -1191,8 +1281,7 @@ class Ship:
                 norm = 1e-6  # Avoid zero division
             stop_dist = RIFT_ALIGNMENT_TOLERANCE if self.locked_is_rift else 1.0
             if norm < stop_dist:
-                for i in range(N_DIMENSIONS):
-                    self.r_drive[i] = self.f_target[i]  # Reset to stop
+                self.r_drive[:] = self.f_target  # Reset to stop
                 self.velocity = np.zeros(N_DIMENSIONS)  # Force zero velocity
                 if self.locked_is_rift and not self.approached_rift_announced:
                     speak_with_cooldown("Approached rift - ready for entry.")
@@ -1201,48 +1290,38 @@ class Ship:
                     self.locked_target = None
                     self.locked_is_rift = False
                     if self.lock_sound:
-                        if self.lock_sound in active_sound_effects:
-                            active_sound_effects.remove(self.lock_sound)
+                        stop_sound_effect(self.lock_sound)
                         self.lock_sound = None
                     speak_with_cooldown("Target reached.")
             else:
                 slowdown_factor = min(1.0, norm / SLOWDOWN_DIST)
-                for i in range(N_DIMENSIONS):
-                    dir_i = dir_vec[i]
-                    desired_vel_i = (dir_i / norm) * self.max_velocity * slowdown_factor
-                    target_res = min(0.999, abs(desired_vel_i) / self.max_velocity) if abs(desired_vel_i) > 0.01 else 0
-                    if target_res > 0:
-                        d_over_w = np.sqrt(1 / target_res - 1)
-                        delta = self.resonance_width * d_over_w
-                        delta_f = np.sign(desired_vel_i) * delta
-                        target_drive = self.f_target[i] + delta_f
-                    else:
-                        target_drive = self.f_target[i]
-                    if norm < SLOWDOWN_DIST / 2:
-                        self.r_drive[i] = target_drive  # Snap when close to avoid oscillation
+                vel_scale = self.max_velocity * slowdown_factor / norm
+                snap = norm < SLOWDOWN_DIST / 2  # Snap when close to avoid oscillation
+                # Five scalars per frame: plain math calls, no NumPy dispatch per element
+                for i, dir_i in enumerate(dir_vec.tolist()):
+                    desired_vel_i = dir_i * vel_scale
+                    speed_i = abs(desired_vel_i)
+                    # Branchless: near-zero speeds are masked to no offset instead of taking a separate path
+                    target_res = max(min(0.999, speed_i / self.max_velocity), 1e-12)
+                    delta_f = math.copysign(self.resonance_width * math.sqrt(1 / target_res - 1), desired_vel_i) * (speed_i > 0.01)
+                    target_drive = self.f_target[i] + delta_f
+                    if snap:
+                        self.r_drive[i] = target_drive
                     else:
                         self.r_drive[i] += (target_drive - self.r_drive[i]) * 0.1  # Smooth interpolation
                 # Update lock sound based on alignment
                 projected_pos = project_to_2d(dir_vec, self.view_rotation)
-                angle = np.arctan2(projected_pos[1] - SCREEN_HEIGHT/2, projected_pos[0] - SCREEN_WIDTH/2)
-                self.lock_sound.pan = np.sin(angle)
+                angle = math.atan2(projected_pos[1] - SCREEN_HEIGHT/2, projected_pos[0] - SCREEN_WIDTH/2)
                 misalignment = abs(angle)
-                self.lock_sound.pitch = 1.0 + misalignment / 180.0
-                self.lock_sound.waveform = (beep_waveform if not self.locked_is_rift else rift_beep_waveform) * self.lock_sound.pitch
-                self.lock_sound.volume = beep_volume
+                self.lock_sound.pitch = 1.0 + misalignment / 180.0  # Waveform was chosen when the lock was acquired
+                self.lock_sound.set_pan_volume(math.sin(angle), beep_volume)
 
         # Auto-rotate view to center locked target horizontally (for all locked targets)
         if self.locked_target is not None:
             dir_vec = self.locked_target - self.position
             norm = np.linalg.norm(dir_vec)
             if norm > 1.0:  # Stop rotating when very close to avoid jitter
-                if np.linalg.norm(dir_vec[[0,3]]) > 1e-6:  # Avoid division by zero
-                    target_r = np.arctan2(dir_vec[3], dir_vec[0])
-                    projected_x = dir_vec[0] * np.cos(target_r) + dir_vec[3] * np.sin(target_r)
-                    if projected_x < 0:
-                        target_r += np.pi
-                else:
-                    target_r = self.view_rotation
+                target_r = centering_rotation(dir_vec, self.view_rotation)
                 # Shortest angle adjustment
                 delta_r = target_r - self.view_rotation
                 if delta_r > np.pi:
@@ -1251,21 +1330,20 @@ class Ship:
                     delta_r += 2 * np.pi
                 self.view_rotation += delta_r * 0.5  # Interpolate
 
-        # Calculate resonance and velocity per dimension
-        for i in range(N_DIMENSIONS):
-            delta_f = self.r_drive[i] - self.f_target[i]
-            self.resonance_levels[i] = 1 / (1 + (delta_f / self.resonance_width)**2)
-            if self.resonance_levels[i] > PERFECT_RESONANCE_THRESHOLD and self.prev_resonance_levels[i] <= PERFECT_RESONANCE_THRESHOLD:
-                active_sound_effects.append(SoundEffect(ping_waveform, pan=0.0, volume=effect_volume))
-            if self.resonance_levels[i] > POWER_BUILD_THRESHOLD:
-                self.resonance_power[i] += dt
-            else:
-                self.resonance_power[i] = 0
-            boost = 1 + (self.resonance_power[i] / POWER_BUILD_TIME) * PHI
-            self.velocity[i] = self.max_velocity * self.resonance_levels[i] * np.sign(delta_f) * boost
-
-        # Handle dissonance if average resonance low
-        avg_res = np.mean(self.resonance_levels)
+        # Calculate resonance and velocity for all dimensions at once (written in place)
+        delta_f = self.r_drive - self.f_target
+        self.resonance_levels[:] = 1 / (1 + (delta_f / self.resonance_width)**2)
+        # Ping once per dimension that just crossed into perfect resonance
+        for _ in np.flatnonzero((self.resonance_levels > PERFECT_RESONANCE_THRESHOLD) & (self.prev_resonance_levels <= PERFECT_RESONANCE_THRESHOLD)):
+            play_sound_effect(SoundEffect(ping_waveform, pan=0.0, volume=effect_volume))
+        # Power builds while above threshold and resets otherwise
+        self.resonance_power += dt
+        self.resonance_power[self.resonance_levels <= POWER_BUILD_THRESHOLD] = 0
+        boost = 1 + (self.resonance_power / POWER_BUILD_TIME) * PHI
+        self.velocity[:] = self.max_velocity * self.resonance_levels * np.sign(delta_f) * boost
+
+        # Handle dissonance if average resonance low (avg_res is reused for the rest of the frame; resonance_levels is final here)
+        avg_res = float(self.resonance_levels.mean())
         if avg_res < DISSONANCE_THRESHOLD:
             self.dissonance_timer += dt
             if self.dissonance_timer > DISSONANCE_DURATION:
@@ -1276,17 +1354,18 @@ class Ship:
             self.dissonance_timer = 0.0
 
         # Verbose alerts for resonance changes
-        for i in range(N_DIMENSIONS):
-            change = abs(self.resonance_levels[i] - self.prev_resonance_levels[i])
-            if self.verbose_mode > 0 and change > 0.1:
-                speak_with_cooldown(f"Alert: Resonance in dim {i+1} now {self.resonance_levels[i]:.2f}.")
-            if self.verbose_mode == 2 and simulation_time % 5 < DT:
-                hud_status = f"Selected Dim: {self.selected_dim + 1}. Drive Freq: {self.r_drive[self.selected_dim]:.2f} Hz. Target Freq: {self.f_target[self.selected_dim]:.2f} Hz. Resonance: {self.resonance_levels[self.selected_dim]:.2f}. Speed: {np.linalg.norm(self.velocity):.2f} u/s. Volume: {int(master_volume * 100)} percent. Integrity: {self.resonance_integrity:.2f}. Crystals: {self.crystals_collected}. Status: {'Landed' if self.landed_mode else 'In Flight'}."
-                speak_with_cooldown(hud_status)
+        if self.verbose_mode > 0:
+            for i in np.flatnonzero(np.abs(self.resonance_levels - self.prev_resonance_levels) > 0.1):
+                speak_lazy(RESONANCE_ALERT, i + 1, self.resonance_levels[i], cooldown_key=(RESONANCE_ALERT, i))
+        # Full HUD status once per 5-second window
+        if self.verbose_mode == 2 and simulation_time % 5 < DT:
+            dim = self.selected_dim
+            speak_lazy(VERBOSE_HUD_STATUS, dim + 1, self.r_drive[dim], self.f_target[dim], self.resonance_levels[dim], np.linalg.norm(self.velocity),
+                       int(master_volume * 100), self.resonance_integrity, self.crystals_collected, 'Landed' if self.landed_mode else 'In Flight')
         self.prev_resonance_levels = self.resonance_levels.copy()
 
         # New: Easter egg check
-        if all(abs(rd - EASTER_EGG_FREQ) < EASTER_EGG_TOLERANCE for rd in self.r_drive):
+        if (np.abs(self.r_drive - EASTER_EGG_FREQ) < EASTER_EGG_TOLERANCE).all():
             speak_with_cooldown("You are the universe experiencing itself.")
 
         # Random rift generation if high resonance
@@ -1295,32 +1374,36 @@ class Ship:
             rift_pos[3] = rift_pos[0] * PHI
             rift_pos[4] = rift_pos[1] * PHI
             rift_type = random.choice(['boost', 'crystal', 'hazard'])
-            hum_waveform = rift_hum_waveform.copy()
-            sound = SoundEffect(hum_waveform, loop=True, volume=0.0)
-            active_sound_effects.append(sound)
+            sound = SoundEffect(rift_hum_waveform, loop=True, volume=0.0)
+            play_sound_effect(sound)
             self.rifts.append({'pos': rift_pos, 'timer': RIFT_FADE_TIME, 'type': rift_type, 'sound': sound, 'last_beep_time': simulation_time})
             projected_pos = project_to_2d(rift_pos - self.position, self.view_rotation)
-            angle = np.arctan2(projected_pos[1] - SCREEN_HEIGHT/2, projected_pos[0] - SCREEN_WIDTH/2) * 180 / np.pi
+            angle = math.degrees(math.atan2(projected_pos[1] - SCREEN_HEIGHT/2, projected_pos[0] - SCREEN_WIDTH/2))
             dir_str = "left" if angle < 0 else "right"
             speak_with_cooldown(f"{rift_type.capitalize()} dimensional rift detected at {abs(angle):.1f} degrees {dir_str}.")
         # New: Super-rare perfect fifth rift
-        if all(abs(self.r_drive[i] - self.f_target[i]) < PERFECT_FIFTH_TOLERANCE for i in range(N_DIMENSIONS)) and random.random() < PERFECT_FIFTH_PROB:
+        if (np.abs(self.r_drive - self.f_target) < PERFECT_FIFTH_TOLERANCE).all() and random.random() < PERFECT_FIFTH_PROB:
             rift_pos = self.position + np.random.uniform(-15, 15, N_DIMENSIONS)
             rift_pos[3] = rift_pos[0] * PHI
             rift_pos[4] = rift_pos[1] * PHI
             rift_type = 'perfect_fifth'
-            hum_waveform = rift_hum_waveform.copy()
-            sound = SoundEffect(hum_waveform, loop=True, volume=0.0)
-            active_sound_effects.append(sound)
+            sound = SoundEffect(rift_hum_waveform, loop=True, volume=0.0)
+            play_sound_effect(sound)
             self.rifts.append({'pos': rift_pos, 'timer': RIFT_FADE_TIME, 'type': rift_type, 'sound': sound, 'last_beep_time': simulation_time})
             projected_pos = project_to_2d(rift_pos - self.position, self.view_rotation)
-            angle = np.arctan2(projected_pos[1] - SCREEN_HEIGHT/2, projected_pos[0] - SCREEN_WIDTH/2) * 180 / np.pi
+            angle = math.degrees(math.atan2(projected_pos[1] - SCREEN_HEIGHT/2, projected_pos[0] - SCREEN_WIDTH/2))
             dir_str = "left" if angle < 0 else "right"
             speak_with_cooldown(f"Mythical perfect fifth rift materialized at {abs(angle):.1f} degrees {dir_str}!")
 
         # Update rifts: Fade timers, sounds, and beeps
-        to_remove = []
-        for i, rift in enumerate(self.rifts):
+        # Pan, distance and hum volume for every rift in one batched pass (rift positions are fixed)
+        rift_offsets = stack_positions(self.rifts) - self.position
+        projected = project_many_to_2d(rift_offsets, self.view_rotation)
+        rift_pans = np.sin(np.arctan2(projected[:, 1] - SCREEN_HEIGHT/2, projected[:, 0] - SCREEN_WIDTH/2))
+        rift_dists = np.linalg.norm(rift_offsets, axis=1)
+        rift_volumes = np.maximum(0, effect_volume * (1 - rift_dists / RIFT_MAX_DIST)) * avg_res
+        expired = set()
+        for i, (rift, pan, dist, volume) in enumerate(zip(self.rifts, rift_pans.tolist(), rift_dists.tolist(), rift_volumes.tolist())):
             rift['timer'] -= dt
             if rift['timer'] <= 0:
                 if rift is self.locked_rift:
@@ -1328,36 +1411,29 @@ class Ship:
                     self.locked_target = None
                     self.locked_is_rift = False
                     if self.lock_sound:
-                        if self.lock_sound in active_sound_effects:
-                            active_sound_effects.remove(self.lock_sound)
+                        stop_sound_effect(self.lock_sound)
                         self.lock_sound = None
                     speak_with_cooldown("Locked rift faded into the void.")
                 else:
                     speak_with_cooldown("Rift faded into the void.")
-                if rift['sound'] in active_sound_effects:
-                    active_sound_effects.remove(rift['sound'])
-                to_remove.append(i)
+                stop_sound_effect(rift['sound'])
+                expired.add(i)
                 continue
             if avg_res > 0.9:
                 rift['timer'] += dt * PHI
-            projected_pos = project_to_2d(rift['pos'] - self.position, self.view_rotation)
-            angle = np.arctan2(projected_pos[1] - SCREEN_HEIGHT/2, projected_pos[0] - SCREEN_WIDTH/2) * 180 / np.pi
-            rift['sound'].pan = np.sin(angle * np.pi / 180)
-            dist = np.linalg.norm(self.position - rift['pos'])
-            rift['sound'].volume = max(0, effect_volume * (1 - dist / RIFT_MAX_DIST)) * avg_res
+            rift['sound'].set_pan_volume(pan, volume)
             if rift is self.locked_rift:
-                pan = np.sin(angle * np.pi / 180)
                 centered_factor = 1 - abs(pan)  # High when aligned horizontally (|pan| ≈ 0)
                 interval = 2.0 - 1.8 * centered_factor  # Faster beeps when aligned
                 if simulation_time - rift['last_beep_time'] > interval:
-                    active_sound_effects.append(SoundEffect(rift_beep_waveform, pan=pan, volume=beep_volume))
+                    play_sound_effect(SoundEffect(rift_beep_waveform, pan=pan, volume=beep_volume))
                     rift['last_beep_time'] = simulation_time
             if dist < RIFT_ALIGNMENT_TOLERANCE:
                 if avg_res <= RIFT_ENTRY_RES_THRESHOLD:
                     self.velocity += np.random.uniform(-1, 1, N_DIMENSIONS) * 0.5
                     speak_with_cooldown("Dissonance prevents rift entry.")
-        for i in sorted(to_remove, reverse=True):
-            del self.rifts[i]
+        if expired:
+            self.rifts = [rift for i, rift in enumerate(self.rifts) if i not in expired]  # One filtering pass instead of per-index deletes
 
         # Update position with wrap-around
         self.position += self.velocity * dt
@@ -1369,13 +1445,13 @@ class Ship:
             if self.locked_rift:
                 dir_vec = self.locked_target - self.position
                 projected_pos = project_to_2d(dir_vec, self.view_rotation)
-                angle = np.arctan2(projected_pos[1] - SCREEN_HEIGHT/2, projected_pos[0] - SCREEN_WIDTH/2) * 180 / np.pi
+                angle = math.degrees(math.atan2(projected_pos[1] - SCREEN_HEIGHT/2, projected_pos[0] - SCREEN_WIDTH/2))
                 vertical_error = abs(abs(angle) - 90)  # Error from ideal vertical
                 if vertical_error > RIFT_ENTRY_ALIGNMENT_ANGLE / 2:
-                    nudge = np.sign(angle - 90) * RIFT_NUDGE_RATE * dt
+                    nudge = math.copysign(RIFT_NUDGE_RATE * dt, angle - 90)
                     self.position[1] += nudge
                     self.position[2] += nudge * PHI
-                if np.mean(self.resonance_levels) < RIFT_ENTRY_RES_THRESHOLD:
+                if avg_res < RIFT_ENTRY_RES_THRESHOLD:
                     self.rift_charge_timer = 0
                     speak_with_cooldown("Charge aborted—resonance too low. Retune.")
                 elif self.rift_charge_timer <= 0:
@@ -1386,45 +1462,34 @@ class Ship:
             # Guidance while locked but not charging
             if self.locked_is_rift and simulation_time - self.last_guidance_time > 10.0:  # Increased to 10s
                 dist = np.linalg.norm(self.position - self.locked_target)
-                avg_res = np.mean(self.resonance_levels) * 100
+                res_pct = avg_res * 100
                 dir_vec = self.locked_target - self.position
-                if np.linalg.norm(dir_vec[[0,3]]) > 1e-6:
-                    target_r = np.arctan2(dir_vec[3], dir_vec[0])
-                    projected_x = dir_vec[0] * np.cos(target_r) + dir_vec[3] * np.sin(target_r)
-                    if projected_x < 0:
-                        target_r += np.pi
-                else:
-                    target_r = self.view_rotation
+                target_r = centering_rotation(dir_vec, self.view_rotation)
                 delta_r = target_r - self.view_rotation
                 if delta_r > np.pi:
                     delta_r -= 2 * np.pi
                 elif delta_r < -np.pi:
                     delta_r += 2 * np.pi
                 projected_pos = project_to_2d(dir_vec, self.view_rotation)
-                angle = np.arctan2(projected_pos[1] - SCREEN_HEIGHT/2, projected_pos[0] - SCREEN_WIDTH/2) * 180 / np.pi
-                pan = np.sin(angle * np.pi / 180)
+                angle = math.degrees(math.atan2(projected_pos[1] - SCREEN_HEIGHT/2, projected_pos[0] - SCREEN_WIDTH/2))
+                pan = math.sin(math.radians(angle))
                 align_pct = (1 - abs(pan)) * 100
-                if abs(dist - self.prev_rift_dist) > 5 or abs(align_pct - self.prev_rift_align) > 10 or abs(avg_res - self.prev_rift_res) > 10:  # Only speak if changed significantly
-                    speak_with_cooldown(f"Rift status: Distance {dist:.1f}, alignment {align_pct:.0f}%, resonance {avg_res:.0f}%.")
+                if abs(dist - self.prev_rift_dist) > 5 or abs(align_pct - self.prev_rift_align) > 10 or abs(res_pct - self.prev_rift_res) > 10:  # Only speak if changed significantly
+                    speak_with_cooldown(f"Rift status: Distance {dist:.1f}, alignment {align_pct:.0f}%, resonance {res_pct:.0f}%.")
                     if align_pct < 50:
                         dir = "right" if delta_r > 0 else "left"
                         speak_with_cooldown(f"Rotate {dir} to center.")
                     self.prev_rift_dist = dist
                     self.prev_rift_align = align_pct
-                    self.prev_rift_res = avg_res
+                    self.prev_rift_res = res_pct
                     self.last_guidance_time = simulation_time
 
-        # Detect nearby celestial bodies
-        self.nearest_body = None
-        min_dist = float('inf')
-        near_any = False
-        for body in celestial_bodies:
-            dist = np.linalg.norm(self.position - body['pos'])
-            if dist < INTERACTION_DISTANCE:
-                near_any = True
-                if dist < min_dist:
-                    min_dist = dist
-                    self.nearest_body = body
+        # Detect nearby celestial bodies (squared distances to every body in one pass, rows match celestial_bodies)
+        diff = body_positions - self.position
+        dist_sq = np.einsum('ij,ij->i', diff, diff)
+        nearest = int(dist_sq.argmin())
+        near_any = bool(dist_sq[nearest] < INTERACTION_DISTANCE ** 2)
+        self.nearest_body = celestial_bodies[nearest] if near_any else None
         if near_any and not self.near_object:
             self.near_object = True
             speak_with_cooldown("Approaching celestial object. Resonance influenced.")
@@ -1436,9 +1501,9 @@ class Ship:
         if self.near_object and simulation_time - last_beep_time > 1.0:
             if self.nearest_body is not None:
                 projected_pos = project_to_2d(self.nearest_body['pos'] - self.position, self.view_rotation)
-                angle = np.arctan2(projected_pos[1] - SCREEN_HEIGHT/2, projected_pos[0] - SCREEN_WIDTH/2)
-                pan = np.sin(angle)
-                active_sound_effects.append(SoundEffect(beep_waveform, pan=pan, volume=beep_volume))
+                angle = math.atan2(projected_pos[1] - SCREEN_HEIGHT/2, projected_pos[0] - SCREEN_WIDTH/2)
+                pan = math.sin(angle)
+                play_sound_effect(SoundEffect(beep_waveform, pan=pan, volume=beep_volume))
             last_beep_time = simulation_time
 
         # Announce landmarks in view during rotation
@@ -1446,7 +1511,7 @@ class Ship:
         if self.rotating_left or self.rotating_right:
             for body in celestial_bodies:
                 projected_pos = project_to_2d(body['pos'] - self.position, self.view_rotation)
-                angle = np.arctan2(projected_pos[1] - SCREEN_HEIGHT/2, projected_pos[0] - SCREEN_WIDTH/2) * 180 / np.pi
+                angle = math.degrees(math.atan2(projected_pos[1] - SCREEN_HEIGHT/2, projected_pos[0] - SCREEN_WIDTH/2))
                 if abs(angle) < VIEW_LANDMARK_THRESHOLD and simulation_time - self.last_landmark_speak_time > LANDMARK_SPEECH_COOLDOWN:
                     speak_with_cooldown(f"Object in view at {angle:.1f} degrees.")
                     self.last_landmark_speak_time = simulation_time
@@ -1455,7 +1520,7 @@ class Ship:
         if self.landing_timer > 0:
             self.landing_timer -= dt
             if self.landing_timer <= 0:
-                if np.mean(self.resonance_levels) > LANDING_THRESHOLD and self.nearest_body and self.nearest_body['type'] == 'planet':
+                if avg_res > LANDING_THRESHOLD and self.nearest_body and self.nearest_body['type'] == 'planet':
                     self.landed_mode = True
                     self.landed_planet = self.nearest_body['pos']
                     speak_with_cooldown("Landing successful. Explore the planet.")
@@ -1479,25 +1544,60 @@ class Ship:
             # Fade to heartbeat pulse
             heartbeat_freq = self.last_detected_rhythm / 60.0  # BPM to Hz
             # Adjust drive signals to pulse (this would require modifying audio_callback logic, but for simplicity, add a pulse sound
-            if not any(e.loop and e.volume == HEARTBEAT_VOLUME for e in active_sound_effects):
-                heartbeat_wave = np.sin(2 * np.pi * heartbeat_freq * np.linspace(0, 1 / heartbeat_freq, int(SAMPLE_RATE / heartbeat_freq)))
-                active_sound_effects.append(SoundEffect(heartbeat_wave, loop=True, volume=HEARTBEAT_VOLUME))
+            if self.heartbeat_sound not in active_sound_effects:
+                self.heartbeat_sound = play_sound_effect(SoundEffect(get_heartbeat_waveform(heartbeat_freq), loop=True, volume=HEARTBEAT_VOLUME))
 
 # Generate celestial bodies procedurally
 def generate_celestial(n, body_type='star'):
-    # Generate positions and frequencies for celestial bodies using golden spiral
-    bodies = []
-    for i in range(n):
-        theta = i * 2 * np.pi * PHI
-        r = FIB_SEQ[i % len(FIB_SEQ)] * SCALE_FACTOR
-        pos = np.zeros(N_DIMENSIONS)
-        pos[0] = r * np.cos(theta)
-        pos[1] = r * np.sin(theta)
-        for d in range(2, N_DIMENSIONS):
-            pos[d] = pos[d-2] * PHI + random.uniform(-10, 10)
-        freq = random.uniform(*FREQUENCY_RANGE)
-        bodies.append({'pos': pos, 'freq': freq, 'type': body_type})
-    return bodies
+    # Generate positions and frequencies for celestial bodies using golden spiral (all bodies at once)
+    i = np.arange(n)
+    theta = i * 2 * np.pi * PHI
+    r = FIB_ARRAY[i % len(FIB_SEQ)] * SCALE_FACTOR
+    positions = np.zeros((n, N_DIMENSIONS))
+    positions[:, 0] = r * np.cos(theta)
+    positions[:, 1] = r * np.sin(theta)
+    for d in range(2, N_DIMENSIONS):
+        positions[:, d] = positions[:, d-2] * PHI + np.random.uniform(-10, 10, n)
+    freqs = np.random.uniform(*FREQUENCY_RANGE, n)
+    return bodies_from_arrays(positions, freqs, body_type)
+
+# Stack body positions into a contiguous (N, N_DIMENSIONS) array for batched distance queries
+def stack_positions(bodies):
+    return np.array([body['pos'] for body in bodies], dtype=float).reshape(-1, N_DIMENSIONS)
+
+# Rebuild per-body dicts from saved position/frequency arrays
+def bodies_from_arrays(positions, freqs, body_type):
+    return [{'pos': pos, 'freq': freq, 'type': body_type} for pos, freq in zip(positions, freqs.tolist())]
+
+# Uniform spatial grid: cells are SCANNER_RANGE wide over the 3 spatial dims, so any body within
+# scanner range of the ship lies in the ship's cell or one of its 26 neighbors
+GRID_NEIGHBOR_OFFSETS = np.array(list(itertools.product((-1, 0, 1), repeat=3)))
+
+def build_spatial_grid(positions):
+    # Map each occupied cell to the row indices of the positions inside it
+    buckets = defaultdict(list)
+    for idx, cell in enumerate((positions[:, :3] // SCANNER_RANGE).astype(int).tolist()):
+        buckets[tuple(cell)].append(idx)
+    return {cell: np.array(idxs) for cell, idxs in buckets.items()}
+
+def grid_candidates(grid, position):
+    # Row indices of every position in the cells surrounding a point
+    base = (position[:3] // SCANNER_RANGE).astype(int)
+    hits = [grid[cell] for cell in map(tuple, (base + GRID_NEIGHBOR_OFFSETS).tolist()) if cell in grid]
+    return np.concatenate(hits) if hits else np.empty(0, dtype=int)
+
+# Refresh the stacked position arrays and grids after the body lists are replaced (generation, ascension, load)
+def rebuild_body_positions():
+    global star_positions, planet_positions, nebula_positions, star_grid, planet_grid, nebula_grid, body_positions, body_freqs
+    star_positions = stack_positions(stars)
+    planet_positions = stack_positions(planets)
+    nebula_positions = stack_positions(nebulae)
+    # Structure-of-arrays view of celestial_bodies (stars + planets + nebulae, same row order)
+    body_positions = np.concatenate((star_positions, planet_positions, nebula_positions))
+    body_freqs = np.array([body['freq'] for body in celestial_bodies], dtype=float)
+    star_grid = build_spatial_grid(star_positions)
+    planet_grid = build_spatial_grid(planet_positions)
+    nebula_grid = build_spatial_grid(nebula_positions)
 
 # Generate stars, planets, nebulae
 stars = generate_celestial(N_STARS, 'star')
@@ -1509,23 +1609,24 @@ for star in stars:
         planets.append({'pos': pos, 'freq': freq, 'type': 'planet'})
 nebulae = generate_celestial(N_NEBULAE, 'nebula')
 celestial_bodies = stars + planets + nebulae
+rebuild_body_positions()
 
-# Precompute waveforms for sounds
+# Precompute waveforms for sounds (synthesized in float64 for phase accuracy, stored as float32 for mixing)
 beep_duration = 0.1
 beep_frequency = 440
 beep_samples = int(beep_duration * SAMPLE_RATE)
-beep_waveform = 0.2 * np.sin(2 * np.pi * beep_frequency * np.linspace(0, beep_duration, beep_samples))
+beep_waveform = (0.2 * np.sin(2 * np.pi * beep_frequency * np.linspace(0, beep_duration, beep_samples))).astype(np.float32)
 
 rift_beep_frequency = 880
-rift_beep_waveform = 0.2 * np.sin(2 * np.pi * rift_beep_frequency * np.linspace(0, beep_duration, beep_samples))
+rift_beep_waveform = (0.2 * np.sin(2 * np.pi * rift_beep_frequency * np.linspace(0, beep_duration, beep_samples))).astype(np.float32)
 
 click_duration = 0.05
 click_freq = 100 * PHI
-click_waveform = 0.2 * np.sin(2 * np.pi * click_freq * np.linspace(0, click_duration, int(click_duration * SAMPLE_RATE), endpoint=False))
+click_waveform = (0.2 * np.sin(2 * np.pi * click_freq * np.linspace(0, click_duration, int(click_duration * SAMPLE_RATE), endpoint=False))).astype(np.float32)
 
 rotation_duration = ROTATION_SOUND_DURATION
 rotation_freq = 200 * PHI
-rotation_waveform = 0.1 * np.sin(2 * np.pi * rotation_freq * np.linspace(0, rotation_duration, int(rotation_duration * SAMPLE_RATE)))
+rotation_waveform = (0.1 * np.sin(2 * np.pi * rotation_freq * np.linspace(0, rotation_duration, int(rotation_duration * SAMPLE_RATE)))).astype(np.float32)
 
 # Long Golden Harmony Chord — 7 seconds at 432 Hz (the frequency of the universe)
 chord_duration = 7.0
@@ -1538,19 +1639,20 @@ envelope = (np.sin(np.pi * t_chord / chord_duration) ** 2) * \
 
 # 432 Hz A-major with subtle golden-ratio overtones
 base = 432.0
-chord_waveform = 0.11 * envelope * (
+chord_waveform = (0.11 * envelope * (
     np.sin(2 * np.pi * base * t_chord) +           # A4 @ 432 Hz
     np.sin(2 * np.pi * base * 1.25 * t_chord) +    0.9 * np.sin(2 * np.pi * base * 1.5874 * t_chord) +  # C♯5 & E5 tuned to just intonation-ish ratios
     0.4 * np.sin(2 * np.pi * base * PHI * t_chord) +     # Golden overtone shimmer
     0.2 * np.sin(2 * np.pi * base * PHI**2 * t_chord)     # Even higher golden harmonic
-)
+)).astype(np.float32)
 
 rift_hum_duration = 1.0
 rift_hum_base_freq = 220.0
 t_rift = np.linspace(0, rift_hum_duration, int(rift_hum_duration * SAMPLE_RATE))
-rift_hum_waveform = 0.1 * (np.sin(2 * np.pi * rift_hum_base_freq * t_rift) +
-                          0.5 * np.sin(2 * np.pi * rift_hum_base_freq * PHI * t_rift) +
-                          0.25 * np.sin(2 * np.pi * rift_hum_base_freq * PHI**2 * t_rift))
+rift_hum_waveform = (0.1 * (np.sin(2 * np.pi * rift_hum_base_freq * t_rift) +
+                           0.5 * np.sin(2 * np.pi * rift_hum_base_freq * PHI * t_rift) +
+                           0.25 * np.sin(2 * np.pi * rift_hum_base_freq * PHI**2 * t_rift))).astype(np.float32)
+rift_hum_waveform.setflags(write=False)  # Shared by every rift hum, never copied
 
 # Crystal lock beeps (mid to high tones)
 lock_beep_duration = 0.3  # Duration for two tones
@@ -1563,34 +1665,64 @@ t_high = np.linspace(0, lock_beep_duration / 2, lock_beep_samples - half)
 lock_beep_waveform = np.concatenate((
     0.2 * np.sin(2 * np.pi * mid_freq * t_mid),
     0.2 * np.sin(2 * np.pi * high_freq * t_high)
-))
+)).astype(np.float32)
 
 # Approaching lock beeps (mid tones, repeated)
 approaching_beep_duration = 0.15  # Short for repeating
 approaching_freq = 600
 approaching_beep_samples = int(approaching_beep_duration * SAMPLE_RATE)
-approaching_beep_waveform = 0.2 * np.sin(2 * np.pi * approaching_freq * np.linspace(0, approaching_beep_duration, approaching_beep_samples))
+approaching_beep_waveform = (0.2 * np.sin(2 * np.pi * approaching_freq * np.linspace(0, approaching_beep_duration, approaching_beep_samples))).astype(np.float32)
 
 # Nebula dissonant rumble
 dissonant_duration = 1.0
 dissonant_freq = 40.0
 t_diss = np.linspace(0, dissonant_duration, int(dissonant_duration * SAMPLE_RATE))
 noise = np.random.rand(len(t_diss)) * 0.5 - 0.25  # Random noise
-dissonant_waveform = 0.1 * (np.sin(2 * np.pi * dissonant_freq * t_diss) + noise)
+dissonant_waveform = (0.1 * (np.sin(2 * np.pi * dissonant_freq * t_diss) + noise)).astype(np.float32)
 
 # New: Perfect resonance ping
 ping_duration = 0.2
 ping_freq = 1200
 t_ping = np.linspace(0, ping_duration, int(ping_duration * SAMPLE_RATE))
-ping_waveform = 0.2 * np.sin(2 * np.pi * ping_freq * t_ping) * np.exp(-t_ping / 0.05)  # Exponential decay for ping effect
+ping_waveform = (0.2 * np.sin(2 * np.pi * ping_freq * t_ping) * np.exp(-t_ping / 0.05)).astype(np.float32)  # Exponential decay for ping effect
+
+# New: Sing-mode heartbeat pulses, one cycle each, cached by frequency rounded to 0.01 Hz
+heartbeat_waveforms = {}
+
+def get_heartbeat_waveform(heartbeat_freq):
+    key = round(heartbeat_freq, 2)
+    if key not in heartbeat_waveforms:
+        heartbeat_waveforms[key] = np.sin(2 * np.pi * key * np.linspace(0, 1 / key, int(SAMPLE_RATE / key))).astype(np.float32)
+    return heartbeat_waveforms[key]
 
 # Audio setup
 audio_time = 0.0
+# Drive oscillators: per-dimension, per-harmonic phase in cycles [0, 1), advanced by each callback
+drive_phase = np.zeros((N_DIMENSIONS, 3))
+DRIVE_HARMONIC_RATIOS = PHI ** np.arange(3)  # Harmonic k sits at PHI**k times the base drive tone
+DRIVE_HARMONIC_GAINS = 1 / np.arange(1, 4)  # Harmonic k is mixed at 1/(k+1)
+SINE_LUT_SIZE = 1 << 14
+SINE_LUT = np.sin(2 * np.pi * np.arange(SINE_LUT_SIZE + 1) / SINE_LUT_SIZE)  # One period plus a wrap sample for interpolation
+# Fixed-pitch background tones (Schumann carrier, ambient tone, ambient swell), read from SINE_LUT by phase accumulator
+BED_FREQS = np.array([SCHUMANN_FREQ, 30 * PHI, 0.1 * PHI])
+BED_INC = BED_FREQS / SAMPLE_RATE  # Cycles per sample
+bed_phase = np.zeros(len(BED_FREQS))
 master_volume = config.getfloat('Audio', 'master_volume', fallback=0.2)
 beep_volume = config.getfloat('Audio', 'beep_volume', fallback=0.3)
 effect_volume = config.getfloat('Audio', 'effect_volume', fallback=0.2)
 drive_volume = config.getfloat('Audio', 'drive_volume', fallback=0.05)
-active_sound_effects = []
+# Playing effects, held as an insertion-ordered dict used as a set: O(1) add, membership and removal
+active_sound_effects = {}
+power_chord_effect = None  # Chord started by the audio callback while power is built up
+
+# Start playing a sound effect
+def play_sound_effect(effect):
+    active_sound_effects[effect] = None
+    return effect
+
+# Stop a sound effect if it is still playing
+def stop_sound_effect(effect):
+    active_sound_effects.pop(effect, None)
 
 # === SUBTLE PHASE-MOD VIBRATO FOR R-DRIVE TONES ===
 # Depth and speed scale with resonance — the better you tune, the richer and more alive it sings
@@ -1599,103 +1731,211 @@ VIBRATO_DEPTH_MAX = 1.1      # Max phase depth when perfectly tuned
 VIBRATO_RATE_BASE = 3.4      # Base LFO speed in Hz (nice slow golden pulse)
 VIBRATO_RATE_MAX = 4.3       # Slightly faster when in perfect harmony
 
-def get_vibrato_phase(t, resonance_level):
+def get_vibrato_phase(t, resonance_level, out=None, work=None):
     """
     Returns a phase offset array that gets deeper and slightly faster with higher resonance
-    resonance_level: 0.0 → 1.0 (use per-dimension or average)
+    resonance_level: 0.0 → 1.0 (use per-dimension or average; an (N, 1) column gives one row per dimension)
+    out, work: optional preallocated arrays of the result shape (the audio callback passes scratch space)
     """
     depth = VIBRATO_DEPTH_BASE + (VIBRATO_DEPTH_MAX - VIBRATO_DEPTH_BASE) * resonance_level
     rate = VIBRATO_RATE_BASE + (VIBRATO_RATE_MAX - VIBRATO_RATE_BASE) * resonance_level**2
+    if out is None:
+        out = np.empty(np.broadcast(rate, t).shape)
+        work = np.empty_like(out)
     # Two layered LFOs at golden-ratio intervals for organic beating
-    lfo1 = np.sin(2 * np.pi * rate * t)
-    lfo2 = np.sin(2 * np.pi * rate * PHI * t) * 0.3
-    return depth * (lfo1 + lfo2)
+    np.multiply(TWO_PI * rate, t, out=out)
+    np.multiply(out, PHI, out=work)
+    np.sin(out, out=out)  # lfo1
+    np.sin(work, out=work)
+    work *= 0.3  # lfo2
+    out += work
+    out *= depth
+    return out
+
+# Preallocated scratch space for the audio callback, so steady-state callbacks allocate no sample buffers
+# (rebuilt only if PortAudio asks for a larger block than any before)
+class AudioScratch:
+    def __init__(self, frames):
+        self.capacity = frames
+        self.sample_index = np.arange(frames, dtype=float)
+        self.t = np.empty(frames)
+        self.two_pi_t = np.empty(frames)
+        self.tmp = np.empty(frames)
+        self.left = np.empty(frames)
+        self.right = np.empty(frames)
+        self.segment = np.empty(frames)
+        self.effect_pos = np.empty(frames)  # Fractional read positions of a pitched effect
+        self.effect_idx = np.empty(frames, dtype=np.int64)
+        self.effect_segment = np.empty(frames, dtype=np.float32)  # Effect waveforms are float32
+        self.signals = np.empty((N_DIMENSIONS, frames))
+        self.vibrato = np.empty((N_DIMENSIONS, frames))
+        self.vibrato_work = np.empty((N_DIMENSIONS, frames))
+        self.cycles = np.empty((N_DIMENSIONS, 3, frames))
+        self.frac = np.empty((N_DIMENSIONS, 3, frames))
+        self.sines = np.empty((N_DIMENSIONS, 3, frames))
+        self.lut_idx = np.empty((N_DIMENSIONS, 3, frames), dtype=np.int64)
+        self.bed_cycles = np.empty((len(BED_FREQS), frames))
+        self.bed_frac = np.empty((len(BED_FREQS), frames))
+        self.bed = np.empty((len(BED_FREQS), frames))
+        self.bed_idx = np.empty((len(BED_FREQS), frames), dtype=np.int64)
+
+audio_scratch = AudioScratch(4096)
+# Stereo placement of the drive dimensions: x left, y center, z right, higher dims mixed
+DRIVE_PAN_LEFT = np.array([1.0, 0.5, 0.0, 0.7, 0.3])
+DRIVE_PAN_RIGHT = np.array([0.0, 0.5, 1.0, 0.3, 0.7])
+
+# sin(2*pi*cycles) into out by linear interpolation in SINE_LUT; cycles, frac and lut_idx are scratch of the same shape
+def lut_sine(cycles, frac, lut_idx, out):
+    cycles *= SINE_LUT_SIZE
+    np.floor(cycles, out=frac)
+    np.copyto(lut_idx, frac, casting='unsafe')
+    np.subtract(cycles, frac, out=frac)
+    lut_idx &= SINE_LUT_SIZE - 1
+    # out = lut[i] + frac * (lut[i + 1] - lut[i]), reusing cycles for lut[i + 1]
+    np.take(SINE_LUT, lut_idx, out=out)
+    lut_idx += 1
+    np.take(SINE_LUT, lut_idx, out=cycles)
+    cycles -= out
+    cycles *= frac
+    out += cycles
+    return out
+
+# Per-sample phase step, in cycles, of each drive harmonic: (N_DIMENSIONS, 3)
+def drive_phase_increments(r_drive):
+    return (r_drive * (0.5 / SAMPLE_RATE))[:, None] * DRIVE_HARMONIC_RATIOS
+
+# Drive oscillator bank: plain arrays in, (N_DIMENSIONS, frames) signals out (a view of scratch), advancing drive_phase
+def render_drive_signals(r_drive, f_target, resonance_width, volume, t, two_pi_t, scratch):
+    # All dimensions at once — now with subtle phase-mod vibrato
+    frames = len(t)
+    # Per-dimension resonance (makes vibrato respond to how well that dim is tuned)
+    res_levels = 1 / (1 + ((r_drive - f_target) / resonance_width)**2)
+    # Subtle vibrato as phase modulation (added to phase, not multiplied), one row per dimension, in cycles
+    vibrato_cycles = get_vibrato_phase(t, res_levels[:, None], out=scratch.vibrato[:, :frames], work=scratch.vibrato_work[:, :frames])
+    vibrato_cycles *= 1 / TWO_PI
+    # Keep original 3 harmonics: phase accumulators read through the sine table, summed with 1/(k+1) gains
+    inc = drive_phase_increments(r_drive)
+    lut_pos = scratch.cycles[:, :, :frames]
+    np.multiply(inc[:, :, None], scratch.sample_index[:frames], out=lut_pos)
+    lut_pos += drive_phase[:, :, None]
+    lut_pos += vibrato_cycles[:, None, :]
+    sines = lut_sine(lut_pos, scratch.frac[:, :, :frames], scratch.lut_idx[:, :, :frames], scratch.sines[:, :, :frames])
+    drive_phase[:] = (drive_phase + inc * frames) % 1.0  # Phase stays continuous when drive frequencies change
+    signals = scratch.signals[:, :frames]
+    np.einsum('dkf,k->df', sines, volume * DRIVE_HARMONIC_GAINS, out=signals)
+    # Add modulation to higher dimensions
+    mod = scratch.tmp[:frames]
+    np.multiply(two_pi_t, 0.5 * PHI, out=mod)
+    np.sin(mod, out=mod)
+    mod *= 0.05
+    mod += 1
+    signals[3:] *= mod
+    return signals
 
 # Audio callback for generating sound
 def audio_callback(outdata, frames, time, status):
     # Global audio time tracking
-    global audio_time
-    t = (np.arange(frames) / SAMPLE_RATE) + audio_time
+    global audio_time, audio_scratch, power_chord_effect
+    if frames > audio_scratch.capacity:
+        audio_scratch = AudioScratch(frames)
+    scratch = audio_scratch
+    t = scratch.t[:frames]
+    np.divide(scratch.sample_index[:frames], SAMPLE_RATE, out=t)
+    t += audio_time
     audio_time += frames / SAMPLE_RATE
+    two_pi_t = np.multiply(TWO_PI, t, out=scratch.two_pi_t[:frames])  # Shared angular-time ramp: each oscillator below is sin(two_pi_t * f + phase)
+
+    # Background tones in one table lookup: rows are the Schumann carrier, ambient tone and ambient swell
+    bed_cycles = np.multiply(BED_INC[:, None], scratch.sample_index[:frames], out=scratch.bed_cycles[:, :frames])
+    bed_cycles += bed_phase[:, None]
+    schumann_wave, ambient_signal, modulation = lut_sine(bed_cycles, scratch.bed_frac[:, :frames], scratch.bed_idx[:, :frames], scratch.bed[:, :frames])
+    bed_phase[:] = (bed_phase + BED_INC * frames) % 1.0
 
     # New: Silent Schumann carrier wave
-    schumann_wave = SCHUMANN_VOLUME * np.sin(2 * np.pi * SCHUMANN_FREQ * t)
-
-    # Generate drive signals per dimension — now with subtle phase-mod vibrato
-    signals = np.zeros((N_DIMENSIONS, frames))
-    for i in range(N_DIMENSIONS):
-        base_freq = ship.r_drive[i] / 2
-        
-        # Per-dimension resonance (makes vibrato respond to how well that dim is tuned)
-        delta_f = ship.r_drive[i] - ship.f_target[i]
-        res_level = 1 / (1 + (delta_f / ship.resonance_width)**2)
-        
-        # Subtle vibrato as phase modulation (added to phase, not multiplied)
-        vibrato_phase = get_vibrato_phase(t, res_level)
-        
-        for k in range(3):  # Keep original 3 harmonics
-            signals[i] += (drive_volume / (k+1)) * np.sin(2 * np.pi * (base_freq * PHI**k) * t + vibrato_phase)
-        
-        # Add modulation to higher dimensions
-        if i >= 3:
-            mod_freq = 0.5 * PHI
-            mod = np.sin(2 * np.pi * mod_freq * t) * 0.05
-            signals[i] *= (1 + mod)
-
-    # Pan signals: x left, y center, z right, higher dims mixed
-    left_signal = signals[0] + signals[1] * 0.5 + signals[3] * 0.7 + signals[4] * 0.3
-    right_signal = signals[2] + signals[1] * 0.5 + signals[3] * 0.3 + signals[4] * 0.7
+    schumann_wave *= SCHUMANN_VOLUME
+
+    left_signal = scratch.left[:frames]
+    right_signal = scratch.right[:frames]
+    if drive_volume < 1e-6:
+        # Drive muted: skip the oscillator bank, keeping its phases running so unmuting stays click-free
+        drive_phase[:] = (drive_phase + drive_phase_increments(ship.r_drive.copy()) * frames) % 1.0
+        left_signal.fill(0)
+        right_signal.fill(0)
+    else:
+        # Generate drive signals from a snapshot of the ship's tuning (the frame loop may retune mid-callback)
+        signals = render_drive_signals(ship.r_drive.copy(), ship.f_target.copy(), ship.resonance_width, drive_volume, t, two_pi_t, scratch)
+        # Pan signals: x left, y center, z right, higher dims mixed
+        np.dot(DRIVE_PAN_LEFT, signals, out=left_signal)
+        np.dot(DRIVE_PAN_RIGHT, signals, out=right_signal)
 
     # Add ambient modulation
-    modulation = 0.5 + 0.5 * np.sin(2 * np.pi * 0.1 * PHI * t)
-    ambient_signal = 0.01 * modulation * np.sin(2 * np.pi * 30 * PHI * t)
+    modulation *= 0.5
+    modulation += 0.5
+    ambient_signal *= modulation
+    ambient_signal *= 0.01
     left_signal += ambient_signal
     right_signal += ambient_signal
 
-    # Add power chord if power buildup high
-    power_condition = not ship.landed_mode and any(ship.resonance_power[i] > POWER_BUILD_TIME - 1 for i in range(N_DIMENSIONS))
-    chord_effects = [e for e in active_sound_effects if np.array_equal(e.waveform, chord_waveform)]
+    # Add power chord if power buildup high (condition cached once per frame by refresh_frame_stats)
+    power_condition = ship.power_chord_active
     if power_condition:
-        if not chord_effects:
-            active_sound_effects.append(SoundEffect(chord_waveform, pan=0.0, volume=effect_volume))
-    elif chord_effects:
-        for e in chord_effects:
-            active_sound_effects.remove(e)
+        if power_chord_effect not in active_sound_effects:
+            power_chord_effect = play_sound_effect(SoundEffect(chord_waveform, pan=0.0, volume=effect_volume))
+    elif power_chord_effect is not None:
+        stop_sound_effect(power_chord_effect)
+        power_chord_effect = None
 
     # Add rift charge rising tone
     if ship.rift_charge_timer > 0:
         charge_progress = (RIFT_CHARGE_TIME - ship.rift_charge_timer) / RIFT_CHARGE_TIME
         charge_freq = 220 + 660 * charge_progress  # Rise from low to high
-        charge_wave = 0.1 * np.sin(2 * np.pi * charge_freq * t) * effect_volume
+        charge_wave = np.multiply(two_pi_t, charge_freq, out=scratch.tmp[:frames])
+        np.sin(charge_wave, out=charge_wave)
+        charge_wave *= 0.1 * effect_volume
         left_signal += charge_wave
         right_signal += charge_wave
 
-    # Mix active sound effects
-    for effect in active_sound_effects[:]:
+    # Mix active sound effects (iterate a snapshot: the game thread may start or stop effects mid-callback,
+    # and finished effects are dropped with an O(1) dict pop, so no index bookkeeping is needed)
+    for effect in list(active_sound_effects):
         if effect.position < len(effect.waveform):
-            segment = effect.waveform[effect.position : effect.position + frames]
-            if len(segment) < frames:
-                segment = np.pad(segment, (0, frames - len(segment)), 'constant')
-            left_volume = np.sqrt((1 - effect.pan) / 2) * effect.volume
-            right_volume = np.sqrt((1 + effect.pan) / 2) * effect.volume
-            left_signal += segment * left_volume
-            right_signal += segment * right_volume
-            effect.position += frames
+            if effect.pitch == 1.0:
+                start = int(effect.position)
+                avail = min(frames, len(effect.waveform) - start)
+                if avail == frames:
+                    segment = effect.waveform[start : start + frames]
+                else:
+                    # Tail of the waveform: copy what is left into scratch and zero the rest
+                    segment = scratch.segment[:frames]
+                    segment[:avail] = effect.waveform[start:]
+                    segment[avail:] = 0.0
+                effect.position = start + frames
+            else:
+                # Step through the shared waveform at pitch samples per frame, silent past the end
+                positions = np.multiply(scratch.sample_index[:frames], effect.pitch, out=scratch.effect_pos[:frames])
+                positions += effect.position
+                idx = scratch.effect_idx[:frames]
+                np.copyto(idx, positions, casting='unsafe')  # Truncate to the sample at or before each position
+                segment = np.take(effect.waveform, idx, mode='clip', out=scratch.effect_segment[:frames])
+                segment[np.searchsorted(positions, len(effect.waveform)):] = 0.0
+                effect.position += frames * effect.pitch
+            weighted = scratch.tmp[:frames]
+            np.multiply(segment, effect.left_gain, out=weighted)
+            left_signal += weighted
+            np.multiply(segment, effect.right_gain, out=weighted)
+            right_signal += weighted
         if effect.position >= len(effect.waveform):
             if effect.loop:
-                effect.position = 0
+                effect.position %= 1.0  # Restart, keeping a pitched effect's fractional phase
             else:
-                active_sound_effects.remove(effect)
-
-    # Apply master volume and clip
-    left_signal *= master_volume
-    right_signal *= master_volume
-    # Add Schumann to final output
-    left_signal += schumann_wave
-    right_signal += schumann_wave
-    signal = np.stack((left_signal, right_signal), axis=1)
-    signal = np.clip(signal, -1.0, 1.0)
-    outdata[:] = signal
+                stop_sound_effect(effect)
+
+    # Apply master volume and add Schumann straight into the output channels, then clip in place
+    np.multiply(left_signal, master_volume, out=outdata[:, 0])
+    np.multiply(right_signal, master_volume, out=outdata[:, 1])
+    outdata[:, 0] += schumann_wave
+    outdata[:, 1] += schumann_wave
+    np.clip(outdata, -1.0, 1.0, out=outdata)
 
 # Start audio stream
 stream = sd.OutputStream(callback=audio_callback, channels=2, samplerate=SAMPLE_RATE)
@@ -1708,6 +1948,79 @@ last_beep_time = -1.0
 next_click_time = 0.0
 last_spoken = {}
 
+# Save/load worker: keeps pickle and disk I/O off the frame loop, handling requests in the order they were made
+save_load_requests = queue.Queue()  # ('save', state) or ('load', None)
+loaded_games = queue.Queue()  # States read from disk, applied by update_loop
+# Every key Ship.apply_loaded_game reads; a save missing any of them is rejected by the worker
+SAVE_STATE_KEYS = ('position', 'velocity', 'r_drive', 'base_f_target', 'resonance_integrity', 'crystals_collected',
+                   'resonance_width', 'max_velocity', 'crystal_bonus', 'golden_harmony_active',
+                   'star_positions', 'planet_positions', 'nebula_positions', 'star_freqs', 'planet_freqs',
+                   'nebula_freqs', 'rifts')
+
+# Pickle with protocol 5, writing array data out-of-band as raw bytes after the payload
+def write_save_file(state):
+    buffers = []
+    payload = pickle.dumps(state, protocol=5, buffer_callback=buffers.append)
+    views = [buffer.raw() for buffer in buffers]
+    with open(SAVE_FILE, 'wb') as f:
+        f.write(SAVE_MAGIC)
+        pickle.dump((len(payload), [view.nbytes for view in views]), f, protocol=5)
+        f.write(payload)
+        for view in views:
+            f.write(view)
+
+# Read the newest save, falling back to a legacy plain-pickle save when none has been written in the new format
+def read_save_file():
+    path = SAVE_FILE if os.path.exists(SAVE_FILE) else LEGACY_SAVE_FILE
+    with open(path, 'rb') as f:
+        if f.read(len(SAVE_MAGIC)) != SAVE_MAGIC:
+            f.seek(0)
+            return upgrade_legacy_save(pickle.load(f))
+        payload_size, buffer_sizes = pickle.load(f)
+        payload = f.read(payload_size)
+        buffers = [bytearray(f.read(size)) for size in buffer_sizes]  # Writable, so loaded arrays can be updated in place
+    return pickle.loads(payload, buffers=buffers)
+
+# Convert a legacy save's body lists into the position/frequency arrays apply_loaded_game expects
+def upgrade_legacy_save(state):
+    if not isinstance(state, dict) or not all(key in state for key in ('stars', 'planets', 'nebulae')):
+        return state  # Rejected by the SAVE_STATE_KEYS check
+    for key in ('position', 'velocity', 'r_drive', 'base_f_target'):
+        if key in state:
+            state[key] = np.array(state[key], dtype=float)  # The modular ship.py stores some of these as lists
+    for category in ('star', 'planet', 'nebula'):
+        bodies = state.pop('nebulae' if category == 'nebula' else category + 's')
+        state[category + '_positions'] = stack_positions(bodies)
+        state[category + '_freqs'] = np.array([body['freq'] for body in bodies], dtype=float)
+    state['rifts'] = [{k: v for k, v in rift.items() if k != 'sound'} for rift in state.get('rifts', [])]
+    return state
+
+def save_load_worker():
+    while True:
+        action, state = save_load_requests.get()
+        if action == 'save':
+            try:
+                write_save_file(state)
+            except OSError:  # Permission denied, disk full, locked file; keep the worker alive for later saves
+                speak_with_cooldown("Save failed.")
+            else:
+                speak_with_cooldown("Game saved.")
+        else:
+            try:
+                state = read_save_file()
+            except FileNotFoundError:
+                speak_with_cooldown("No save file found.")
+            except (OSError, EOFError, ValueError, KeyError, TypeError, AttributeError, ImportError,
+                    pickle.UnpicklingError):  # Unreadable, truncated or corrupt save
+                speak_with_cooldown("Save file could not be read.")
+            else:
+                if isinstance(state, dict) and all(key in state for key in SAVE_STATE_KEYS):
+                    loaded_games.put(state)
+                else:  # Missing fields would raise KeyError in apply_loaded_game on the main thread
+                    speak_with_cooldown("Save file could not be read.")
+
+threading.Thread(target=save_load_worker, daemon=True).start()
+
 # Speak with cooldown to prevent repetition
 def speak_with_cooldown(msg):
     # Speak message if cooldown elapsed
@@ -1716,27 +2029,82 @@ def speak_with_cooldown(msg):
         tolk.speak(msg)
         last_spoken[msg] = simulation_time
 
+# Speak a templated message, formatting it only if its cooldown has elapsed
+def speak_lazy(template, *args, cooldown_key=None):
+    # Cooldown is keyed on the template (or cooldown_key, e.g. per dimension), so a burst of the same alert
+    # with changing values speaks once per window
+    key = template if cooldown_key is None else cooldown_key
+    if key not in last_spoken or simulation_time - last_spoken[key] > SPEECH_COOLDOWN:
+        tolk.speak(template.format(*args))
+        last_spoken[key] = simulation_time
+
+# Cosine and sine of the last view rotation projected; the view only changes on rotation input or auto-rotate
+view_trig_cache = [0.0, 1.0, 0.0]
+
+def rotation_trig(rotation):
+    if rotation != view_trig_cache[0]:
+        view_trig_cache[:] = rotation, math.cos(rotation), math.sin(rotation)
+    return view_trig_cache[1], view_trig_cache[2]
+
+# View rotation that centers dir_vec in the x/w projection plane (keeps the current rotation if dir_vec has no x/w extent)
+def centering_rotation(dir_vec, rotation):
+    # atan2 already puts the target on the positive projected axis: dir·(cos, sin) = hypot(x, w) >= 0
+    if math.hypot(dir_vec[0], dir_vec[3]) > 1e-6:
+        return math.atan2(dir_vec[3], dir_vec[0])
+    return rotation
+
 # Project 5D position to 2D screen
 def project_to_2d(pos, rotation):
     # Project higher dimensions into 2D using rotation
-    cos_r = np.cos(rotation)
-    sin_r = np.sin(rotation)
-    x = pos[0] * cos_r + pos[3] * sin_r
-    y = pos[1] * cos_r + pos[4] * sin_r
-    screen_x = (x + 100) / 200 * SCREEN_WIDTH
-    screen_y = (y + 100) / 200 * SCREEN_HEIGHT
-    return (int(screen_x), int(screen_y))
+    cos_r, sin_r = rotation_trig(rotation)
+    coords = pos.tolist()  # Plain floats, so the arithmetic below never touches NumPy scalars
+    x = coords[0] * cos_r + coords[3] * sin_r
+    y = coords[1] * cos_r + coords[4] * sin_r
+    return (int((x + 100) * SCALE_X), int((y + 100) * SCALE_Y))
+
+# Project an (N, N_DIMENSIONS) array of positions to 2D screen coordinates in one pass
+def project_many_to_2d(points, rotation):
+    # Same mapping as project_to_2d, returned as an (N, 2) int array
+    cos_r, sin_r = rotation_trig(rotation)
+    x = points[:, 0] * cos_r + points[:, 3] * sin_r
+    y = points[:, 1] * cos_r + points[:, 4] * sin_r
+    screen = np.empty((len(points), 2))
+    screen[:, 0] = (x + 100) * SCALE_X
+    screen[:, 1] = (y + 100) * SCALE_Y
+    return screen.astype(int)
+
+# Display hue in [0, 360) for an (N, N_DIMENSIONS) array of positions, from their two hidden dimensions
+def body_hues(points):
+    return np.mod((points[:, 3] + points[:, 4]) / 200 * 360, 360)
+
+# Draw color per body: looked up by whole-degree hue bucket, or the flat high-contrast color
+def body_colors(points, lut, high_contrast_color):
+    if ship.high_contrast:
+        return [high_contrast_color] * len(points)
+    # The modulo catches a hue that rounded up to 360.0
+    return [lut[h] for h in (body_hues(points).astype(int) % 360).tolist()]
+
+# Rendered text surface for a font, string and color; HUD and menu lines repeat across frames, so glyphs rasterize once
+# (keyed on the font object itself, so resizing the HUD text never serves a surface from the old size)
+@functools.lru_cache(maxsize=256)
+def render_text(text_font, text, color):
+    return text_font.render(text, True, color)
+
+# Everything the last drawn frame depended on; update_loop skips drawing while it is unchanged
+last_render_key = None
 
 # Main update loop
 def update_loop():
     # Global timing and volume
-    global simulation_time, last_beep_time, next_click_time, master_volume
+    global simulation_time, last_beep_time, next_click_time, master_volume, last_render_key
     dt = clock.tick(FPS) / 1000.0
     simulation_time += dt
 
     # Handle events
     events = pygame.event.get()
     for event in events:
+        if event.type in REDRAW_EVENTS:
+            last_render_key = None  # Force a full redraw this frame
         if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
             speak_with_cooldown("Shutting down.")
             # Save config before quitting
@@ -1760,45 +2128,61 @@ def update_loop():
             tolk.unload()
             exit()
 
+    # Apply any game state the save/load worker has finished reading
+    while not loaded_games.empty():
+        ship.apply_loaded_game(loaded_games.get_nowait())
+
     # Get keys and update ship
     keys = pygame.key.get_pressed()
     ship.handle_input(keys, events)
     ship.update(dt, celestial_bodies, keys)
+    ship.refresh_frame_stats()
 
     # Add periodic click sound based on resonance (only when not landed)
     if not ship.landed_mode:
-        avg_resonance = np.mean(ship.resonance_levels)
+        avg_resonance = ship.avg_resonance
         click_interval = max(0.1, 1.0 - avg_resonance)
         current_time = pygame.time.get_ticks() / 1000.0
         if current_time > next_click_time:
-            active_sound_effects.append(SoundEffect(click_waveform, pan=0.0, volume=effect_volume))
+            play_sound_effect(SoundEffect(click_waveform, pan=0.0, volume=effect_volume))
             next_click_time = current_time + click_interval
 
+    # Pick the menu or HUD text for this frame
+    if ship.hud_mode or ship.upgrade_mode or ship.starmap_mode or ship.rift_selection_mode:
+        if ship.rift_selection_mode:
+            items = [item['label'] for item in ship.rift_items]
+            index = ship.rift_selection_index
+        elif ship.starmap_mode:
+            items = [item['label'] for item in ship.starmap_items]
+            index = ship.starmap_index
+        else:
+            items = ship.hud_items
+            index = ship.hud_index
+    else:
+        ship.update_hud_items()
+        items = ship.hud_items
+        index = None  # Plain HUD: no highlighted line
+
+    # Skip the redraw and flip when nothing on screen would change (e.g. menus open or drifting with a static HUD)
+    render_key = (ship.position.tobytes(), ship.heading, ship.view_rotation, ship.landed_mode, ship.high_contrast, ship.hud_text_size,
+                  id(star_positions), tuple(rift['pos'].tobytes() for rift in ship.rifts),
+                  tuple(pos.tobytes() for pos in ship.crystal_positions), ship.cursor_pos.tobytes(), tuple(items), index)
+    if render_key == last_render_key:
+        return
+    last_render_key = render_key
+
     # Render screen
     bg_color = (0, 0, 0) if not ship.high_contrast else (255, 255, 255)
     text_color = (255, 255, 255) if not ship.high_contrast else (0, 0, 0)
     screen.fill(bg_color)
 
-    # Draw stars
-    for body in stars:
-        pos_2d = project_to_2d(body['pos'], ship.view_rotation)
-        hue = (((body['pos'][3] + body['pos'][4]) / 200 * 360) % 360 + 360) % 360
-        color = pygame.Color(0)
-        color.hsva = (hue, 100, 100, 100) if not ship.high_contrast else (0, 0, 0, 100)
+    # Draw stars, planets and nebulae: each category is projected and hued in one batched pass
+    rotation = ship.view_rotation
+    for pos_2d, color in zip(project_many_to_2d(star_positions, rotation).tolist(), body_colors(star_positions, HUE_LUT, HIGH_CONTRAST_BODY_COLOR)):
         pygame.draw.circle(screen, color, pos_2d, 2)
-    # Draw planets
-    for body in planets:
-        pos_2d = project_to_2d(body['pos'], ship.view_rotation)
-        hue = (((body['pos'][3] + body['pos'][4]) / 200 * 360) % 360 + 360) % 360
-        color = pygame.Color(0)
-        color.hsva = (hue, 100, 100, 100) if not ship.high_contrast else (0, 0, 0, 100)
+    for pos_2d, color in zip(project_many_to_2d(planet_positions, rotation).tolist(), body_colors(planet_positions, HUE_LUT, HIGH_CONTRAST_BODY_COLOR)):
         pygame.draw.circle(screen, color, pos_2d, PLANET_RADIUS)
-    # Draw nebulae
-    for body in nebulae:
-        pos_2d = project_to_2d(body['pos'], ship.view_rotation)
-        hue = (((body['pos'][3] + body['pos'][4]) / 200 * 360) % 360 + 360) % 360
-        color = pygame.Color(0)
-        color.hsva = (hue, 50, 100, 50) if not ship.high_contrast else (0, 0, 0, 50)
+    for pos_2d, color in zip(project_many_to_2d(nebula_positions, rotation).tolist(), body_colors(nebula_positions, NEBULA_HUE_LUT, HIGH_CONTRAST_NEBULA_COLOR)):
         pygame.draw.circle(screen, color, pos_2d, 15)
 
     # Draw rifts
@@ -1817,53 +2201,32 @@ def update_loop():
         pygame.draw.line(screen, (255, 0, 0), (cursor_x - 5, cursor_y), (cursor_x + 5, cursor_y))
         pygame.draw.line(screen, (255, 0, 0), (cursor_x, cursor_y - 5), (cursor_x, cursor_y + 5))
     else:
-        # Draw golden spiral for ship visualization
-        max_r = 20
-        theta_max = 6 * np.pi
-        a = max_r / (PHI ** (2 * theta_max / np.pi))
-        theta = np.linspace(0, theta_max, 100)
-        r = a * PHI ** (2 * theta / np.pi)
-        x = r * np.cos(theta + ship.heading)
-        y = r * np.sin(theta + ship.heading)
+        # Draw golden spiral for ship visualization (fixed geometry, only the heading turns it)
+        angle = SPIRAL_THETA + ship.heading
+        x = SPIRAL_R * np.cos(angle)
+        y = SPIRAL_R * np.sin(angle)
         spiral_points = np.tile(ship.position, (100, 1))
         spiral_points[:, 0] += x
         spiral_points[:, 1] += y
-        screen_points = [project_to_2d(p, ship.view_rotation) for p in spiral_points]
+        screen_points = project_many_to_2d(spiral_points, rotation).tolist()
         pygame.draw.lines(screen, (255, 255, 0) if not ship.high_contrast else (0, 0, 255), False, screen_points, 2)
 
         # Draw engine points on spiral
-        theta_engines = np.array([theta_max - i * (np.pi / PHI) for i in range(3)])
-        r_engines = a * PHI ** (2 * theta_engines / np.pi)
-        x_engines = r_engines * np.cos(theta_engines + ship.heading)
-        y_engines = r_engines * np.sin(theta_engines + ship.heading)
+        engine_angle = ENGINE_THETA + ship.heading
+        x_engines = ENGINE_R * np.cos(engine_angle)
+        y_engines = ENGINE_R * np.sin(engine_angle)
         engine_points = np.tile(ship.position, (3, 1))
         engine_points[:, 0] += x_engines
         engine_points[:, 1] += y_engines
-        screen_engine_points = [project_to_2d(p, ship.view_rotation) for p in engine_points]
+        screen_engine_points = project_many_to_2d(engine_points, rotation).tolist()
         for ep in screen_engine_points:
             pygame.draw.circle(screen, (255, 0, 0) if not ship.high_contrast else (0, 255, 0), ep, 5)
 
     # Render menu or HUD text
-    if ship.hud_mode or ship.upgrade_mode or ship.starmap_mode or ship.rift_selection_mode:
-        if ship.rift_selection_mode:
-            items = [item['label'] for item in ship.rift_items]
-            index = ship.rift_selection_index
-        elif ship.starmap_mode:
-            items = [item['label'] for item in ship.starmap_items]
-            index = ship.starmap_index
-        else:
-            items = ship.hud_items
-            index = ship.hud_index
-        for i, item in enumerate(items):
-            color = (0, 255, 0) if i == index else text_color
-            text = font.render(item, True, color)
-            screen.blit(text, (10, 10 + i * (ship.hud_text_size + 5)))
-    else:
-        ship.update_hud_items()
-        hud_lines = ship.hud_items
-        for i, line in enumerate(hud_lines):
-            text = font.render(line, True, text_color)
-            screen.blit(text, (10, 10 + i * (ship.hud_text_size + 5)))
+    for i, item in enumerate(items):
+        color = (0, 255, 0) if i == index else text_color
+        text = render_text(font, item, color)
+        screen.blit(text, (10, 10 + i * (ship.hud_text_size + 5)))
 
     pygame.display.flip()
 
@@ -1874,4 +2237,7 @@ async def main():
         await asyncio.sleep(1.0 / FPS)
 
 if __name__ == "__main__":
+    # Move everything built at startup (bodies, waveforms, caches) to the permanent generation, so collections
+    # triggered while the game runs never traverse it and stall the audio callback waiting on the GIL
+    gc.freeze()
     asyncio.run(main())
\ No newline at end of file
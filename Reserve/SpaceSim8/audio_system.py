@@ -6,16 +6,44 @@ waveform precomputation, vibrato effects, and the main audio callback
 for real-time sound synthesis.
 """
 
+import math
+
 import numpy as np
 import sounddevice as sd
 from constants import (
-    SAMPLE_RATE, PHI, N_DIMENSIONS, POWER_BUILD_TIME,
+    SAMPLE_RATE, AUDIO_BLOCKSIZE, PHI, N_DIMENSIONS,
     RIFT_CHARGE_TIME, ROTATION_SOUND_DURATION, SCHUMANN_FREQ,
     SCHUMANN_VOLUME, N_HARMONICS, HARMONIC_FALLOFF,
     SUBHARMONIC_DEPTH, INTERMOD_DEPTH, HARMONIC_RATIOS
 )
 
 
+# Stereo placement of the drive dimensions: x left, y center, z right, higher dims mixed
+DRIVE_PAN_LEFT = np.array([1.0, 0.5, 0.0, 0.7, 0.3])
+DRIVE_PAN_RIGHT = np.array([0.0, 0.5, 1.0, 0.3, 0.7])
+
+TWO_PI = 2 * np.pi  # Radians per cycle, for the audio hot path
+
+# Drive partials per dimension: fundamental, golden-ratio overtones PHI^1..PHI^3 and the 1/PHI subharmonic
+DRIVE_PARTIAL_RATIOS = np.array([1.0, PHI, PHI**2, PHI**3, 1 / PHI])
+DRIVE_PARTIAL_GAINS = np.array([1.0, 0.25, 0.25 / 2, 0.25 / 3, 0.15])  # Times drive volume
+N_OVERTONE_PARTIALS = 4  # Partials that take the full vibrato; the subharmonic takes half
+HIGH_DIM_MOD_FREQ = 0.5 * PHI  # Amplitude swell on dimensions 3 and up, in Hz
+
+# Harmonic ratio detection tables, in HARMONIC_RATIOS order, and every dimension pair (i < j)
+HARMONIC_NAMES = list(HARMONIC_RATIOS)
+HARMONIC_TARGETS = np.array(list(HARMONIC_RATIOS.values()))
+HARMONIC_TOLERANCES = HARMONIC_TARGETS * 0.02  # 2% tolerance
+PAIR_I, PAIR_J = np.triu_indices(N_DIMENSIONS, 1)
+
+# One period of sine plus a wrap sample, read with linear interpolation by the phase-accumulator oscillators
+SINE_LUT_SIZE = 1 << 14
+SINE_LUT = np.sin(TWO_PI * np.arange(SINE_LUT_SIZE + 1) / SINE_LUT_SIZE)
+
+# Fixed-pitch background tones (Schumann carrier, ambient tone, ambient swell), read from SINE_LUT by phase accumulator
+BED_FREQS = np.array([SCHUMANN_FREQ, 30 * PHI, 0.1 * PHI])
+BED_INC = BED_FREQS / SAMPLE_RATE  # Cycles per sample
+
 # Vibrato constants for phase-modulated drive tones
 VIBRATO_DEPTH_BASE = 0.25     # Base phase depth in radians (subtle wobble)
 VIBRATO_DEPTH_MAX = 1.1       # Max phase depth when perfectly tuned
@@ -23,6 +51,168 @@ VIBRATO_RATE_BASE = 3.4       # Base LFO speed in Hz (nice slow golden pulse)
 VIBRATO_RATE_MAX = 4.3        # Slightly faster when in perfect harmony
 
 
+def get_vibrato_phase(t, resonance_level, out=None, work=None):
+    """
+    Generate phase-modulated vibrato that responds to resonance quality.
+
+    The vibrato gets deeper and slightly faster with higher resonance,
+    creating a richer, more alive sound when properly tuned.
+
+    Args:
+        t: Time array (in seconds)
+        resonance_level: 0.0 to 1.0 (tuning quality); an (N, 1) array gives
+            one row of vibrato per level
+        out: Optional preallocated result array
+        work: Optional scratch of shape (2,) + out.shape; required with out
+
+    Returns:
+        Phase offset array to add to carrier wave
+    """
+    depth = VIBRATO_DEPTH_BASE + (VIBRATO_DEPTH_MAX - VIBRATO_DEPTH_BASE) * resonance_level
+    rate = VIBRATO_RATE_BASE + (VIBRATO_RATE_MAX - VIBRATO_RATE_BASE) * resonance_level**2
+    if out is None:
+        out = np.empty(np.broadcast(rate, t).shape)
+        work = np.empty((2,) + out.shape)
+
+    # Two layered LFOs at golden-ratio intervals for organic beating, in one sine pass
+    np.multiply(TWO_PI * rate, t, out=work[0])
+    np.multiply(work[0], PHI, out=work[1])
+    np.sin(work, out=work)
+    np.multiply(work[1], 0.3, out=out)
+    out += work[0]
+    out *= depth
+    return out
+
+
+def sample_times(n):
+    """
+    Return the times of the first n samples, i / SAMPLE_RATE.
+
+    The same grid the audio callback plays on, so precomputed waveforms and
+    live tones share one phase convention.
+
+    Args:
+        n: Number of samples
+
+    Returns:
+        Time array (in seconds)
+    """
+    return np.arange(n) / SAMPLE_RATE
+
+
+def lut_sine(cycles, frac, lut_idx, out):
+    """
+    Compute sin(2*pi*cycles) into out by linear interpolation in SINE_LUT.
+
+    Args:
+        cycles: Phase in cycles; used as scratch and clobbered
+        frac: Float scratch of the same shape
+        lut_idx: int64 scratch of the same shape
+        out: Output array of the same shape
+
+    Returns:
+        out
+    """
+    cycles *= SINE_LUT_SIZE
+    np.floor(cycles, out=frac)
+    np.copyto(lut_idx, frac, casting='unsafe')
+    np.subtract(cycles, frac, out=frac)
+    lut_idx &= SINE_LUT_SIZE - 1
+    # out = lut[i] + frac * (lut[i + 1] - lut[i]), reusing cycles for lut[i + 1]
+    np.take(SINE_LUT, lut_idx, out=out)
+    lut_idx += 1
+    np.take(SINE_LUT, lut_idx, out=cycles)
+    cycles -= out
+    cycles *= frac
+    out += cycles
+    return out
+
+
+def render_drive_signals(signals, t, sample_index, drive_phase, r_drive, f_target, resonance_width,
+                         drive_volume, vibrato, vibrato_work, partials, partial_frac, partial_idx, partial_sines,
+                         angle, work):
+    """
+    Synthesize the drive tone of every dimension into a preallocated buffer.
+
+    Works only on plain arrays and scalars, so the audio callback can hand it
+    a snapshot of the ship's tuning and its own scratch space. Each partial is a
+    phase-accumulator oscillator read from SINE_LUT, so retuning a drive changes
+    its pitch without a phase jump.
+
+    Args:
+        signals: (N_DIMENSIONS, frames) output buffer, overwritten
+        t: Time array (in seconds)
+        sample_index: 0..frames-1 as floats
+        drive_phase: (N_DIMENSIONS, len(DRIVE_PARTIAL_RATIOS)) phase in cycles, advanced in place
+        r_drive: Drive frequency per dimension
+        f_target: Target frequency per dimension
+        resonance_width: Resonance bandwidth in Hz
+        drive_volume: Drive volume multiplier
+        vibrato: (N_DIMENSIONS, frames) float scratch
+        vibrato_work: (2, N_DIMENSIONS, frames) float scratch
+        partials, partial_frac, partial_sines: (len(DRIVE_PARTIAL_RATIOS), frames) float scratch
+        partial_idx: (len(DRIVE_PARTIAL_RATIOS), frames) int64 scratch
+        angle, work: (frames,) scratch buffers
+    """
+    frames = len(t)
+
+    # Per-dimension resonance (makes vibrato respond to how well that dim is tuned),
+    # and the vibrato of every dimension at once as phase modulation, in cycles
+    res_level = 1 / (1 + ((r_drive - f_target) / resonance_width)**2)
+    get_vibrato_phase(t, res_level[:, None], out=vibrato, work=vibrato_work)
+    vibrato *= 1 / TWO_PI
+
+    # Cycles per sample of every partial of every dimension (drive tones sound an octave below r_drive),
+    # and the partial gains, both fixed for the whole block
+    inc = np.multiply.outer(r_drive / (2 * SAMPLE_RATE), DRIVE_PARTIAL_RATIOS)
+    gains = drive_volume * DRIVE_PARTIAL_GAINS
+
+    for i in range(N_DIMENSIONS):
+        # All partials in one table lookup, then mixed with their gains:
+        # pure sine fundamental - clean and lifelike, golden ratio overtones for organic
+        # shimmer without harsh sawtooth harmonics, and a 1/PHI subharmonic for warmth
+        np.multiply(inc[i][:, None], sample_index, out=partials)
+        partials += drive_phase[i][:, None]
+        partials[:N_OVERTONE_PARTIALS] += vibrato[i]
+        np.multiply(vibrato[i], 0.5, out=work)
+        partials[N_OVERTONE_PARTIALS] += work
+        lut_sine(partials, partial_frac, partial_idx, partial_sines)
+        np.dot(gains, partial_sines, out=signals[i])
+    drive_phase += inc * frames
+    drive_phase %= 1.0
+
+    # Add modulation to higher dimensions; the same slow swell for all of them, so computed once
+    mod = np.multiply(t, TWO_PI * HIGH_DIM_MOD_FREQ, out=angle)
+    np.sin(mod, out=mod)
+    mod *= 0.05
+    mod += 1
+    signals[3:] *= mod
+
+
+def match_harmonic_pairs(r_drive):
+    """
+    Match every dimension pair (PAIR_I[p], PAIR_J[p]) against HARMONIC_TARGETS.
+
+    Args:
+        r_drive: Drive frequency per dimension, as an array
+
+    Returns:
+        (hits, forward_hits): boolean (len(PAIR_I), len(HARMONIC_TARGETS)) arrays;
+        hits[p, k] if either ordering of pair p is within tolerance of ratio k,
+        forward_hits[p, k] if r_drive[PAIR_J[p]] / r_drive[PAIR_I[p]] is
+    """
+    # Ratio of every drive to every other: ratios[i, j] = r_drive[j] / r_drive[i] (0 where r_drive[i] <= 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratios = np.where(r_drive[:, None] > 0, r_drive[None, :] / r_drive[:, None], 0.0)
+
+    # Match both orderings of each pair (i < j) against every target ratio at once
+    forward = ratios[PAIR_I, PAIR_J]
+    inverse = ratios[PAIR_J, PAIR_I]
+    forward_hits = np.abs(forward[:, None] - HARMONIC_TARGETS) < HARMONIC_TOLERANCES
+    hits = forward_hits | (np.abs(inverse[:, None] - HARMONIC_TARGETS) < HARMONIC_TOLERANCES)
+    return hits, forward_hits
+
+
 class SoundEffect:
     """
     Sound effect with spatial audio support.
@@ -43,9 +233,24 @@ class SoundEffect:
         """
         self.waveform = waveform * pitch  # Apply pitch to waveform
         self.position = 0  # Current playback position
-        self.pan = pan  # Stereo panning (-1 left to 1 right)
         self.loop = loop  # Whether to loop the sound
+        self.set_pan_volume(pan, volume)
+
+    def set_pan_volume(self, pan, volume):
+        """
+        Set panning and volume together.
+
+        Also refreshes the equal-power channel gains the audio callback mixes
+        with, so no square roots are taken on the audio thread.
+
+        Args:
+            pan: Stereo panning (-1 left to 1 right)
+            volume: Volume multiplier (0.0 to 1.0)
+        """
+        self.pan = pan  # Stereo panning (-1 left to 1 right)
         self.volume = volume  # Volume multiplier
+        self.left_gain = math.sqrt((1 - pan) / 2) * volume
+        self.right_gain = math.sqrt((1 + pan) / 2) * volume
 
 
 class AudioSystem:
@@ -64,6 +269,10 @@ class AudioSystem:
         """
         # Audio timing
         self.audio_time = 0.0
+        # Drive oscillator phase per dimension and partial, in cycles [0, 1)
+        self.drive_phase = np.zeros((N_DIMENSIONS, len(DRIVE_PARTIAL_RATIOS)))
+        # Background tone phases, in cycles [0, 1)
+        self.bed_phase = np.zeros(len(BED_FREQS))
 
         # Volume settings (loaded from config)
         self.master_volume = config.getfloat('Audio', 'master_volume', fallback=0.2)
@@ -71,8 +280,13 @@ class AudioSystem:
         self.effect_volume = config.getfloat('Audio', 'effect_volume', fallback=0.2)
         self.drive_volume = config.getfloat('Audio', 'drive_volume', fallback=0.05)
 
-        # Active sound effects list
-        self.active_sound_effects = []
+        # Active sound effects, held as an insertion-ordered dict used as a set
+        # (O(1) add, membership and removal)
+        self.active_sound_effects = {}
+        # Singleton effects by tag (power chord, idle chord, heartbeat), started and stopped
+        # only from the game thread; an entry is stale once its effect has left
+        # active_sound_effects
+        self.tagged_sound_effects = {}
 
         # Ship reference (set externally after ship is created)
         self.ship = None
@@ -80,48 +294,91 @@ class AudioSystem:
         # Precompute all waveforms
         self._generate_waveforms()
 
+        # Callback scratch buffers for the fixed stream block size (grown if a larger block ever arrives)
+        self._allocate_scratch(AUDIO_BLOCKSIZE)
+
         # Start audio stream
         self.stream = sd.OutputStream(
             callback=self._audio_callback,
             channels=2,
-            samplerate=SAMPLE_RATE
+            samplerate=SAMPLE_RATE,
+            blocksize=AUDIO_BLOCKSIZE,
+            dtype='float32'
         )
 
+    def _allocate_scratch(self, frames):
+        """
+        Preallocate the buffers the audio callback works in.
+
+        The callback slices these per block instead of allocating, so
+        steady-state callbacks create no sample-sized arrays.
+
+        Args:
+            frames: Largest block size the buffers must hold
+        """
+        self._scratch_frames = frames
+        self._sample_index = np.arange(frames, dtype=float)
+        self._sample_times = sample_times(frames)
+        self._t = np.empty(frames)
+        self._angle = np.empty(frames)
+        self._partial = np.empty(frames)
+        self._bed_cycles = np.empty((len(BED_FREQS), frames))
+        self._bed_frac = np.empty((len(BED_FREQS), frames))
+        self._bed_idx = np.empty((len(BED_FREQS), frames), dtype=np.int64)
+        self._bed = np.empty((len(BED_FREQS), frames))
+        self._left = np.empty(frames)
+        self._right = np.empty(frames)
+        self._segment = np.empty(frames)
+        self._signals = np.empty((N_DIMENSIONS, frames))
+        self._vibrato = np.empty((N_DIMENSIONS, frames))
+        self._vibrato_work = np.empty((2, N_DIMENSIONS, frames))
+        self._intermod = np.empty((2, len(PAIR_I), frames))
+        self._partials = np.empty((len(DRIVE_PARTIAL_RATIOS), frames))
+        self._partial_frac = np.empty((len(DRIVE_PARTIAL_RATIOS), frames))
+        self._partial_idx = np.empty((len(DRIVE_PARTIAL_RATIOS), frames), dtype=np.int64)
+        self._partial_sines = np.empty((len(DRIVE_PARTIAL_RATIOS), frames))
+
     def _generate_waveforms(self):
-        """Precompute all static waveforms used in the game."""
+        """
+        Precompute all static waveforms used in the game.
+
+        Synthesis runs in float64 and each waveform is stored as float32:
+        half the memory, and half the bandwidth when the callback mixes them.
+        """
+        rng = np.random.default_rng()  # PCG64 noise source, drawn straight into float32
 
         # Basic beep (for planets)
         beep_duration = 0.1
         beep_frequency = 440
         beep_samples = int(beep_duration * SAMPLE_RATE)
-        self.beep_waveform = 0.2 * np.sin(
-            2 * np.pi * beep_frequency * np.linspace(0, beep_duration, beep_samples)
-        )
+        self.beep_waveform = (0.2 * np.sin(
+            2 * np.pi * beep_frequency * sample_times(beep_samples)
+        )).astype(np.float32)
 
         # Rift beep (higher pitch)
         rift_beep_frequency = 880
-        self.rift_beep_waveform = 0.2 * np.sin(
-            2 * np.pi * rift_beep_frequency * np.linspace(0, beep_duration, beep_samples)
-        )
+        self.rift_beep_waveform = (0.2 * np.sin(
+            2 * np.pi * rift_beep_frequency * sample_times(beep_samples)
+        )).astype(np.float32)
 
         # Click sound (resonance feedback)
         click_duration = 0.05
         click_freq = 100 * PHI
-        self.click_waveform = 0.2 * np.sin(
-            2 * np.pi * click_freq * np.linspace(0, click_duration, int(click_duration * SAMPLE_RATE), endpoint=False)
-        )
+        self.click_waveform = (0.2 * np.sin(
+            2 * np.pi * click_freq * sample_times(int(click_duration * SAMPLE_RATE))
+        )).astype(np.float32)
 
         # Rotation whoosh
         rotation_duration = ROTATION_SOUND_DURATION
         rotation_freq = 200 * PHI
-        self.rotation_waveform = 0.1 * np.sin(
-            2 * np.pi * rotation_freq * np.linspace(0, rotation_duration, int(rotation_duration * SAMPLE_RATE))
-        )
+        self.rotation_waveform = (0.1 * np.sin(
+            2 * np.pi * rotation_freq * sample_times(int(rotation_duration * SAMPLE_RATE))
+        )).astype(np.float32)
 
         # Long Golden Harmony Chord — 7 seconds at 432 Hz (the frequency of the universe)
         chord_duration = 7.0
         chord_samples = int(chord_duration * SAMPLE_RATE)
-        t_chord = np.linspace(0, chord_duration, chord_samples)
+        t_chord = sample_times(chord_samples)
 
         # Gentle double swell over 7 seconds (breathes like a living thing)
         envelope = (np.sin(np.pi * t_chord / chord_duration) ** 2) * \
@@ -129,23 +386,23 @@ class AudioSystem:
 
         # 432 Hz A-major with subtle golden-ratio overtones
         base = 432.0
-        self.chord_waveform = 0.11 * envelope * (
+        self.chord_waveform = (0.11 * envelope * (
             np.sin(2 * np.pi * base * t_chord) +           # A4 @ 432 Hz
             np.sin(2 * np.pi * base * 1.25 * t_chord) +
             0.9 * np.sin(2 * np.pi * base * 1.5874 * t_chord) +  # C♯5 & E5 tuned to just intonation-ish ratios
             0.4 * np.sin(2 * np.pi * base * PHI * t_chord) +     # Golden overtone shimmer
             0.2 * np.sin(2 * np.pi * base * PHI**2 * t_chord)     # Even higher golden harmonic
-        )
+        )).astype(np.float32)
 
         # Rift hum (dimensional portal ambience)
         rift_hum_duration = 1.0
         rift_hum_base_freq = 220.0
-        t_rift = np.linspace(0, rift_hum_duration, int(rift_hum_duration * SAMPLE_RATE))
-        self.rift_hum_waveform = 0.1 * (
+        t_rift = sample_times(int(rift_hum_duration * SAMPLE_RATE))
+        self.rift_hum_waveform = (0.1 * (
             np.sin(2 * np.pi * rift_hum_base_freq * t_rift) +
             0.5 * np.sin(2 * np.pi * rift_hum_base_freq * PHI * t_rift) +
             0.25 * np.sin(2 * np.pi * rift_hum_base_freq * PHI**2 * t_rift)
-        )
+        )).astype(np.float32)
 
         # Crystal lock beeps (mid to high tones)
         lock_beep_duration = 0.3
@@ -153,209 +410,157 @@ class AudioSystem:
         high_freq = 1000
         lock_beep_samples = int(lock_beep_duration * SAMPLE_RATE)
         half = lock_beep_samples // 2
-        t_mid = np.linspace(0, lock_beep_duration / 2, half)
-        t_high = np.linspace(0, lock_beep_duration / 2, lock_beep_samples - half)
-        self.lock_beep_waveform = np.concatenate((
+        t_mid = sample_times(half)
+        t_high = sample_times(lock_beep_samples - half)
+        self.lock_beep_waveform = (np.concatenate((
             0.2 * np.sin(2 * np.pi * mid_freq * t_mid),
             0.2 * np.sin(2 * np.pi * high_freq * t_high)
-        ))
+        ))).astype(np.float32)
 
         # Approaching lock beeps (mid tones, repeated)
         approaching_beep_duration = 0.15
         approaching_freq = 600
         approaching_beep_samples = int(approaching_beep_duration * SAMPLE_RATE)
-        self.approaching_beep_waveform = 0.2 * np.sin(
-            2 * np.pi * approaching_freq * np.linspace(0, approaching_beep_duration, approaching_beep_samples)
-        )
+        self.approaching_beep_waveform = (0.2 * np.sin(
+            2 * np.pi * approaching_freq * sample_times(approaching_beep_samples)
+        )).astype(np.float32)
 
         # Nebula dissonant rumble
         dissonant_duration = 1.0
         dissonant_freq = 40.0
-        t_diss = np.linspace(0, dissonant_duration, int(dissonant_duration * SAMPLE_RATE))
-        noise = np.random.rand(len(t_diss)) * 0.5 - 0.25  # Random noise
-        self.dissonant_waveform = 0.1 * (np.sin(2 * np.pi * dissonant_freq * t_diss) + noise)
+        t_diss = sample_times(int(dissonant_duration * SAMPLE_RATE))
+        noise = rng.random(len(t_diss), dtype=np.float32)  # Random noise in [-0.25, 0.25)
+        noise -= 0.5
+        noise *= 0.5
+        self.dissonant_waveform = (0.1 * (np.sin(2 * np.pi * dissonant_freq * t_diss) + noise)).astype(np.float32)
 
         # Perfect resonance ping
         ping_duration = 0.2
         ping_freq = 1200
-        t_ping = np.linspace(0, ping_duration, int(ping_duration * SAMPLE_RATE))
-        self.ping_waveform = 0.2 * np.sin(2 * np.pi * ping_freq * t_ping) * np.exp(-t_ping / 0.05)
+        t_ping = sample_times(int(ping_duration * SAMPLE_RATE))
+        self.ping_waveform = (0.2 * np.sin(2 * np.pi * ping_freq * t_ping) * np.exp(-t_ping / 0.05)).astype(np.float32)
 
         # Harmonic chimes (different frequencies for different harmonic types)
         chime_duration = 0.4
-        t_chime = np.linspace(0, chime_duration, int(chime_duration * SAMPLE_RATE))
+        t_chime = sample_times(int(chime_duration * SAMPLE_RATE))
         decay = np.exp(-t_chime / 0.15)
 
-        # Octave chime - C note at 523.25 Hz with octave overtone
-        self.octave_chime = 0.15 * decay * (
-            np.sin(2 * np.pi * 523.25 * t_chime) +
-            0.5 * np.sin(2 * np.pi * 1046.5 * t_chime)  # Octave above
-        )
-
-        # Perfect fifth chime - C to G (523.25 Hz and 783.99 Hz)
-        self.fifth_chime = 0.15 * decay * (
-            np.sin(2 * np.pi * 523.25 * t_chime) +
-            0.7 * np.sin(2 * np.pi * 783.99 * t_chime)
-        )
-
-        # Golden ratio chime - 432 Hz with PHI ratio overtone
-        self.golden_chime = 0.15 * decay * (
-            np.sin(2 * np.pi * 432.0 * t_chime) +
-            0.6 * np.sin(2 * np.pi * (432.0 * PHI) * t_chime) +
-            0.3 * np.sin(2 * np.pi * (432.0 * PHI**2) * t_chime)
-        )
-
-        # Perfect fourth chime - C to F (523.25 Hz and 698.46 Hz)
-        self.fourth_chime = 0.15 * decay * (
-            np.sin(2 * np.pi * 523.25 * t_chime) +
-            0.7 * np.sin(2 * np.pi * 698.46 * t_chime)
-        )
-
-        # Major third chime - C to E (523.25 Hz and 659.25 Hz)
-        self.major_third_chime = 0.15 * decay * (
-            np.sin(2 * np.pi * 523.25 * t_chime) +
-            0.7 * np.sin(2 * np.pi * 659.25 * t_chime)
-        )
-
-        # Minor third chime - C to Eb (523.25 Hz and 622.25 Hz)
-        self.minor_third_chime = 0.15 * decay * (
-            np.sin(2 * np.pi * 523.25 * t_chime) +
-            0.7 * np.sin(2 * np.pi * 622.25 * t_chime)
-        )
-
-        # Major sixth chime - C to A (523.25 Hz and 880 Hz)
-        self.major_sixth_chime = 0.15 * decay * (
-            np.sin(2 * np.pi * 523.25 * t_chime) +
-            0.6 * np.sin(2 * np.pi * 880 * t_chime)
-        )
-
-        # Minor sixth chime - C to Ab (523.25 Hz and 830.6 Hz)
-        self.minor_sixth_chime = 0.15 * decay * (
-            np.sin(2 * np.pi * 523.25 * t_chime) +
-            0.6 * np.sin(2 * np.pi * 830.6 * t_chime)
-        )
-
-        # Tritone chime - C to F# (523.25 Hz and 739.99 Hz) - dissonant!
-        self.tritone_chime = 0.15 * decay * (
-            np.sin(2 * np.pi * 523.25 * t_chime) +
-            0.8 * np.sin(2 * np.pi * 739.99 * t_chime) +
-            0.1 * np.sin(2 * np.pi * 261.63 * t_chime)  # Add low rumble for tension
-        )
+        # All chimes in one batch: rows are (frequency, amplitude) partials, zero-padded to three
+        chime_partials = np.array([
+            [(523.25, 1.0), (1046.5, 0.5), (0.0, 0.0)],                          # Octave - C with octave overtone
+            [(523.25, 1.0), (783.99, 0.7), (0.0, 0.0)],                          # Perfect fifth - C to G
+            [(432.0, 1.0), (432.0 * PHI, 0.6), (432.0 * PHI**2, 0.3)],           # Golden ratio - 432 Hz with PHI overtones
+            [(523.25, 1.0), (698.46, 0.7), (0.0, 0.0)],                          # Perfect fourth - C to F
+            [(523.25, 1.0), (659.25, 0.7), (0.0, 0.0)],                          # Major third - C to E
+            [(523.25, 1.0), (622.25, 0.7), (0.0, 0.0)],                          # Minor third - C to Eb
+            [(523.25, 1.0), (880.0, 0.6), (0.0, 0.0)],                           # Major sixth - C to A
+            [(523.25, 1.0), (830.6, 0.6), (0.0, 0.0)],                           # Minor sixth - C to Ab
+            [(523.25, 1.0), (739.99, 0.8), (261.63, 0.1)],                       # Tritone - C to F# with low rumble (dissonant!)
+        ])
+        chime_freqs, chime_amps = chime_partials[..., 0], chime_partials[..., 1]
+        chimes = (0.15 * decay * np.einsum(
+            'cp,cpt->ct', chime_amps, np.sin(2 * np.pi * chime_freqs[:, :, None] * t_chime)
+        )).astype(np.float32)
+        (self.octave_chime, self.fifth_chime, self.golden_chime, self.fourth_chime,
+         self.major_third_chime, self.minor_third_chime, self.major_sixth_chime,
+         self.minor_sixth_chime, self.tritone_chime) = chimes
 
         # Stellar type ambient sounds
         # Red giant pulse (30-50 Hz deep bass pulsation)
         pulse_freq = 40.0
         pulse_duration = 2.0
-        t_pulse = np.linspace(0, pulse_duration, int(pulse_duration * SAMPLE_RATE))
+        t_pulse = sample_times(int(pulse_duration * SAMPLE_RATE))
         pulse_envelope = (np.sin(np.pi * t_pulse / pulse_duration) ** 2)
-        self.red_giant_pulse = 0.1 * pulse_envelope * np.sin(2 * np.pi * pulse_freq * t_pulse)
+        self.red_giant_pulse = (0.1 * pulse_envelope * np.sin(2 * np.pi * pulse_freq * t_pulse)).astype(np.float32)
 
         # White dwarf whine (1200-1500 Hz high sustained tone)
         whine_freq = 1350.0
         whine_duration = 1.0
-        t_whine = np.linspace(0, whine_duration, int(whine_duration * SAMPLE_RATE))
-        self.white_dwarf_whine = 0.08 * np.sin(2 * np.pi * whine_freq * t_whine)
+        t_whine = sample_times(int(whine_duration * SAMPLE_RATE))
+        self.white_dwarf_whine = (0.08 * np.sin(2 * np.pi * whine_freq * t_whine)).astype(np.float32)
 
         # Brown dwarf rumble (20-30 Hz barely audible deep rumble)
         rumble_freq = 25.0
         rumble_duration = 1.5
-        t_rumble = np.linspace(0, rumble_duration, int(rumble_duration * SAMPLE_RATE))
-        self.brown_dwarf_rumble = 0.05 * np.sin(2 * np.pi * rumble_freq * t_rumble)
+        t_rumble = sample_times(int(rumble_duration * SAMPLE_RATE))
+        self.brown_dwarf_rumble = (0.05 * np.sin(2 * np.pi * rumble_freq * t_rumble)).astype(np.float32)
 
         # Nebula type ambient sounds
         nebula_duration = 1.5
-        t_nebula = np.linspace(0, nebula_duration, int(nebula_duration * SAMPLE_RATE))
+        t_nebula = sample_times(int(nebula_duration * SAMPLE_RATE))
 
         # Emission nebula - warm drone (200-300 Hz)
         emission_freq = 250.0
-        self.emission_nebula_drone = 0.08 * (
+        self.emission_nebula_drone = (0.08 * (
             np.sin(2 * np.pi * emission_freq * t_nebula) +
             0.3 * np.sin(2 * np.pi * emission_freq * 1.5 * t_nebula)
-        )
+        )).astype(np.float32)
 
         # Reflection nebula - cool shimmer (600-800 Hz with subtle tremolo)
         reflection_freq = 700.0
         tremolo = 0.8 + 0.2 * np.sin(2 * np.pi * 4.0 * t_nebula)  # 4 Hz tremolo
-        self.reflection_nebula_shimmer = 0.06 * tremolo * (
+        self.reflection_nebula_shimmer = (0.06 * tremolo * (
             np.sin(2 * np.pi * reflection_freq * t_nebula) +
             0.4 * np.sin(2 * np.pi * reflection_freq * PHI * t_nebula)
-        )
+        )).astype(np.float32)
 
         # Planetary nebula - multi-layered (400-600 Hz with harmonics)
         planetary_freq = 500.0
-        self.planetary_nebula_layers = 0.07 * (
+        self.planetary_nebula_layers = (0.07 * (
             np.sin(2 * np.pi * planetary_freq * t_nebula) +
             0.5 * np.sin(2 * np.pi * planetary_freq * 1.25 * t_nebula) +
             0.3 * np.sin(2 * np.pi * planetary_freq * 1.5 * t_nebula)
-        )
+        )).astype(np.float32)
 
         # Supernova remnant - chaotic noise (100-900 Hz sweeping with noise)
-        noise = np.random.rand(len(t_nebula)) * 0.6 - 0.3
+        noise = rng.random(len(t_nebula), dtype=np.float32)  # [-0.3, 0.3)
+        noise -= 0.5
+        noise *= 0.6
         sweep_freq = 200 + 700 * np.sin(2 * np.pi * 0.5 * t_nebula)  # 0.5 Hz sweep
-        self.supernova_remnant_chaos = 0.1 * (
+        self.supernova_remnant_chaos = (0.1 * (
             np.sin(2 * np.pi * sweep_freq * t_nebula) + noise
-        )
+        )).astype(np.float32)
 
         # Exoplanet type ambient sounds
         planet_duration = 1.0
-        t_planet = np.linspace(0, planet_duration, int(planet_duration * SAMPLE_RATE))
+        t_planet = sample_times(int(planet_duration * SAMPLE_RATE))
 
         # Hot Jupiter - roaring furnace (200-500 Hz with heavy noise and modulation)
-        hot_jupiter_noise = np.random.rand(len(t_planet)) * 0.8 - 0.4
+        hot_jupiter_noise = rng.random(len(t_planet), dtype=np.float32)  # [-0.4, 0.4)
+        hot_jupiter_noise -= 0.5
+        hot_jupiter_noise *= 0.8
         hot_jupiter_mod = 300 + 200 * np.sin(2 * np.pi * 3.0 * t_planet)
-        self.hot_jupiter_roar = 0.09 * (
+        self.hot_jupiter_roar = (0.09 * (
             np.sin(2 * np.pi * hot_jupiter_mod * t_planet) + hot_jupiter_noise
-        )
+        )).astype(np.float32)
 
         # Super-Earth - solid resonant tone (300-400 Hz stable fundamental)
         super_earth_freq = 350.0
-        self.super_earth_tone = 0.07 * (
+        self.super_earth_tone = (0.07 * (
             np.sin(2 * np.pi * super_earth_freq * t_planet) +
             0.3 * np.sin(2 * np.pi * super_earth_freq * 2 * t_planet)
-        )
+        )).astype(np.float32)
 
         # Ocean World - flowing liquid (200-350 Hz with gentle undulation)
         ocean_flow = 0.9 + 0.1 * np.sin(2 * np.pi * 2.0 * t_planet)
         ocean_freq = 275.0
-        self.ocean_world_flow = 0.06 * ocean_flow * (
+        self.ocean_world_flow = (0.06 * ocean_flow * (
             np.sin(2 * np.pi * ocean_freq * t_planet) +
             0.5 * np.sin(2 * np.pi * ocean_freq * 1.3 * t_planet)
-        )
+        )).astype(np.float32)
 
         # Rogue Planet - ominous silence (very low 50 Hz rumble, barely audible)
         rogue_freq = 50.0
-        self.rogue_planet_ominous = 0.03 * np.sin(2 * np.pi * rogue_freq * t_planet)
+        self.rogue_planet_ominous = (0.03 * np.sin(2 * np.pi * rogue_freq * t_planet)).astype(np.float32)
 
         # Ice Giant - crystalline chimes (600-1000 Hz with bell-like harmonics)
         ice_freq = 800.0
         ice_decay = np.exp(-t_planet / 0.2)
-        self.ice_giant_chime = 0.06 * ice_decay * (
+        self.ice_giant_chime = (0.06 * ice_decay * (
             np.sin(2 * np.pi * ice_freq * t_planet) +
             0.4 * np.sin(2 * np.pi * ice_freq * 1.5 * t_planet) +
             0.2 * np.sin(2 * np.pi * ice_freq * 2 * t_planet)
-        )
-
-    def get_vibrato_phase(self, t, resonance_level):
-        """
-        Generate phase-modulated vibrato that responds to resonance quality.
-
-        The vibrato gets deeper and slightly faster with higher resonance,
-        creating a richer, more alive sound when properly tuned.
-
-        Args:
-            t: Time array (in seconds)
-            resonance_level: 0.0 to 1.0 (tuning quality)
-
-        Returns:
-            Phase offset array to add to carrier wave
-        """
-        depth = VIBRATO_DEPTH_BASE + (VIBRATO_DEPTH_MAX - VIBRATO_DEPTH_BASE) * resonance_level
-        rate = VIBRATO_RATE_BASE + (VIBRATO_RATE_MAX - VIBRATO_RATE_BASE) * resonance_level**2
-
-        # Two layered LFOs at golden-ratio intervals for organic beating
-        lfo1 = np.sin(2 * np.pi * rate * t)
-        lfo2 = np.sin(2 * np.pi * rate * PHI * t) * 0.3
-        return depth * (lfo1 + lfo2)
+        )).astype(np.float32)
 
     def detect_harmonic_pairs(self):
         """
@@ -370,25 +575,14 @@ class AudioSystem:
         if self.ship is None:
             return []
 
+        hits, forward_hits = match_harmonic_pairs(np.array(self.ship.r_drive, dtype=float))  # Ship keeps drives as a list
+
+        # The first matching ratio in HARMONIC_RATIOS order names the pair; a forward match keeps (i, j) order
         harmonic_pairs = []
-        for i in range(N_DIMENSIONS):
-            for j in range(i + 1, N_DIMENSIONS):
-                freq1 = self.ship.r_drive[i]
-                freq2 = self.ship.r_drive[j]
-
-                # Check both orderings (freq2/freq1 and freq1/freq2)
-                ratio = freq2 / freq1 if freq1 > 0 else 0
-                inv_ratio = freq1 / freq2 if freq2 > 0 else 0
-
-                for name, target_ratio in HARMONIC_RATIOS.items():
-                    # Check if ratio matches within tolerance
-                    tolerance = target_ratio * 0.02  # 2% tolerance
-                    if abs(ratio - target_ratio) < tolerance:
-                        harmonic_pairs.append((i, j, name))
-                        break
-                    elif abs(inv_ratio - target_ratio) < tolerance:
-                        harmonic_pairs.append((j, i, name))
-                        break
+        for p in np.flatnonzero(hits.any(axis=1)).tolist():
+            k = int(hits[p].argmax())
+            i, j = int(PAIR_I[p]), int(PAIR_J[p])
+            harmonic_pairs.append((i, j, HARMONIC_NAMES[k]) if forward_hits[p, k] else (j, i, HARMONIC_NAMES[k]))
 
         return harmonic_pairs
 
@@ -407,132 +601,152 @@ class AudioSystem:
         """
         if self.ship is None:
             # No ship yet, output silence
-            outdata[:] = np.zeros((frames, 2))
+            outdata.fill(0)
             return
 
+        if frames > self._scratch_frames:
+            self._allocate_scratch(frames)
+
         # Generate time array
-        t = (np.arange(frames) / SAMPLE_RATE) + self.audio_time
+        t = np.add(self._sample_times[:frames], self.audio_time, out=self._t[:frames])
         self.audio_time += frames / SAMPLE_RATE
+        angle = self._angle[:frames]
+        partial = self._partial[:frames]
+
+        # Background tones in one table lookup: rows are the Schumann carrier, ambient tone and ambient swell
+        bed_cycles = np.multiply(BED_INC[:, None], self._sample_index[:frames], out=self._bed_cycles[:, :frames])
+        bed_cycles += self.bed_phase[:, None]
+        schumann_wave, ambient_signal, modulation = lut_sine(
+            bed_cycles, self._bed_frac[:, :frames], self._bed_idx[:, :frames], self._bed[:, :frames]
+        )
+        self.bed_phase[:] = (self.bed_phase + BED_INC * frames) % 1.0
 
         # Silent Schumann carrier wave (7.83 Hz at -40 dB)
-        schumann_wave = SCHUMANN_VOLUME * np.sin(2 * np.pi * SCHUMANN_FREQ * t)
+        schumann_wave *= SCHUMANN_VOLUME
+
+        # Snapshot of the ship's tuning (the game loop may retune mid-callback)
+        r_drive = np.array(self.ship.r_drive, dtype=float)
+        f_target = np.array(self.ship.f_target, dtype=float)
 
-        # Detect harmonic relationships between dimensions
-        harmonic_pairs = self.detect_harmonic_pairs()
+        # Detect harmonic relationships between dimensions (which ratio matched doesn't matter here)
+        harmonic = match_harmonic_pairs(r_drive)[0].any(axis=1)
 
         # Generate drive signals per dimension with enhanced harmonics
-        signals = np.zeros((N_DIMENSIONS, frames))
-        for i in range(N_DIMENSIONS):
-            base_freq = self.ship.r_drive[i] / 2
-
-            # Per-dimension resonance (makes vibrato respond to how well that dim is tuned)
-            delta_f = self.ship.r_drive[i] - self.ship.f_target[i]
-            res_level = 1 / (1 + (delta_f / self.ship.resonance_width)**2)
-
-            # Subtle vibrato as phase modulation
-            vibrato_phase = self.get_vibrato_phase(t, res_level)
-
-            # Pure sine fundamental - clean and lifelike
-            signals[i] += self.drive_volume * np.sin(
-                2 * np.pi * base_freq * t + vibrato_phase
-            )
-
-            # Golden ratio overtones for organic shimmer (PHI^1, PHI^2, PHI^3)
-            # These create the "lifelike" quality without harsh sawtooth harmonics
-            for k in range(1, 4):
-                amplitude = self.drive_volume * 0.25 / k  # Gentle falloff
-                signals[i] += amplitude * np.sin(
-                    2 * np.pi * (base_freq * PHI**k) * t + vibrato_phase
-                )
-
-            # Subharmonic at golden ratio below (1/PHI) for warmth
-            sub_freq = base_freq / PHI
-            signals[i] += self.drive_volume * 0.15 * np.sin(
-                2 * np.pi * sub_freq * t + vibrato_phase * 0.5
-            )
-
-            # Add modulation to higher dimensions
-            if i >= 3:
-                mod_freq = 0.5 * PHI
-                mod = np.sin(2 * np.pi * mod_freq * t) * 0.05
-                signals[i] *= (1 + mod)
-
-        # Generate intermodulation tones for harmonically-related dimensions
-        for dim1, dim2, harmonic_name in harmonic_pairs:
-            freq1 = self.ship.r_drive[dim1] / 2
-            freq2 = self.ship.r_drive[dim2] / 2
-
-            # Sum and difference tones (classic intermodulation)
-            sum_freq = freq1 + freq2
-            diff_freq = abs(freq1 - freq2)
-
-            # Add intermodulation to both dimensions
-            intermod_signal = INTERMOD_DEPTH * self.drive_volume * (
-                np.sin(2 * np.pi * sum_freq * t) * 0.5 +
-                np.sin(2 * np.pi * diff_freq * t) * 0.7
-            )
-            signals[dim1] += intermod_signal
-            signals[dim2] += intermod_signal
+        signals = self._signals[:, :frames]
+        render_drive_signals(
+            signals, t, self._sample_index[:frames], self.drive_phase, r_drive, f_target,
+            self.ship.resonance_width, self.drive_volume, self._vibrato[:, :frames], self._vibrato_work[:, :, :frames],
+            self._partials[:, :frames], self._partial_frac[:, :frames], self._partial_idx[:, :frames],
+            self._partial_sines[:, :frames], angle, partial
+        )
+
+        # Generate intermodulation tones for harmonically-related dimensions: sum and difference
+        # tones (classic intermodulation) of every related pair in one sine pass, added to both dimensions
+        n_pairs = int(np.count_nonzero(harmonic))
+        if n_pairs:
+            dim1 = PAIR_I[harmonic]
+            dim2 = PAIR_J[harmonic]
+            freq1 = r_drive[dim1] / 2
+            freq2 = r_drive[dim2] / 2
+            tones = self._intermod[:, :n_pairs, :frames]
+            np.multiply.outer(TWO_PI * (freq1 + freq2), t, out=tones[0])
+            np.multiply.outer(TWO_PI * np.abs(freq1 - freq2), t, out=tones[1])
+            np.sin(tones, out=tones)
+            tones[0] *= 0.5 * INTERMOD_DEPTH * self.drive_volume
+            tones[1] *= 0.7 * INTERMOD_DEPTH * self.drive_volume
+            intermod_signal = tones[0]
+            intermod_signal += tones[1]
+            np.add.at(signals, dim1, intermod_signal)  # add.at, as a dimension can be in several pairs
+            np.add.at(signals, dim2, intermod_signal)
 
         # Pan signals: x left, y center, z right, higher dims mixed
-        left_signal = signals[0] + signals[1] * 0.5 + signals[3] * 0.7 + signals[4] * 0.3
-        right_signal = signals[2] + signals[1] * 0.5 + signals[3] * 0.3 + signals[4] * 0.7
+        left_signal = np.dot(DRIVE_PAN_LEFT, signals, out=self._left[:frames])
+        right_signal = np.dot(DRIVE_PAN_RIGHT, signals, out=self._right[:frames])
 
         # Add ambient modulation
-        modulation = 0.5 + 0.5 * np.sin(2 * np.pi * 0.1 * PHI * t)
-        ambient_signal = 0.01 * modulation * np.sin(2 * np.pi * 30 * PHI * t)
+        modulation *= 0.5
+        modulation += 0.5
+        ambient_signal *= modulation
+        ambient_signal *= 0.01
         left_signal += ambient_signal
         right_signal += ambient_signal
 
-        # Add power chord if power buildup high
-        power_condition = not self.ship.landed_mode and any(
-            self.ship.resonance_power[i] > POWER_BUILD_TIME - 1 for i in range(N_DIMENSIONS)
-        )
-        chord_effects = [e for e in self.active_sound_effects if np.array_equal(e.waveform, self.chord_waveform)]
-        if power_condition:
-            if not chord_effects:
-                self.active_sound_effects.append(SoundEffect(self.chord_waveform, pan=0.0, volume=self.effect_volume))
-        elif chord_effects:
-            for e in chord_effects:
-                self.active_sound_effects.remove(e)
-
         # Add rift charge rising tone
         if self.ship.rift_charge_timer > 0:
             charge_progress = (RIFT_CHARGE_TIME - self.ship.rift_charge_timer) / RIFT_CHARGE_TIME
             charge_freq = 220 + 660 * charge_progress  # Rise from low to high
-            charge_wave = 0.1 * np.sin(2 * np.pi * charge_freq * t) * self.effect_volume
+            charge_wave = np.multiply(t, TWO_PI * charge_freq, out=angle)
+            np.sin(charge_wave, out=charge_wave)
+            charge_wave *= 0.1 * self.effect_volume
             left_signal += charge_wave
             right_signal += charge_wave
 
-        # Mix active sound effects
-        for effect in self.active_sound_effects[:]:
+        # Mix active sound effects (iterate a snapshot: the game thread may start or stop effects
+        # mid-callback, and finished effects are dropped with an O(1) dict pop)
+        for effect in list(self.active_sound_effects):
             if effect.position < len(effect.waveform):
-                segment = effect.waveform[effect.position : effect.position + frames]
-                if len(segment) < frames:
-                    segment = np.pad(segment, (0, frames - len(segment)), 'constant')
-                left_volume = np.sqrt((1 - effect.pan) / 2) * effect.volume
-                right_volume = np.sqrt((1 + effect.pan) / 2) * effect.volume
-                left_signal += segment * left_volume
-                right_signal += segment * right_volume
+                available = min(frames, len(effect.waveform) - effect.position)
+                if available == frames:
+                    segment = effect.waveform[effect.position : effect.position + frames]
+                else:
+                    # Tail of the waveform: copy what is left into scratch and zero the rest
+                    segment = self._segment[:frames]
+                    segment[:available] = effect.waveform[effect.position:]
+                    segment[available:] = 0.0
+                weighted = np.multiply(segment, effect.left_gain, out=partial)
+                left_signal += weighted
+                np.multiply(segment, effect.right_gain, out=weighted)
+                right_signal += weighted
                 effect.position += frames
             if effect.position >= len(effect.waveform):
                 if effect.loop:
                     effect.position = 0
                 else:
-                    self.active_sound_effects.remove(effect)
+                    self.stop_sound_effect(effect)
 
-        # Apply master volume and clip
-        left_signal *= self.master_volume
-        right_signal *= self.master_volume
+        # Apply master volume and add Schumann straight into the output channels, then clip in place
+        np.multiply(left_signal, self.master_volume, out=outdata[:, 0])
+        np.multiply(right_signal, self.master_volume, out=outdata[:, 1])
+        outdata[:, 0] += schumann_wave
+        outdata[:, 1] += schumann_wave
+        np.clip(outdata, -1.0, 1.0, out=outdata)
 
-        # Add Schumann to final output
-        left_signal += schumann_wave
-        right_signal += schumann_wave
+    def play_sound_effect(self, effect, tag=None):
+        """
+        Start playing a sound effect and return it.
+
+        A tagged effect is a singleton: if an effect with the same tag is
+        still playing, that one is returned and the new one is not started.
+
+        Args:
+            effect: SoundEffect to play
+            tag: Optional name to look the effect up by
 
-        # Create stereo output and clip to valid range
-        signal = np.stack((left_signal, right_signal), axis=1)
-        signal = np.clip(signal, -1.0, 1.0)
-        outdata[:] = signal
+        Returns:
+            The playing effect
+        """
+        if tag is not None:
+            playing = self.get_tagged_sound_effect(tag)
+            if playing is not None:
+                return playing
+            self.tagged_sound_effects[tag] = effect
+        self.active_sound_effects[effect] = None
+        return effect
+
+    def stop_sound_effect(self, effect):
+        """Stop a sound effect if it is still playing."""
+        self.active_sound_effects.pop(effect, None)
+
+    def get_tagged_sound_effect(self, tag):
+        """Return the playing effect started with tag, or None."""
+        effect = self.tagged_sound_effects.get(tag)
+        return effect if effect in self.active_sound_effects else None
+
+    def stop_tagged_sound_effect(self, tag):
+        """Stop the effect started with tag, if any."""
+        effect = self.tagged_sound_effects.pop(tag, None)
+        if effect is not None:
+            self.stop_sound_effect(effect)
 
     def start(self):
         """Start the audio stream."""
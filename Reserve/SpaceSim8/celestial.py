@@ -6,7 +6,6 @@ using golden spiral mathematics and Fibonacci sequences.
 """
 
 import numpy as np
-import random
 from constants import (
     N_DIMENSIONS, PHI, FIB_SEQ, SCALE_FACTOR, FREQUENCY_RANGE,
     N_STARS, N_PLANETS_PER_STAR, N_NEBULAE, ORBIT_RADIUS,
@@ -20,7 +19,69 @@ from constants import (
 )
 
 
-def generate_celestial(n, body_type='star'):
+TWO_PI = 2 * np.pi  # Full turn, the range of every random angle and phase
+SPIRAL_ANGLE_STEP = 2 * np.pi * PHI  # Golden-angle turn between consecutive spiral bodies
+TEMPLE_ANGLE_STEP = 2 * np.pi / 12  # Dodecagon spacing of the minor temples
+ZODIAC_OFFSET = np.pi / 6  # 30-degree offset for zodiac alignment
+POSITION_DTYPE = np.float32  # Packed body positions; game-scale coordinates need no double precision
+NEBULA_DRIFT_RADIUS = POSITION_DTYPE(5)  # How far a nebula drifts from its base position
+
+
+def _type_cdf(probabilities):
+    """Cumulative distribution of a type -> probability table, normalized to end at exactly 1."""
+    cdf = np.cumsum(list(probabilities.values()))
+    return cdf / cdf[-1]
+
+
+def draw_type_indices(rng, cdf, n):
+    """
+    Draw n type indices from a cumulative distribution in one batch.
+
+    Args:
+        rng: numpy Generator to draw from
+        cdf: Cumulative probabilities, one per type, ending at 1
+        n: Number of draws
+
+    Returns:
+        int array of indices into the matching type-name list
+    """
+    return np.searchsorted(cdf, rng.random(n), side='right')
+
+
+# Type tables in a fixed order: names, cumulative probabilities for draw_type_indices,
+# and the per-type values generation applies, indexed like the names
+STELLAR_TYPE_NAMES = list(STELLAR_TYPE_PROBABILITIES)
+STELLAR_TYPE_CDF = _type_cdf(STELLAR_TYPE_PROBABILITIES)
+STELLAR_FREQ_MULT = np.array([STELLAR_TYPES[name]['freq_mult'] for name in STELLAR_TYPE_NAMES])
+NEBULA_TYPE_NAMES = list(NEBULA_TYPE_PROBABILITIES)
+NEBULA_TYPE_CDF = _type_cdf(NEBULA_TYPE_PROBABILITIES)
+NEBULA_FREQ_RANGES = np.array([NEBULA_TYPES[name]['freq_range'] for name in NEBULA_TYPE_NAMES], dtype=float)
+EXOPLANET_TYPE_NAMES = list(EXOPLANET_TYPE_PROBABILITIES)
+EXOPLANET_TYPE_CDF = _type_cdf(EXOPLANET_TYPE_PROBABILITIES)
+
+
+def _higher_dim_lift():
+    """
+    Unroll the higher-dimension recurrence pos[d] = pos[d-2] * PHI + noise[d-2].
+
+    Returns:
+        (planar, noise_lift) coefficient matrices with pos[2:] = pos[:2] @ planar + noise @ noise_lift,
+        so every higher dimension is computed independently of the others
+    """
+    planar = np.zeros((2, N_DIMENSIONS - 2))
+    noise_lift = np.zeros((N_DIMENSIONS - 2, N_DIMENSIONS - 2))
+    for d in range(2, N_DIMENSIONS):
+        planar[d % 2, d - 2] = PHI ** (d // 2)
+        for e in range(d, 1, -2):
+            noise_lift[e - 2, d - 2] = PHI ** ((d - e) // 2)
+    return planar, noise_lift
+
+
+# Closed form of the PHI recurrence that derives higher dimensions from the spatial ones
+PLANAR_LIFT, NOISE_LIFT = _higher_dim_lift()
+
+
+def generate_celestial(n, body_type='star', rng=None):
     """
     Generate celestial bodies procedurally using golden spiral positioning.
 
@@ -31,6 +92,7 @@ def generate_celestial(n, body_type='star'):
     Args:
         n: Number of bodies to generate
         body_type: Type of celestial body ('star', 'planet', or 'nebula')
+        rng: numpy Generator to draw from (a fresh unseeded one if None)
 
     Returns:
         List of dictionaries with keys:
@@ -39,41 +101,48 @@ def generate_celestial(n, body_type='star'):
             - 'type': body type string
             - 'stellar_type': stellar evolution type (only for stars)
     """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    # Golden spiral positions of all bodies at once: one row per body
+    index = np.arange(n)
+    theta = index * SPIRAL_ANGLE_STEP
+    r = np.take(FIB_SEQ, index % len(FIB_SEQ)) * SCALE_FACTOR
+    positions = np.zeros((n, N_DIMENSIONS))
+    positions[:, 0] = r * np.cos(theta)
+    positions[:, 1] = r * np.sin(theta)
+    # Higher dimensions derived from spatial dims with PHI relationship
+    noise = rng.uniform(-10, 10, (n, N_DIMENSIONS - 2))
+    positions[:, 2:] = positions[:, :2] @ PLANAR_LIFT + noise @ NOISE_LIFT
+    freqs = rng.uniform(*FREQUENCY_RANGE, n)
+
+    # Stellar or nebula type of every body in one draw, and the frequencies that depend on it
+    if body_type == 'star':
+        type_idx = draw_type_indices(rng, STELLAR_TYPE_CDF, n)
+        types = [STELLAR_TYPE_NAMES[k] for k in type_idx.tolist()]
+        # Multiply frequency by stellar type multiplier
+        freqs *= STELLAR_FREQ_MULT[type_idx]
+    elif body_type == 'nebula':
+        type_idx = draw_type_indices(rng, NEBULA_TYPE_CDF, n)
+        types = [NEBULA_TYPE_NAMES[k] for k in type_idx.tolist()]
+        # Nebula frequencies come from their type's range instead
+        freq_ranges = NEBULA_FREQ_RANGES[type_idx]
+        freqs = rng.uniform(freq_ranges[:, 0], freq_ranges[:, 1])
+    freqs = freqs.tolist()
+
     bodies = []
     for i in range(n):
-        theta = i * 2 * np.pi * PHI
-        r = FIB_SEQ[i % len(FIB_SEQ)] * SCALE_FACTOR
-        pos = np.zeros(N_DIMENSIONS)
-        pos[0] = r * np.cos(theta)
-        pos[1] = r * np.sin(theta)
-        # Higher dimensions derived from spatial dims with PHI relationship
-        for d in range(2, N_DIMENSIONS):
-            pos[d] = pos[d-2] * PHI + random.uniform(-10, 10)
-        freq = random.uniform(*FREQUENCY_RANGE)
-
-        # Create body dictionary
-        body = {'pos': pos, 'freq': freq, 'type': body_type}
+        # Create body dictionary; its position is a row view of the shared array
+        body = {'pos': positions[i], 'freq': freqs[i], 'type': body_type}
 
         # Assign stellar type for stars
         if body_type == 'star':
-            stellar_type = np.random.choice(
-                list(STELLAR_TYPE_PROBABILITIES.keys()),
-                p=list(STELLAR_TYPE_PROBABILITIES.values())
-            )
-            body['stellar_type'] = stellar_type
-            # Multiply frequency by stellar type multiplier
-            body['freq'] *= STELLAR_TYPES[stellar_type]['freq_mult']
+            body['stellar_type'] = types[i]
 
         # Assign nebula type for nebulae
         elif body_type == 'nebula':
-            nebula_type = np.random.choice(
-                list(NEBULA_TYPE_PROBABILITIES.keys()),
-                p=list(NEBULA_TYPE_PROBABILITIES.values())
-            )
+            nebula_type = types[i]
             body['nebula_type'] = nebula_type
-            # Adjust frequency to nebula type range
-            freq_min, freq_max = NEBULA_TYPES[nebula_type]['freq_range']
-            body['freq'] = random.uniform(freq_min, freq_max)
             # Store dissonance level
             body['dissonance'] = NEBULA_TYPES[nebula_type]['dissonance']
 
@@ -81,12 +150,16 @@ def generate_celestial(n, body_type='star'):
     return bodies
 
 
-def generate_all_celestial_bodies():
+def generate_all_celestial_bodies(seed=None):
     """
     Generate the complete universe of celestial bodies.
 
     Creates stars using golden spiral, planets orbiting each star,
-    and nebulae as environmental hazards.
+    and nebulae as environmental hazards. All randomness comes from one
+    numpy Generator, drawn a whole kind of body at a time.
+
+    Args:
+        seed: Optional seed for a reproducible universe
 
     Returns:
         Tuple of (stars, planets, nebulae, celestial_bodies):
@@ -95,66 +168,82 @@ def generate_all_celestial_bodies():
             - nebulae: List of nebula bodies
             - celestial_bodies: Combined list of all bodies
     """
+    rng = np.random.default_rng(seed)
+
     # Generate stars using golden spiral
-    stars = generate_celestial(N_STARS, 'star')
+    stars = generate_celestial(N_STARS, 'star', rng)
+
+    # All star positions as one contiguous matrix; planets are placed from it and each star's
+    # base position is a row of one copy of it
+    star_positions = np.array([star['pos'] for star in stars]).reshape(-1, N_DIMENSIONS)
+    star_base_positions = star_positions.copy()
 
     # Add subtle movement properties to stars (wobble from planetary gravity)
+    wobble_speeds = rng.uniform(0.05, 0.2, N_STARS).tolist()
+    wobble_radii = rng.uniform(0.5, 2.0, N_STARS).tolist()
+    wobble_phases = rng.uniform(0, TWO_PI, N_STARS).tolist()
     for i, star in enumerate(stars):
-        star['wobble_speed'] = random.uniform(0.05, 0.2)
-        star['wobble_radius'] = random.uniform(0.5, 2.0)
-        star['wobble_phase'] = random.uniform(0, 2 * np.pi)
-        star['base_pos'] = star['pos'].copy()  # Store original position
+        star['wobble_speed'] = wobble_speeds[i]
+        star['wobble_radius'] = wobble_radii[i]
+        star['wobble_phase'] = wobble_phases[i]
+        star['base_pos'] = star_base_positions[i]  # Store original position
+
+    # Orbital parameters, frequency and exoplanet type of every planet, drawn up front
+    n_planets = N_STARS * N_PLANETS_PER_STAR
+    orbit_radii = rng.uniform(ORBIT_RADIUS * 0.3, ORBIT_RADIUS, n_planets)
+    orbit_speeds = rng.uniform(0.1, 0.5, n_planets) / (orbit_radii / ORBIT_RADIUS)  # Kepler-ish: closer = faster
+    orbit_angles = rng.uniform(0, TWO_PI, n_planets)
+    orbit_tilts = rng.uniform(-0.3, 0.3, n_planets)  # Slight orbital plane tilt
+    orbit_phases = rng.uniform(0, TWO_PI, n_planets).tolist()  # Starting phase
+    planet_freqs = rng.uniform(*FREQUENCY_RANGE, n_planets).tolist()
+    exoplanet_types = [EXOPLANET_TYPE_NAMES[k] for k in draw_type_indices(rng, EXOPLANET_TYPE_CDF, n_planets).tolist()]
+
+    # Initial planet positions: each parent star's position plus its orbital offset, all at once
+    parent_star_idx = np.repeat(np.arange(N_STARS), N_PLANETS_PER_STAR)
+    planet_positions = star_positions[parent_star_idx]
+    planet_positions[:, 0] += orbit_radii * np.cos(orbit_angles)
+    planet_positions[:, 1] += orbit_radii * np.sin(orbit_angles)
+    planet_positions[:, 2] += orbit_radii * orbit_tilts * np.sin(orbit_angles)
+    orbit_radii = orbit_radii.tolist()
+    orbit_speeds = orbit_speeds.tolist()
+    orbit_angles = orbit_angles.tolist()
+    orbit_tilts = orbit_tilts.tolist()
 
     # Generate planets orbiting each star
     planets = []
-    for star_idx, star in enumerate(stars):
-        for planet_i in range(N_PLANETS_PER_STAR):
-            # Calculate orbital parameters
-            orbit_radius = random.uniform(ORBIT_RADIUS * 0.3, ORBIT_RADIUS)
-            orbit_speed = random.uniform(0.1, 0.5) / (orbit_radius / ORBIT_RADIUS)  # Kepler-ish: closer = faster
-            orbit_angle = random.uniform(0, 2 * np.pi)
-            orbit_tilt = random.uniform(-0.3, 0.3)  # Slight orbital plane tilt
-
-            # Initial position
-            pos = star['pos'].copy()
-            pos[0] += orbit_radius * np.cos(orbit_angle)
-            pos[1] += orbit_radius * np.sin(orbit_angle)
-            pos[2] += orbit_radius * orbit_tilt * np.sin(orbit_angle)
-
-            freq = random.uniform(*FREQUENCY_RANGE)
-
-            # Assign exoplanet type
-            exoplanet_type = np.random.choice(
-                list(EXOPLANET_TYPE_PROBABILITIES.keys()),
-                p=list(EXOPLANET_TYPE_PROBABILITIES.values())
-            )
-
-            # Create planet with orbital and exoplanet properties
-            planet = {
-                'pos': pos,
-                'freq': freq,
-                'type': 'planet',
-                'exoplanet_type': exoplanet_type,
-                'size_mult': EXOPLANET_TYPES[exoplanet_type]['size_mult'],
-                'crystal_mult': EXOPLANET_TYPES[exoplanet_type]['crystal_mult'],
-                'difficulty': EXOPLANET_TYPES[exoplanet_type]['difficulty'],
-                # Orbital mechanics
-                'parent_star_idx': star_idx,
-                'orbit_radius': orbit_radius,
-                'orbit_speed': orbit_speed,
-                'orbit_angle': orbit_angle,
-                'orbit_tilt': orbit_tilt,
-                'orbit_phase': random.uniform(0, 2 * np.pi)  # Starting phase
-            }
-            planets.append(planet)
+    for k, star_idx in enumerate(parent_star_idx.tolist()):
+        exoplanet_type = exoplanet_types[k]
+
+        # Create planet with orbital and exoplanet properties
+        planet = {
+            'pos': planet_positions[k],
+            'freq': planet_freqs[k],
+            'type': 'planet',
+            'exoplanet_type': exoplanet_type,
+            'size_mult': EXOPLANET_TYPES[exoplanet_type]['size_mult'],
+            'crystal_mult': EXOPLANET_TYPES[exoplanet_type]['crystal_mult'],
+            'difficulty': EXOPLANET_TYPES[exoplanet_type]['difficulty'],
+            # Orbital mechanics
+            'parent_star_idx': star_idx,
+            'orbit_radius': orbit_radii[k],
+            'orbit_speed': orbit_speeds[k],
+            'orbit_angle': orbit_angles[k],
+            'orbit_tilt': orbit_tilts[k],
+            'orbit_phase': orbit_phases[k]
+        }
+        planets.append(planet)
 
     # Generate nebulae with drift/rotation properties
-    nebulae = generate_celestial(N_NEBULAE, 'nebula')
-    for nebula in nebulae:
-        nebula['drift_speed'] = random.uniform(0.02, 0.1)
-        nebula['drift_angle'] = random.uniform(0, 2 * np.pi)
-        nebula['rotation_speed'] = random.uniform(0.01, 0.05)
-        nebula['base_pos'] = nebula['pos'].copy()
+    nebulae = generate_celestial(N_NEBULAE, 'nebula', rng)
+    drift_speeds = rng.uniform(0.02, 0.1, N_NEBULAE).tolist()
+    drift_angles = rng.uniform(0, TWO_PI, N_NEBULAE).tolist()
+    rotation_speeds = rng.uniform(0.01, 0.05, N_NEBULAE).tolist()
+    nebula_base_positions = np.array([nebula['pos'] for nebula in nebulae]).reshape(-1, N_DIMENSIONS)
+    for i, nebula in enumerate(nebulae):
+        nebula['drift_speed'] = drift_speeds[i]
+        nebula['drift_angle'] = drift_angles[i]
+        nebula['rotation_speed'] = rotation_speeds[i]
+        nebula['base_pos'] = nebula_base_positions[i]
 
     # Combined list for collision/proximity checks
     celestial_bodies = stars + planets + nebulae
@@ -162,44 +251,142 @@ def generate_all_celestial_bodies():
     return stars, planets, nebulae, celestial_bodies
 
 
-def update_celestial_positions(stars, planets, nebulae, time):
+class CelestialArrays:
+    """
+    Structure-of-arrays store for the moving celestial bodies.
+
+    Holds the positions and motion parameters of all stars, planets and
+    nebulae as contiguous arrays, one row or element per body, so the
+    per-frame update works on dense arrays instead of hundreds of dicts.
+    Each body dict's 'pos' (and 'base_pos') is rebound to a row view of
+    these arrays, so the rest of the game keeps using the dicts unchanged.
+    Rebuild it whenever the body lists are replaced (new universe or load).
+    """
+
+    def __init__(self, stars, planets, nebulae):
+        """
+        Pack the bodies' motion state and point their positions at it.
+
+        Args:
+            stars: List of star bodies
+            planets: List of planet bodies
+            nebulae: List of nebula bodies
+        """
+        # Stars (subtle wobble around a base position)
+        self.star_pos = _stack(stars, 'pos')
+        self.star_base_pos = _stack(stars, 'base_pos')
+        self.wobble_speed = _gather(stars, 'wobble_speed')
+        self.wobble_radius = _gather(stars, 'wobble_radius')
+        self.wobble_phase = _gather(stars, 'wobble_phase')
+
+        # Planets (orbits around their parent star)
+        self.planet_pos = _stack(planets, 'pos')
+        self.parent_star_idx = _gather(planets, 'parent_star_idx', dtype=np.intp)
+        self.orbit_radius = _gather(planets, 'orbit_radius')
+        self.orbit_speed = _gather(planets, 'orbit_speed')
+        self.orbit_angle = _gather(planets, 'orbit_angle')
+        self.orbit_tilt = _gather(planets, 'orbit_tilt')
+        self.orbit_phase = _gather(planets, 'orbit_phase')
+
+        # Nebulae (slow drift around a base position)
+        self.nebula_pos = _stack(nebulae, 'pos')
+        self.nebula_base_pos = _stack(nebulae, 'base_pos')
+        self.drift_speed = _gather(nebulae, 'drift_speed')
+        self.drift_angle = _gather(nebulae, 'drift_angle')
+
+        # Every offset the update applies is scale * sin(rate * time + phase), one column per
+        # dimension it moves, with cosines written as sines a quarter turn ahead so each body
+        # type needs a single batched sin call. Columns are:
+        # stars - wobble on x, y; planets - orbit angle on x, y, orbit angle + orbit phase on
+        # the tilted z, PHI * orbit angle on dims 3 and 4; nebulae - drift angle on x, y
+        quarter_turn = np.pi / 2
+        self.wobble_rate = np.column_stack([self.wobble_speed, self.wobble_speed])
+        self.wobble_offset = np.column_stack([self.wobble_phase + quarter_turn, self.wobble_phase])
+        self.wobble_scale = np.column_stack([self.wobble_radius, self.wobble_radius]).astype(POSITION_DTYPE)
+
+        self.planet_angle_rate = np.column_stack([
+            self.orbit_speed, self.orbit_speed, self.orbit_speed,
+            self.orbit_speed * PHI, self.orbit_speed * PHI
+        ])
+        self.planet_angle_offset = np.column_stack([
+            self.orbit_angle + quarter_turn, self.orbit_angle, self.orbit_angle + self.orbit_phase,
+            self.orbit_angle * PHI + quarter_turn, self.orbit_angle * PHI
+        ])
+        # Higher dimensions follow with PHI relationship at half the radius
+        self.planet_scale = np.column_stack([
+            self.orbit_radius, self.orbit_radius, self.orbit_radius * self.orbit_tilt,
+            self.orbit_radius * 0.5, self.orbit_radius * 0.5
+        ]).astype(POSITION_DTYPE)
+
+        self.nebula_angle_rate = np.column_stack([self.drift_speed, self.drift_speed])
+        self.nebula_angle_offset = np.column_stack([
+            np.zeros(len(nebulae)), self.drift_angle + quarter_turn
+        ])
+
+        # Per-frame scratch, so the update allocates nothing. Angles stay double so orbits
+        # keep their phase over long sessions; their sines drop to position precision.
+        self._wobble_angles = np.empty((len(stars), 2))
+        self._wobble_offsets = np.empty((len(stars), 2), dtype=POSITION_DTYPE)
+        self._parent_pos = np.empty((len(planets), N_DIMENSIONS), dtype=POSITION_DTYPE)
+        self._planet_angles = np.empty((len(planets), N_DIMENSIONS))
+        self._planet_offsets = np.empty((len(planets), N_DIMENSIONS), dtype=POSITION_DTYPE)
+        self._nebula_angles = np.empty((len(nebulae), 2))
+        self._nebula_offsets = np.empty((len(nebulae), 2), dtype=POSITION_DTYPE)
+
+        for i, star in enumerate(stars):
+            star['pos'] = self.star_pos[i]
+            star['base_pos'] = self.star_base_pos[i]
+        for i, planet in enumerate(planets):
+            planet['pos'] = self.planet_pos[i]
+        for i, nebula in enumerate(nebulae):
+            nebula['pos'] = self.nebula_pos[i]
+            nebula['base_pos'] = self.nebula_base_pos[i]
+
+
+def _stack(bodies, key):
+    """Stack a 5D vector field of every body into an (n, N_DIMENSIONS) array."""
+    return np.array([body[key] for body in bodies], dtype=POSITION_DTYPE).reshape(-1, N_DIMENSIONS)
+
+
+def _gather(bodies, key, dtype=float):
+    """Collect a scalar field of every body into a 1D array."""
+    return np.array([body[key] for body in bodies], dtype=dtype)
+
+
+def update_celestial_positions(celestial_arrays, time):
     """
     Update celestial body positions based on orbital mechanics and drift.
 
+    Positions are written in place, so every body dict's 'pos' view (and
+    any target locked onto it) follows.
+
     Args:
-        stars: List of star bodies
-        planets: List of planet bodies
-        nebulae: List of nebula bodies
+        celestial_arrays: CelestialArrays of the current bodies
         time: Current simulation time in seconds
     """
-    # Update star positions (subtle wobble)
-    for star in stars:
-        wobble_x = star['wobble_radius'] * np.cos(time * star['wobble_speed'] + star['wobble_phase'])
-        wobble_y = star['wobble_radius'] * np.sin(time * star['wobble_speed'] + star['wobble_phase'])
-        star['pos'][0] = star['base_pos'][0] + wobble_x
-        star['pos'][1] = star['base_pos'][1] + wobble_y
-
-    # Update planet orbital positions
-    for planet in planets:
-        star = stars[planet['parent_star_idx']]
-        angle = planet['orbit_angle'] + time * planet['orbit_speed']
-        radius = planet['orbit_radius']
-        tilt = planet['orbit_tilt']
-
-        # Calculate orbital position relative to parent star
-        planet['pos'][0] = star['pos'][0] + radius * np.cos(angle)
-        planet['pos'][1] = star['pos'][1] + radius * np.sin(angle)
-        planet['pos'][2] = star['pos'][2] + radius * tilt * np.sin(angle + planet['orbit_phase'])
-        # Higher dimensions follow with PHI relationship
-        planet['pos'][3] = star['pos'][3] + radius * 0.5 * np.cos(angle * PHI)
-        planet['pos'][4] = star['pos'][4] + radius * 0.5 * np.sin(angle * PHI)
+    bodies = celestial_arrays
+
+    # Update star positions (subtle wobble), all stars at once
+    angles = np.multiply(bodies.wobble_rate, time, out=bodies._wobble_angles)
+    angles += bodies.wobble_offset
+    offsets = np.sin(angles, out=bodies._wobble_offsets)
+    offsets *= bodies.wobble_scale
+    np.add(bodies.star_base_pos[:, :2], offsets, out=bodies.star_pos[:, :2])
+
+    # Update planet orbital positions relative to their (just moved) parent stars
+    star_pos = np.take(bodies.star_pos, bodies.parent_star_idx, axis=0, out=bodies._parent_pos)
+    angles = np.multiply(bodies.planet_angle_rate, time, out=bodies._planet_angles)
+    angles += bodies.planet_angle_offset
+    offsets = np.sin(angles, out=bodies._planet_offsets)
+    offsets *= bodies.planet_scale
+    np.add(star_pos, offsets, out=bodies.planet_pos)
 
     # Update nebula drift
-    for nebula in nebulae:
-        drift_x = np.sin(time * nebula['drift_speed']) * 5
-        drift_y = np.cos(time * nebula['drift_speed'] + nebula['drift_angle']) * 5
-        nebula['pos'][0] = nebula['base_pos'][0] + drift_x
-        nebula['pos'][1] = nebula['base_pos'][1] + drift_y
+    angles = np.multiply(bodies.nebula_angle_rate, time, out=bodies._nebula_angles)
+    angles += bodies.nebula_angle_offset
+    offsets = np.sin(angles, out=bodies._nebula_offsets)
+    offsets *= NEBULA_DRIFT_RADIUS
+    np.add(bodies.nebula_base_pos[:, :2], offsets, out=bodies.nebula_pos[:, :2])
 
 
 def generate_temples():
@@ -217,7 +404,7 @@ def generate_temples():
     # Generate 12 minor temples in a sacred dodecagon pattern
     for i in range(MINOR_TEMPLE_COUNT):
         # Position temples in golden spiral pattern with zodiac spacing
-        angle = i * (2 * np.pi / 12) + (np.pi / 6)  # 30-degree offset for zodiac alignment
+        angle = i * TEMPLE_ANGLE_STEP + ZODIAC_OFFSET
         radius = FIB_SEQ[min(i + 3, len(FIB_SEQ) - 1)] * SCALE_FACTOR * PHI
 
         pos = np.zeros(N_DIMENSIONS)
@@ -21,6 +21,7 @@ PHI = (1 + np.sqrt(5)) / 2  # Golden ratio constant
 
 # Audio settings
 SAMPLE_RATE = 44100  # Audio sample rate
+AUDIO_BLOCKSIZE = 512  # Frames per audio callback (~11.6 ms); larger blocks mean fewer Python callbacks per second but more latency
 SCHUMANN_FREQ = 7.83  # Schumann resonance frequency
 SCHUMANN_VOLUME = 0.01  # -40 dB equivalent
 
@@ -12,7 +12,9 @@ from cytolk import tolk
 
 from constants import *
 from audio_system import AudioSystem, SoundEffect
-from celestial import generate_all_celestial_bodies, generate_complete_universe, update_celestial_positions
+from celestial import (
+    generate_all_celestial_bodies, generate_complete_universe, update_celestial_positions, CelestialArrays
+)
 from ship import Ship
 from utils import project_to_2d
 
@@ -38,6 +40,7 @@ audio_system = AudioSystem(config)
 
 # Generate complete Atlantean universe
 stars, planets, nebulae, celestial_bodies, temples, ley_lines, pyramids = generate_complete_universe()
+celestial_arrays = CelestialArrays(stars, planets, nebulae)  # Dense motion state for the per-frame update
 
 # Initialize ship
 ship = Ship(config, audio_system)
@@ -68,7 +71,7 @@ CAMERA_PITCH_MAX = 90.0  # Maximum pitch (top-down view)
 
 def update_loop():
     """Main game update loop."""
-    global next_click_time, stars, planets, nebulae, celestial_bodies, temples, ley_lines, pyramids
+    global next_click_time, stars, planets, nebulae, celestial_bodies, celestial_arrays, temples, ley_lines, pyramids
     global fullscreen, screen, zoom_level, camera_orbit_angle, camera_pitch
 
     dt = clock.tick(FPS) / 1000.0
@@ -153,7 +156,7 @@ def update_loop():
     ship.update(dt, celestial_bodies, keys, temples, ley_lines, pyramids)
 
     # Update celestial body positions (orbital mechanics)
-    update_celestial_positions(stars, planets, nebulae, ship.simulation_time)
+    update_celestial_positions(celestial_arrays, ship.simulation_time)
 
     # Check if universe needs regeneration (after ascension or game load)
     if ship.needs_universe_regeneration:
@@ -173,6 +176,7 @@ def update_loop():
             ship.stars = stars
             ship.planets = planets
             ship.nebulae = nebulae
+        celestial_arrays = CelestialArrays(stars, planets, nebulae)
         ship.needs_universe_regeneration = False
 
     # Add periodic click sound based on resonance (only when not landed)
@@ -181,7 +185,7 @@ def update_loop():
         click_interval = max(0.1, 1.0 - avg_resonance)
         current_time = pygame.time.get_ticks() / 1000.0
         if current_time > next_click_time:
-            audio_system.active_sound_effects.append(
+            audio_system.play_sound_effect(
                 SoundEffect(audio_system.click_waveform, pan=0.0, volume=audio_system.effect_volume)
             )
             next_click_time = current_time + click_interval
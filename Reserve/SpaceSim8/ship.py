@@ -18,7 +18,6 @@ from cytolk import tolk
 from constants import *
 from audio_system import SoundEffect
 from utils import project_to_2d
-from celestial import generate_celestial
 
 class Ship:
     def __init__(self, config, audio_system):
@@ -405,13 +404,12 @@ class Ship:
 
         # Play biome sound
         if self.biome_sound:
-            if self.biome_sound in self.audio_system.active_sound_effects:
-                self.audio_system.active_sound_effects.remove(self.biome_sound)
+            self.audio_system.stop_sound_effect(self.biome_sound)
         if self.planet_biome == 'harmonic':
             self.biome_sound = SoundEffect(self.audio_system.chord_waveform, loop=True, volume=self.audio_system.effect_volume * 0.5)
         else:
             self.biome_sound = SoundEffect(self.audio_system.dissonant_waveform, loop=True, volume=self.audio_system.effect_volume * 0.5)
-        self.audio_system.active_sound_effects.append(self.biome_sound)
+        self.audio_system.play_sound_effect(self.biome_sound)
 
     # New: Continuous pitch detection in thread
     def continuous_pitch_detection(self):
@@ -637,8 +635,7 @@ class Ship:
                     self.landed_planet = None
                     self.landed_planet_body = None
                     if self.biome_sound:
-                        if self.biome_sound  in self.audio_system.active_sound_effects:
-                            self.audio_system.active_sound_effects.remove(self.biome_sound)
+                        self.audio_system.stop_sound_effect(self.biome_sound)
                         self.biome_sound = None
                     self.speak("Ascending from planet. Light vehicle disengaged.")
                 # Read full status
@@ -841,10 +838,10 @@ class Ship:
                     rate = max(1.0, min(TUNING_RATE_PLANET, rate))
                     if delta < APPROACHING_LOCK_THRESHOLD:
                         if not self.approaching_lock_announced:
-                            self.audio_system.active_sound_effects.append(SoundEffect(self.audio_system.approaching_beep_waveform, pan=0.0, volume=self.audio_system.beep_volume))
+                            self.audio_system.play_sound_effect(SoundEffect(self.audio_system.approaching_beep_waveform, pan=0.0, volume=self.audio_system.beep_volume))
                             self.approaching_lock_announced = True
                         if self.simulation_time - self.last_approaching_beep_time > 1.0:  # Play mid beeps every second while approaching
-                            self.audio_system.active_sound_effects.append(SoundEffect(self.audio_system.approaching_beep_waveform, pan=0.0, volume=self.audio_system.beep_volume))
+                            self.audio_system.play_sound_effect(SoundEffect(self.audio_system.approaching_beep_waveform, pan=0.0, volume=self.audio_system.beep_volume))
                             self.last_approaching_beep_time = self.simulation_time
                     elif delta > 15.0:
                         self.approaching_lock_announced = False
@@ -884,7 +881,7 @@ class Ship:
         # Play rotation sound repeatedly while rotating
         if (self.rotating_left or self.rotating_right) and self.simulation_time - self.last_rotation_sound_time > ROTATION_SOUND_DURATION:
             pan = -1.0 if self.rotating_left else 1.0
-            self.audio_system.active_sound_effects.append(SoundEffect(self.audio_system.rotation_waveform, pan=pan, volume=self.audio_system.effect_volume))
+            self.audio_system.play_sound_effect(SoundEffect(self.audio_system.rotation_waveform, pan=pan, volume=self.audio_system.effect_volume))
             self.last_rotation_sound_time = self.simulation_time
 
         # Manual navigation in manual mode
@@ -1030,8 +1027,7 @@ class Ship:
             self.locked_is_rift = False
             self.approached_rift_announced = False
             if self.lock_sound:
-                if self.lock_sound  in self.audio_system.active_sound_effects:
-                    self.audio_system.active_sound_effects.remove(self.lock_sound)
+                self.audio_system.stop_sound_effect(self.lock_sound)
                 self.lock_sound = None
             self.speak("Target unlocked.")
             return
@@ -1042,7 +1038,7 @@ class Ship:
         self.locked_rift = selected['rift'] if self.locked_is_rift else None
         waveform = self.audio_system.rift_beep_waveform if self.locked_is_rift else self.audio_system.beep_waveform
         self.lock_sound = SoundEffect(waveform, loop=True, volume=self.audio_system.beep_volume)
-        self.audio_system.active_sound_effects.append(self.lock_sound)
+        self.audio_system.play_sound_effect(self.lock_sound)
         self.approached_rift_announced = False
         self.speak(f"Locked on to {selected['label'].split(' at')[0]}.")
 
@@ -1083,8 +1079,7 @@ class Ship:
             self.locked_is_rift = False
             self.approached_rift_announced = False
             if self.lock_sound:
-                if self.lock_sound  in self.audio_system.active_sound_effects:
-                    self.audio_system.active_sound_effects.remove(self.lock_sound)
+                self.audio_system.stop_sound_effect(self.lock_sound)
                 self.lock_sound = None
             self.speak("Rift unlocked.")
             return
@@ -1094,7 +1089,7 @@ class Ship:
         self.locked_target = self.locked_rift['pos']
         self.locked_is_rift = True
         self.lock_sound = SoundEffect(self.audio_system.rift_beep_waveform, loop=True, volume=self.audio_system.beep_volume)
-        self.audio_system.active_sound_effects.append(self.lock_sound)
+        self.audio_system.play_sound_effect(self.lock_sound)
         self.approached_rift_announced = False
         self.speak(f"Locked on to {selected['label'].split(' at')[0]} for beeping and navigation.")
 
@@ -1129,7 +1124,7 @@ class Ship:
         if np.mean(temp_res) > AUTO_SNAP_THRESHOLD:
             for i in range(N_DIMENSIONS):
                 self.r_drive[i] = crystal_freqs[i]
-            self.audio_system.active_sound_effects.append(SoundEffect(self.audio_system.lock_beep_waveform, pan=0.0, volume=self.audio_system.beep_volume))
+            self.audio_system.play_sound_effect(SoundEffect(self.audio_system.lock_beep_waveform, pan=0.0, volume=self.audio_system.beep_volume))
         freq = crystal_freqs[self.selected_dim]
         dx, dy = self.crystal_positions[nearest] - self.cursor_pos
         direction = ""
@@ -1144,7 +1139,7 @@ class Ship:
         self.speak(f"Nearest crystal {dists[nearest]:.1f} units {direction}. Target freq in dim {self.selected_dim+1}: {freq:.2f} Hz.{crystal_type_msg}")
         angle = np.arctan2(dy, dx)
         pan = np.cos(angle)
-        self.audio_system.active_sound_effects.append(SoundEffect(self.audio_system.beep_waveform, pan=pan, volume=self.audio_system.beep_volume))
+        self.audio_system.play_sound_effect(SoundEffect(self.audio_system.beep_waveform, pan=pan, volume=self.audio_system.beep_volume))
 
     # Collect crystal on planet
     def collect_crystal(self):
@@ -1197,7 +1192,7 @@ class Ship:
                 self.speak(f"Atlantean {crystal_type.capitalize()} crystal collected. {crystal_info['chakra'].capitalize()} chakra resonance. Harmony increases.")
 
             self.crystals_collected += crystal_value
-            self.audio_system.active_sound_effects.append(SoundEffect(self.audio_system.lock_beep_waveform, pan=0.0, volume=self.audio_system.beep_volume))
+            self.audio_system.play_sound_effect(SoundEffect(self.audio_system.lock_beep_waveform, pan=0.0, volume=self.audio_system.beep_volume))
 
             if random.random() < 0.2:
                 self.speak("Ancient echo: The spiral binds all realms in golden eternity.")
@@ -1631,7 +1626,7 @@ class Ship:
                 'tritone': self.audio_system.tritone_chime,
             }
             if name in chime_map:
-                self.audio_system.active_sound_effects.append(
+                self.audio_system.play_sound_effect(
                     SoundEffect(chime_map[name], pan=0.0, volume=self.audio_system.effect_volume)
                 )
 
@@ -1722,16 +1717,14 @@ class Ship:
         elif rift['type'] == 'perfect_fifth':
             self.crystal_bonus += 1
             self.speak("Perfect fifth rift grants eternal crystal bounty.")
-        if rift['sound']  in self.audio_system.active_sound_effects:
-            self.audio_system.active_sound_effects.remove(rift['sound'])
+        self.audio_system.stop_sound_effect(rift['sound'])
         self.rifts = [r for r in self.rifts if r is not rift]
         self.locked_rift = None
         self.locked_target = None
         self.locked_is_rift = False
         self.approached_rift_announced = False
         if self.lock_sound:
-            if self.lock_sound  in self.audio_system.active_sound_effects:
-                self.audio_system.active_sound_effects.remove(self.lock_sound)
+            self.audio_system.stop_sound_effect(self.lock_sound)
             self.lock_sound = None
 
     # New: Save game
@@ -1782,7 +1775,7 @@ class Ship:
             for rift in self.rifts:
                 hum_waveform = self.audio_system.rift_hum_waveform.copy()
                 sound = SoundEffect(hum_waveform, loop=True, volume=0.0)
-                self.audio_system.active_sound_effects.append(sound)
+                self.audio_system.play_sound_effect(sound)
                 rift['sound'] = sound
             # Signal main.py to reload celestial bodies from ship
             self.needs_universe_regeneration = True
@@ -1815,8 +1808,16 @@ class Ship:
             for i in range(N_DIMENSIONS):
                 self.r_drive[i] += (self.f_target[i] - self.r_drive[i]) * 0.01
             # Play evolving chord
-            if not any(np.array_equal(e.waveform, self.audio_system.chord_waveform) for e  in self.audio_system.active_sound_effects):
-                self.audio_system.active_sound_effects.append(SoundEffect(self.audio_system.chord_waveform, loop=True, volume=self.audio_system.effect_volume * 0.3))
+            if self.audio_system.get_tagged_sound_effect('idle_chord') is None:
+                self.audio_system.play_sound_effect(SoundEffect(self.audio_system.chord_waveform, loop=True, volume=self.audio_system.effect_volume * 0.3), tag='idle_chord')
+
+        # Power chord while any dimension is near full power in flight (started and stopped here,
+        # so only the game thread touches the tagged effects)
+        if not self.landed_mode and np.any(self.resonance_power > POWER_BUILD_TIME - 1):
+            if self.audio_system.get_tagged_sound_effect('power_chord') is None:
+                self.audio_system.play_sound_effect(SoundEffect(self.audio_system.chord_waveform, pan=0.0, volume=self.audio_system.effect_volume), tag='power_chord')
+        else:
+            self.audio_system.stop_tagged_sound_effect('power_chord')
 
         # Handle landed mode: Zero velocity, shift targets based on biome
         if self.landed_mode:
@@ -1862,8 +1863,7 @@ class Ship:
                     self.locked_target = None
                     self.locked_is_rift = False
                     if self.lock_sound:
-                        if self.lock_sound  in self.audio_system.active_sound_effects:
-                            self.audio_system.active_sound_effects.remove(self.lock_sound)
+                        self.audio_system.stop_sound_effect(self.lock_sound)
                         self.lock_sound = None
                     self.speak("Target reached.")
             else:
@@ -1890,11 +1890,10 @@ class Ship:
                 # Update lock sound based on alignment
                 projected_pos = project_to_2d(dir_vec, self.view_rotation)
                 angle = np.arctan2(projected_pos[1] - SCREEN_HEIGHT/2, projected_pos[0] - SCREEN_WIDTH/2)
-                self.lock_sound.pan = np.sin(angle)
                 misalignment = abs(angle)
                 self.lock_sound.pitch = 1.0 + misalignment / 180.0
                 self.lock_sound.waveform = (self.audio_system.beep_waveform if not self.locked_is_rift else self.audio_system.rift_beep_waveform) * self.lock_sound.pitch
-                self.lock_sound.volume = self.audio_system.beep_volume
+                self.lock_sound.set_pan_volume(np.sin(angle), self.audio_system.beep_volume)
 
         # Auto-rotate view to center locked target horizontally (for all locked targets)
         if self.locked_target is not None:
@@ -1925,7 +1924,7 @@ class Ship:
                 effective_width *= TUAOI_MODES['transcendence']['rate']  # 1.4x easier tuning
             self.resonance_levels[i] = 1 / (1 + (delta_f / effective_width)**2)
             if self.resonance_levels[i] > PERFECT_RESONANCE_THRESHOLD and self.prev_resonance_levels[i] <= PERFECT_RESONANCE_THRESHOLD:
-                self.audio_system.active_sound_effects.append(SoundEffect(self.audio_system.ping_waveform, pan=0.0, volume=self.audio_system.effect_volume))
+                self.audio_system.play_sound_effect(SoundEffect(self.audio_system.ping_waveform, pan=0.0, volume=self.audio_system.effect_volume))
             if self.resonance_levels[i] > POWER_BUILD_THRESHOLD:
                 self.resonance_power[i] += dt
             else:
@@ -2071,7 +2070,7 @@ class Ship:
             rift_type = random.choice(['boost', 'crystal', 'hazard'])
             hum_waveform = self.audio_system.rift_hum_waveform.copy()
             sound = SoundEffect(hum_waveform, loop=True, volume=0.0)
-            self.audio_system.active_sound_effects.append(sound)
+            self.audio_system.play_sound_effect(sound)
             self.rifts.append({'pos': rift_pos, 'timer': RIFT_FADE_TIME, 'type': rift_type, 'sound': sound, 'self.last_beep_time': self.simulation_time})
             projected_pos = project_to_2d(rift_pos - self.position, self.view_rotation)
             angle = np.arctan2(projected_pos[1] - SCREEN_HEIGHT/2, projected_pos[0] - SCREEN_WIDTH/2) * 180 / np.pi
@@ -2085,7 +2084,7 @@ class Ship:
             rift_type = 'perfect_fifth'
             hum_waveform = self.audio_system.rift_hum_waveform.copy()
             sound = SoundEffect(hum_waveform, loop=True, volume=0.0)
-            self.audio_system.active_sound_effects.append(sound)
+            self.audio_system.play_sound_effect(sound)
             self.rifts.append({'pos': rift_pos, 'timer': RIFT_FADE_TIME, 'type': rift_type, 'sound': sound, 'self.last_beep_time': self.simulation_time})
             projected_pos = project_to_2d(rift_pos - self.position, self.view_rotation)
             angle = np.arctan2(projected_pos[1] - SCREEN_HEIGHT/2, projected_pos[0] - SCREEN_WIDTH/2) * 180 / np.pi
@@ -2102,29 +2101,29 @@ class Ship:
                     self.locked_target = None
                     self.locked_is_rift = False
                     if self.lock_sound:
-                        if self.lock_sound  in self.audio_system.active_sound_effects:
-                            self.audio_system.active_sound_effects.remove(self.lock_sound)
+                        self.audio_system.stop_sound_effect(self.lock_sound)
                         self.lock_sound = None
                     self.speak("Locked rift faded into the void.")
                 else:
                     self.speak("Rift faded into the void.")
-                if rift['sound']  in self.audio_system.active_sound_effects:
-                    self.audio_system.active_sound_effects.remove(rift['sound'])
+                self.audio_system.stop_sound_effect(rift['sound'])
                 to_remove.append(i)
                 continue
             if avg_res > 0.9:
                 rift['timer'] += dt * PHI
             projected_pos = project_to_2d(rift['pos'] - self.position, self.view_rotation)
             angle = np.arctan2(projected_pos[1] - SCREEN_HEIGHT/2, projected_pos[0] - SCREEN_WIDTH/2) * 180 / np.pi
-            rift['sound'].pan = np.sin(angle * np.pi / 180)
             dist = np.linalg.norm(self.position - rift['pos'])
-            rift['sound'].volume = max(0, self.audio_system.effect_volume * (1 - dist / RIFT_MAX_DIST)) * avg_res
+            rift['sound'].set_pan_volume(
+                np.sin(angle * np.pi / 180),
+                max(0, self.audio_system.effect_volume * (1 - dist / RIFT_MAX_DIST)) * avg_res
+            )
             if rift is self.locked_rift:
                 pan = np.sin(angle * np.pi / 180)
                 centered_factor = 1 - abs(pan)  # High when aligned horizontally (|pan| ≈ 0)
                 interval = 2.0 - 1.8 * centered_factor  # Faster beeps when aligned
                 if self.simulation_time - rift['self.last_beep_time'] > interval:
-                    self.audio_system.active_sound_effects.append(SoundEffect(self.audio_system.rift_beep_waveform, pan=pan, volume=self.audio_system.beep_volume))
+                    self.audio_system.play_sound_effect(SoundEffect(self.audio_system.rift_beep_waveform, pan=pan, volume=self.audio_system.beep_volume))
                     rift['self.last_beep_time'] = self.simulation_time
             if dist < RIFT_ALIGNMENT_TOLERANCE:
                 if avg_res <= RIFT_ENTRY_RES_THRESHOLD:
@@ -2219,7 +2218,7 @@ class Ship:
 
             # Play periodic beep for navigation
             if self.near_object and self.simulation_time - self.last_beep_time > 1.0:
-                self.audio_system.active_sound_effects.append(SoundEffect(self.audio_system.beep_waveform, pan=pan, volume=self.audio_system.beep_volume))
+                self.audio_system.play_sound_effect(SoundEffect(self.audio_system.beep_waveform, pan=pan, volume=self.audio_system.beep_volume))
                 self.last_beep_time = self.simulation_time
 
             # Play type-specific ambient sounds based on proximity
@@ -2241,17 +2240,16 @@ class Ship:
                     # Stop old star sound if different type
                     if self.star_sound and self.star_sound in self.audio_system.active_sound_effects:
                         if self.star_sound.waveform is not waveform:
-                            self.audio_system.active_sound_effects.remove(self.star_sound)
+                            self.audio_system.stop_sound_effect(self.star_sound)
                             self.star_sound = None
 
                     # Start new star sound if not playing
                     if self.star_sound is None:
                         self.star_sound = SoundEffect(waveform, loop=True, pan=pan, volume=volume)
-                        self.audio_system.active_sound_effects.append(self.star_sound)
+                        self.audio_system.play_sound_effect(self.star_sound)
                     else:
                         # Update existing sound
-                        self.star_sound.pan = pan
-                        self.star_sound.volume = volume
+                        self.star_sound.set_pan_volume(pan, volume)
 
             elif body_type == 'nebula' and dist < NEBULA_DISSONANCE_RADIUS:
                 # Nebula ambient sound
@@ -2271,17 +2269,16 @@ class Ship:
                     # Stop old nebula sound if different type
                     if self.nebula_sound and self.nebula_sound in self.audio_system.active_sound_effects:
                         if self.nebula_sound.waveform is not waveform:
-                            self.audio_system.active_sound_effects.remove(self.nebula_sound)
+                            self.audio_system.stop_sound_effect(self.nebula_sound)
                             self.nebula_sound = None
 
                     # Start new nebula sound if not playing
                     if self.nebula_sound is None:
                         self.nebula_sound = SoundEffect(waveform, loop=True, pan=pan, volume=volume)
-                        self.audio_system.active_sound_effects.append(self.nebula_sound)
+                        self.audio_system.play_sound_effect(self.nebula_sound)
                     else:
                         # Update existing sound
-                        self.nebula_sound.pan = pan
-                        self.nebula_sound.volume = volume
+                        self.nebula_sound.set_pan_volume(pan, volume)
 
             elif body_type == 'planet' and dist < INTERACTION_DISTANCE:
                 # Planet ambient sound
@@ -2302,28 +2299,27 @@ class Ship:
                     # Stop old planet sound if different type
                     if self.planet_sound and self.planet_sound in self.audio_system.active_sound_effects:
                         if self.planet_sound.waveform is not waveform:
-                            self.audio_system.active_sound_effects.remove(self.planet_sound)
+                            self.audio_system.stop_sound_effect(self.planet_sound)
                             self.planet_sound = None
 
                     # Start new planet sound if not playing
                     if self.planet_sound is None:
                         self.planet_sound = SoundEffect(waveform, loop=True, pan=pan, volume=volume)
-                        self.audio_system.active_sound_effects.append(self.planet_sound)
+                        self.audio_system.play_sound_effect(self.planet_sound)
                     else:
                         # Update existing sound
-                        self.planet_sound.pan = pan
-                        self.planet_sound.volume = volume
+                        self.planet_sound.set_pan_volume(pan, volume)
 
         # Stop ambient sounds when leaving vicinity or if disabled
         if (not self.near_object or self.nearest_body is None) or not self.ambient_sounds_enabled:
             if self.star_sound and self.star_sound in self.audio_system.active_sound_effects:
-                self.audio_system.active_sound_effects.remove(self.star_sound)
+                self.audio_system.stop_sound_effect(self.star_sound)
                 self.star_sound = None
             if self.nebula_sound and self.nebula_sound in self.audio_system.active_sound_effects:
-                self.audio_system.active_sound_effects.remove(self.nebula_sound)
+                self.audio_system.stop_sound_effect(self.nebula_sound)
                 self.nebula_sound = None
             if self.planet_sound and self.planet_sound in self.audio_system.active_sound_effects:
-                self.audio_system.active_sound_effects.remove(self.planet_sound)
+                self.audio_system.stop_sound_effect(self.planet_sound)
                 self.planet_sound = None
 
         # Apply nebula dissonance effects (if enabled)
@@ -2407,7 +2403,7 @@ class Ship:
             # Fade to heartbeat pulse
             heartbeat_freq = self.last_detected_rhythm / 60.0  # BPM to Hz
             # Adjust drive signals to pulse (this would require modifying audio_callback logic, but for simplicity, add a pulse sound
-            if not any(e.loop and e.volume == HEARTBEAT_VOLUME for e  in self.audio_system.active_sound_effects):
+            if self.audio_system.get_tagged_sound_effect('heartbeat') is None:
                 heartbeat_wave = np.sin(2 * np.pi * heartbeat_freq * np.linspace(0, 1 / heartbeat_freq, int(SAMPLE_RATE / heartbeat_freq)))
-                self.audio_system.active_sound_effects.append(SoundEffect(heartbeat_wave, loop=True, volume=HEARTBEAT_VOLUME))
+                self.audio_system.play_sound_effect(SoundEffect(heartbeat_wave, loop=True, volume=HEARTBEAT_VOLUME), tag='heartbeat')
 